@@ -0,0 +1,210 @@
+"""Asset staging for generated documents.
+
+Fonts, bibliography/CSL files and user images are placed next to the QMD on
+every generation. AssetStager does it without rewriting unchanged files:
+
+- Skip: the destination already has the same size and mtime, or the same
+  content hash
+- Reflink: copy-on-write clone where the filesystem supports it (Linux FICLONE)
+- Copy: shutil.copy2 fallback
+
+Files are never hardlinked into the output tree: editing a staged file in
+place would also change its source (a user file or the installed package
+default). A destination that is a hardlink to its source, left by earlier
+versions, is replaced with an independent file.
+
+Destinations are replaced atomically. Bytes that did not have to be copied
+are reported by stats(). Select the strategy with EPY_DOCS_ASSET_LINK:
+'auto' or 'reflink' (reflink, then copy; default 'auto') or 'copy'.
+"""
+
+import hashlib
+import os
+import shutil
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+
+STAGE_MODES = ('auto', 'reflink', 'copy')
+HASH_CHUNK_SIZE = 1024 * 1024
+
+_FICLONE = 0x40049409  # Linux ioctl: clone a whole file (btrfs, XFS, ...)
+
+
+def _file_digest(path: Path) -> str:
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class AssetStager:
+    """
+    SOLID: Single Responsibility - Place asset files in output directories.
+
+    stage() returns the action taken: 'skipped', 'reflinked' or
+    'copied'. Counters are process-wide and thread-safe.
+    """
+
+    def __init__(self, mode: Optional[str] = None):
+        """Initialize stager.
+
+        Args:
+            mode: 'auto', 'reflink' or 'copy' (None = EPY_DOCS_ASSET_LINK, default 'auto')
+
+        Raises:
+            ValueError: If mode is unknown
+        """
+        self._lock = threading.Lock()
+        self.mode = self._validate_mode(mode or os.environ.get('EPY_DOCS_ASSET_LINK', 'auto'))
+        self.reset_stats()
+
+    @staticmethod
+    def _validate_mode(mode: str) -> str:
+        mode = mode.lower()
+        if mode not in STAGE_MODES:
+            raise ValueError(f"Unknown asset staging mode '{mode}'. Use one of: {', '.join(STAGE_MODES)}")
+        return mode
+
+    def configure(self, mode: str) -> None:
+        """Change the staging strategy."""
+        self.mode = self._validate_mode(mode)
+
+    # ------------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------------
+
+    def stage(self, source: Union[str, Path], dest: Union[str, Path]) -> str:
+        """Make dest an up-to-date copy of source.
+
+        Args:
+            source: Existing source file
+            dest: Destination file path (parent directory must exist)
+
+        Returns:
+            Action taken: 'skipped', 'reflinked' or 'copied'
+
+        Raises:
+            OSError: If the source cannot be read or the destination written
+        """
+        source = Path(source)
+        dest = Path(dest)
+        source_stat = source.stat()
+
+        if self._is_current(source, dest, source_stat):
+            action = 'skipped'
+        else:
+            action = self._place(source, dest)
+
+        with self._lock:
+            self._stats[action] += 1
+            if action == 'copied':
+                self._stats['bytes_copied'] += source_stat.st_size
+            else:
+                self._stats['bytes_avoided'] += source_stat.st_size
+        return action
+
+    def stats(self) -> Dict[str, int]:
+        """Counters: files per action, bytes_copied and bytes_avoided."""
+        with self._lock:
+            return dict(self._stats)
+
+    def reset_stats(self) -> None:
+        """Reset all counters."""
+        with self._lock:
+            self._stats = {'skipped': 0, 'reflinked': 0, 'copied': 0,
+                           'bytes_copied': 0, 'bytes_avoided': 0}
+
+    # ------------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def _is_current(source: Path, dest: Path, source_stat: os.stat_result) -> bool:
+        """Whether dest already holds the source contents as a separate file."""
+        try:
+            dest_stat = dest.stat()
+        except OSError:
+            return False
+
+        if os.path.samestat(source_stat, dest_stat):
+            return False  # Hardlink to the source: replace with a copy
+        if source_stat.st_size != dest_stat.st_size:
+            return False
+        if source_stat.st_mtime_ns == dest_stat.st_mtime_ns:
+            return True
+        try:
+            if _file_digest(source) != _file_digest(dest):
+                return False
+        except OSError:
+            return False
+
+        # Same contents: align mtimes so the next check skips hashing
+        try:
+            os.utime(dest, ns=(dest_stat.st_atime_ns, source_stat.st_mtime_ns))
+        except OSError:
+            pass
+        return True
+
+    def _place(self, source: Path, dest: Path) -> str:
+        """Write dest through a temporary file, cheapest strategy first."""
+        tmp_path = dest.with_name(f".{dest.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            if self._try_reflink(source, tmp_path):
+                action = 'reflinked'
+            else:
+                shutil.copy2(source, tmp_path)
+                action = 'copied'
+            os.replace(tmp_path, dest)
+        except BaseException:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            raise
+        return action
+
+    def _try_reflink(self, source: Path, tmp_path: Path) -> bool:
+        """Clone source into tmp_path (copy-on-write); False if unsupported or disabled."""
+        return self.mode != 'copy' and try_reflink(source, tmp_path)
+
+
+def try_reflink(source: Path, target: Path) -> bool:
+    """Clone source into a new file at target (copy-on-write), keeping its metadata.
+
+    Returns:
+        False (leaving no target behind) where the platform or filesystem
+        does not support reflinks
+    """
+    if not sys.platform.startswith('linux'):
+        return False
+
+    import fcntl
+    try:
+        with open(source, 'rb') as src, open(target, 'wb') as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    except OSError:
+        try:
+            os.unlink(target)
+        except OSError:
+            pass
+        return False
+    shutil.copystat(source, target)
+    return True
+
+
+_asset_stager = AssetStager()
+
+
+def get_asset_stager() -> AssetStager:
+    """Return the process-wide asset stager."""
+    return _asset_stager
+
+
+def stage_asset(source: Union[str, Path], dest: Union[str, Path]) -> str:
+    """Stage one asset with the process-wide stager (see AssetStager.stage)."""
+    return _asset_stager.stage(source, dest)
@@ -0,0 +1,284 @@
+"""Content buffer backends for DocumentWriter.
+
+The writer appends Markdown chunks to a content buffer and only ever edits the
+most recent chunk (citations, table labels). Backends:
+
+- MemoryContentBuffer: Plain in-memory list of chunks
+- SpillingContentBuffer: In memory until a size threshold is crossed, then
+  older chunks are moved to a temporary file
+
+Buffers are consumed by iterating their chunks (or write_to()), so generation
+can stream a document to disk without joining it into one string.
+"""
+
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from typing import Iterable, Iterator, List, Optional, TextIO
+
+
+DEFAULT_SPILL_THRESHOLD = 64 * 1024 * 1024  # characters
+SPILL_READ_SIZE = 1024 * 1024  # characters per chunk when reading back a spill file
+
+
+# ============================================================================
+# BUFFER INTERFACE
+# ============================================================================
+
+class ContentBuffer(ABC):
+    """Append-only sequence of Markdown chunks with an editable last chunk.
+
+    Supports the list operations the writer relies on: append/extend, clear,
+    len(), truthiness, iteration and reading/replacing buffer[-1].
+    Iteration yields strings whose concatenation is the document body.
+    """
+
+    @abstractmethod
+    def append(self, chunk: str) -> None:
+        """Add a chunk at the end of the buffer."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all content."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of chunks appended since the last clear()."""
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the buffered text in order."""
+
+    @abstractmethod
+    def __getitem__(self, index: int) -> str:
+        """Return a chunk (spilling backends only keep recent chunks readable)."""
+
+    @abstractmethod
+    def __setitem__(self, index: int, chunk: str) -> None:
+        """Replace a chunk (spilling backends only keep recent chunks writable)."""
+
+    @property
+    @abstractmethod
+    def size(self) -> int:
+        """Total number of characters buffered."""
+
+    def extend(self, chunks: Iterable[str]) -> None:
+        """Append several chunks."""
+        for chunk in chunks:
+            self.append(chunk)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def is_blank(self) -> bool:
+        """True if the buffer holds no non-whitespace text."""
+        return all(not chunk.strip() for chunk in self)
+
+    def write_to(self, stream: TextIO) -> int:
+        """Write the buffered text to a text stream.
+
+        Returns:
+            Number of characters written
+        """
+        written = 0
+        for chunk in self:
+            stream.write(chunk)
+            written += len(chunk)
+        return written
+
+    def getvalue(self) -> str:
+        """Return the whole body as one string (materializes the document)."""
+        return ''.join(self)
+
+
+# ============================================================================
+# BACKENDS
+# ============================================================================
+
+class MemoryContentBuffer(ContentBuffer):
+    """List-backed buffer; every chunk stays in memory."""
+
+    def __init__(self):
+        self._chunks: List[str] = []
+        self._size = 0
+
+    def append(self, chunk: str) -> None:
+        self._chunks.append(chunk)
+        self._size += len(chunk)
+
+    def clear(self) -> None:
+        self._chunks.clear()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._chunks)
+
+    def __getitem__(self, index: int) -> str:
+        return self._chunks[index]
+
+    def __setitem__(self, index: int, chunk: str) -> None:
+        self._size += len(chunk) - len(self._chunks[index])
+        self._chunks[index] = chunk
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+
+class SpillingContentBuffer(ContentBuffer):
+    """Buffer that moves older chunks to a temporary file past a size threshold.
+
+    Until spill_threshold characters are buffered it behaves exactly like
+    MemoryContentBuffer. Once crossed, every chunk except the most recent
+    one is written to an anonymous temporary file (deleted automatically),
+    and so is every later chunk once a newer one arrives. Only buffer[-1]
+    stays editable after spilling.
+    """
+
+    def __init__(self, spill_threshold: int = DEFAULT_SPILL_THRESHOLD,
+                 spill_dir: Optional[str] = None):
+        """Initialize buffer.
+
+        Args:
+            spill_threshold: Characters kept in memory before spilling (>= 0)
+            spill_dir: Directory for the temporary file (None = system temp dir)
+        """
+        if spill_threshold < 0:
+            raise ValueError(f"spill_threshold must be >= 0, got {spill_threshold}")
+        self.spill_threshold = spill_threshold
+        self.spill_dir = spill_dir
+        self._chunks: List[str] = []
+        self._memory_size = 0
+        self._spill_file: Optional[TextIO] = None
+        self._spilled_size = 0
+        self._spilled_count = 0
+
+    @property
+    def spilled(self) -> bool:
+        """Whether part of the content lives in the temporary file."""
+        return self._spill_file is not None
+
+    def _spill(self) -> None:
+        """Move all chunks but the last one to the spill file."""
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile(
+                mode='w+', encoding='utf-8', newline='',
+                prefix='epy_docs_buffer_', dir=self.spill_dir
+            )
+        else:
+            self._spill_file.seek(0, os.SEEK_END)
+
+        moved = self._chunks[:-1]
+        for chunk in moved:
+            self._spill_file.write(chunk)
+            self._spilled_size += len(chunk)
+            self._memory_size -= len(chunk)
+        self._spilled_count += len(moved)
+        del self._chunks[:-1]
+
+    def append(self, chunk: str) -> None:
+        self._chunks.append(chunk)
+        self._memory_size += len(chunk)
+        if self._memory_size > self.spill_threshold and len(self._chunks) > 1:
+            self._spill()
+
+    def clear(self) -> None:
+        self._chunks.clear()
+        self._memory_size = 0
+        self.close()
+
+    def close(self) -> None:
+        """Delete the spill file (content spilled to it is discarded)."""
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+        self._spilled_size = 0
+        self._spilled_count = 0
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def __len__(self) -> int:
+        return self._spilled_count + len(self._chunks)
+
+    def __iter__(self) -> Iterator[str]:
+        if self._spill_file is not None:
+            self._spill_file.flush()
+            self._spill_file.seek(0)
+            while True:
+                chunk = self._spill_file.read(SPILL_READ_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+            self._spill_file.seek(0, os.SEEK_END)
+        yield from list(self._chunks)
+
+    def _memory_index(self, index: int) -> int:
+        """Translate a buffer index to an index into the in-memory chunks."""
+        position = index if index >= 0 else len(self) + index
+        memory_position = position - self._spilled_count
+        if not 0 <= memory_position < len(self._chunks):
+            if 0 <= position < self._spilled_count:
+                raise IndexError("buffer chunk has been spilled to disk and is no longer addressable")
+            raise IndexError("buffer index out of range")
+        return memory_position
+
+    def __getitem__(self, index: int) -> str:
+        return self._chunks[self._memory_index(index)]
+
+    def __setitem__(self, index: int, chunk: str) -> None:
+        position = self._memory_index(index)
+        self._memory_size += len(chunk) - len(self._chunks[position])
+        self._chunks[position] = chunk
+
+    @property
+    def size(self) -> int:
+        return self._spilled_size + self._memory_size
+
+
+# ============================================================================
+# FACTORY
+# ============================================================================
+
+BUFFER_BACKENDS = ('memory', 'spill')
+
+
+def create_content_buffer(backend: Optional[str] = None,
+                          spill_threshold: Optional[int] = None,
+                          spill_dir: Optional[str] = None) -> ContentBuffer:
+    """Create a content buffer.
+
+    Args:
+        backend: 'memory' or 'spill' (None = EPY_DOCS_BUFFER env var, default 'spill')
+        spill_threshold: Characters kept in memory before spilling
+            (None = EPY_DOCS_SPILL_THRESHOLD env var, default 64 Mi characters)
+        spill_dir: Directory for spill files (None = system temp dir)
+
+    Returns:
+        ContentBuffer instance
+
+    Raises:
+        ValueError: If backend or threshold is invalid
+    """
+    if backend is None:
+        backend = os.environ.get('EPY_DOCS_BUFFER', 'spill')
+    backend = backend.lower()
+    if backend not in BUFFER_BACKENDS:
+        raise ValueError(f"Unknown content buffer backend '{backend}'. Use one of: {', '.join(BUFFER_BACKENDS)}")
+
+    if backend == 'memory':
+        return MemoryContentBuffer()
+
+    if spill_threshold is None:
+        env_threshold = os.environ.get('EPY_DOCS_SPILL_THRESHOLD')
+        try:
+            spill_threshold = int(env_threshold) if env_threshold else DEFAULT_SPILL_THRESHOLD
+        except ValueError:
+            raise ValueError(f"EPY_DOCS_SPILL_THRESHOLD must be an integer, got '{env_threshold}'")
+    return SpillingContentBuffer(spill_threshold, spill_dir)
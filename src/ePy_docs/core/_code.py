@@ -48,16 +48,17 @@ def _load_layout_code_config(layout_name: str = 'classic') -> Dict[str, Any]:
         Code configuration with chunk_types and layout-specific settings
     """
     try:
-        from ePy_docs.core._config import load_layout
+        from ePy_docs.core._config import compile_layout
+        from ePy_docs.core._layout import thaw
         
-        # Load layout configuration
-        layout = load_layout(layout_name, resolve_refs=True)
+        # Compiled layout configuration
+        code_spec = compile_layout(layout_name).code
         
         # Get chunk_types from layout
-        if 'chunk_types' not in layout:
+        if code_spec.chunk_types is None:
             raise ValueError(f"Missing 'chunk_types' in layout '{layout_name}'")
         
-        chunk_types = layout['chunk_types']
+        chunk_types = thaw(code_spec.chunk_types)
         
         # Build combined configuration
         config = {
@@ -66,10 +67,9 @@ def _load_layout_code_config(layout_name: str = 'classic') -> Dict[str, Any]:
         }
         
         # Get layout-specific code_chunks configuration
-        if 'code_chunks' in layout:
-            code_chunks = layout['code_chunks']
-            spacing = code_chunks.get('spacing', {'before': '\n\n', 'after': '\n\n'})
-            caption_format = code_chunks.get('caption_format', '{caption}')
+        if code_spec.code_chunks is not None:
+            spacing = thaw(code_spec.spacing)
+            caption_format = code_spec.caption_format
             
             # Build complete chunk configurations
             config['display_chunk'] = {
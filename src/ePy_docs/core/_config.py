@@ -5,12 +5,120 @@ Unified module for configuration loading, path resolution, and project configura
 This module consolidates all configuration-related functionality.
 """
 
+import hashlib
 import json
+import os
+import pickle
+import sys
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List
 
 # Import path utilities from extracted module
-from ._paths import get_caller_directory, get_absolute_output_directories
+from ._paths import get_caller_directory, get_absolute_output_directories, get_cache_directory
+
+
+class EpysonCache:
+    """Persistent cache of parsed .epyson files shared across processes.
+    
+    Each source file gets a pickle in the user cache directory holding the
+    parsed data together with the source's mtime and size, the package
+    version and the Python version. A changed file (or package upgrade)
+    no longer matches and is parsed again, so invalidation is automatic.
+    Disable with EPY_DOCS_CONFIG_CACHE=0.
+    """
+    
+    FORMAT_VERSION = 1
+    
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.enabled = os.environ.get('EPY_DOCS_CONFIG_CACHE', '1').lower() not in ('0', 'false', 'no', 'off')
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        self.hits = 0
+        self.misses = 0
+    
+    @property
+    def cache_dir(self) -> Path:
+        """Directory holding the cache files."""
+        if self._cache_dir is None:
+            self._cache_dir = get_cache_directory('config')
+        return self._cache_dir
+    
+    def configure(self, enabled: Optional[bool] = None, cache_dir: Optional[Path] = None) -> None:
+        """Enable/disable the cache or move it to another directory."""
+        if enabled is not None:
+            self.enabled = enabled
+        if cache_dir is not None:
+            self._cache_dir = Path(cache_dir)
+    
+    def _signature(self, stat: os.stat_result) -> tuple:
+        import ePy_docs
+        return (self.FORMAT_VERSION, getattr(ePy_docs, '__version__', ''),
+                sys.version_info[:2], stat.st_mtime_ns, stat.st_size)
+    
+    def _entry_path(self, file_path: Path) -> Path:
+        digest = hashlib.sha1(str(file_path).encode('utf-8')).hexdigest()[:20]
+        return self.cache_dir / f"{file_path.stem}-{digest}.pickle"
+    
+    def load(self, file_path: Path) -> Any:
+        """Return the parsed contents of a .epyson (JSON) file.
+        
+        Raises:
+            OSError: If the file cannot be read
+            json.JSONDecodeError: If the file is not valid JSON
+        """
+        file_path = Path(file_path).resolve()
+        stat = file_path.stat()
+        
+        if not self.enabled:
+            return self._parse(file_path)
+        
+        signature = self._signature(stat)
+        entry_path = self._entry_path(file_path)
+        try:
+            with open(entry_path, 'rb') as f:
+                cached_signature, data = pickle.load(f)
+            if cached_signature == signature:
+                self.hits += 1
+                return data
+        except Exception:
+            pass  # Missing, stale format or unreadable entry: parse again
+        
+        self.misses += 1
+        data = self._parse(file_path)
+        self._store(entry_path, signature, data)
+        return data
+    
+    @staticmethod
+    def _parse(file_path: Path) -> Any:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def _store(self, entry_path: Path, signature: tuple, data: Any) -> None:
+        """Write a cache entry atomically; failures only cost the speed-up."""
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((signature, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, entry_path)
+        except OSError:
+            pass
+    
+    def clear(self) -> None:
+        """Delete all cache entries."""
+        if self.cache_dir.exists():
+            for entry in self.cache_dir.glob('*.pickle'):
+                try:
+                    entry.unlink()
+                except OSError:
+                    pass
+
+
+_epyson_cache = EpysonCache()
+
+
+def get_epyson_cache() -> EpysonCache:
+    """Return the process-wide parsed .epyson cache."""
+    return _epyson_cache
 
 class ModularConfigLoader:
     """Enhanced loader for modular configuration architecture."""
@@ -35,31 +143,17 @@ class ModularConfigLoader:
             self._master_config = {}
         return self._master_config
     
-    def load_project(self) -> Dict[str, Any]:
+    def load_project(self, writer=None) -> Dict[str, Any]:
         """Load project-specific configuration.
         
-        Returns empty configuration as project files are no longer supported.
-        For runtime configuration, use DocumentWriter.set_* methods.
+        Project files are no longer supported; project information comes from
+        the DocumentWriter (set via its set_* methods).
+        
+        Args:
+            writer: DocumentWriter instance. If None, uses the active writer.
         """
-        # Check if there's a current DocumentWriter instance with project info
-        import inspect
-        
-        # Look for DocumentWriter instance in call stack
-        for frame_info in inspect.stack():
-            frame_locals = frame_info.frame.f_locals
-            for name, obj in frame_locals.items():
-                if hasattr(obj, '_project_info') and hasattr(obj, '_authors'):
-                    # Found a DocumentWriter instance
-                    config = {}
-                    if hasattr(obj, '_project_info') and obj._project_info:
-                        config['project'] = obj._project_info.copy()
-                    if hasattr(obj, '_authors') and obj._authors:
-                        config['authors'] = obj._authors
-                    if hasattr(obj, '_client_info') and obj._client_info:
-                        config['client'] = obj._client_info
-                    return config
-        
-        return {}
+        from ._context import get_writer_project_config
+        return get_writer_project_config(writer)
 
     
     def load_layout(self, layout_name: Optional[str] = None) -> Dict[str, Any]:
@@ -684,7 +778,7 @@ class ModularConfigLoader:
         return ""  # No custom fonts needed
     
     def _load_json_file(self, file_path: Path) -> Optional[Dict[str, Any]]:
-        """Load JSON file safely.
+        """Load JSON file safely (through the persistent parsed-file cache).
         
         Args:
             file_path: Path to JSON file
@@ -693,8 +787,7 @@ class ModularConfigLoader:
             Dict with data or None if error
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _epyson_cache.load(file_path)
         except (json.JSONDecodeError, IOError):
             return None
     
@@ -712,15 +805,55 @@ class ModularConfigLoader:
         Returns:
             Dict with fresh layout configuration
         """
-        cache_key = f"layout:{layout_name}"
-        if cache_key in self._cache:
-            del self._cache[cache_key]
+        for prefix in ('layout', 'resolved', 'compiled'):
+            self._cache.pop(f"{prefix}:{layout_name}", None)
+        notify_layout_reload(layout_name)
         
         return self.load_layout(layout_name)
+    
+    def compile_layout(self, layout_name: Optional[str] = None):
+        """Resolve a layout once and compile it into an immutable CompiledLayout.
+        
+        Args:
+            layout_name: Name of layout. If None, uses the default layout.
+        
+        Returns:
+            CompiledLayout (cached until clear_cache() or reload_layout())
+        """
+        if layout_name is None:
+            layout_name = "classic"
+        
+        cache_key = f"compiled:{layout_name}"
+        compiled = self._cache.get(cache_key)
+        if compiled is None:
+            from ePy_docs.core._layout import CompiledLayout
+            layout = _resolve_layout_refs(self, layout_name)
+            compiled = CompiledLayout(layout_name, layout)
+            self._cache[cache_key] = compiled
+        return compiled
 
 
 _global_loader = None
 
+# Callables notified when layouts are reloaded (layout name, or None for all)
+_layout_reload_hooks: List[Callable[[Optional[str]], None]] = []
+
+
+def register_layout_reload_hook(hook: Callable[[Optional[str]], None]) -> None:
+    """Register a cache invalidation callback for layout reloads.
+    
+    The hook is called with the layout name after reload_layout(), and with
+    None after clear_global_cache().
+    """
+    if hook not in _layout_reload_hooks:
+        _layout_reload_hooks.append(hook)
+
+
+def notify_layout_reload(layout_name: Optional[str] = None) -> None:
+    """Call every registered layout reload hook."""
+    for hook in list(_layout_reload_hooks):
+        hook(layout_name)
+
 
 def set_config_loader(loader: ModularConfigLoader):
     """Set the global config loader instance.
@@ -754,6 +887,8 @@ def load_layout(layout_name: Optional[str] = None, resolve_refs: bool = True) ->
         layout_name: Layout to load. If None, uses default.
         resolve_refs: If True, resolves all _ref fields to full configs.
                      This provides backward compatibility for tests expecting expanded configs.
+                     Resolution runs once per cached layout; use compile_layout()
+                     for an immutable, typed view.
     
     Returns:
         Dict with layout configuration. If resolve_refs=True, resolves:
@@ -765,102 +900,127 @@ def load_layout(layout_name: Optional[str] = None, resolve_refs: bool = True) ->
         - notes_ref → notes
     """
     loader = get_loader()
+    if resolve_refs:
+        return _resolve_layout_refs(loader, layout_name)
+    return loader.load_layout(layout_name)
+
+
+def compile_layout(layout_name: Optional[str] = None):
+    """Get the immutable CompiledLayout for a layout (resolved and compiled once).
+    
+    Args:
+        layout_name: Layout to compile. If None, uses default.
+    
+    Returns:
+        CompiledLayout with fonts, palette, tables, code, callouts and margins
+    """
+    return get_loader().compile_layout(layout_name)
+
+
+def _resolve_layout_refs(loader: ModularConfigLoader, layout_name: Optional[str]) -> Dict[str, Any]:
+    """Resolve _ref fields of a cached layout in place, once per layout.
+    
+    See load_layout() for the fields that are resolved.
+    """
     layout = loader.load_layout(layout_name)
+    resolved_key = f"resolved:{layout_name or 'classic'}"
+    if loader._cache.get(resolved_key):
+        return layout
     
-    if resolve_refs:
-        # Resolve palette_ref → colors
-        if 'palette_ref' in layout:
-            colors_config = loader.load_external('colors')
-            palette_name = layout['palette_ref']
-            # Filter out metadata keys
-            metadata_keys = {'description', 'version', 'last_updated'}
-            palettes = {k: v for k, v in colors_config.items() if k not in metadata_keys}
+    # Resolve palette_ref → colors
+    if 'palette_ref' in layout:
+        colors_config = loader.load_external('colors')
+        palette_name = layout['palette_ref']
+        # Filter out metadata keys
+        metadata_keys = {'description', 'version', 'last_updated'}
+        palettes = {k: v for k, v in colors_config.items() if k not in metadata_keys}
+        
+        if palette_name in palettes:
+            palette = palettes[palette_name]
             
-            if palette_name in palettes:
-                palette = palettes[palette_name]
-                
-                # Create colors structure with layout_config
-                layout['colors'] = {
-                    'palette': palette
-                }
-                
-                # If there's a colors section with layout_config, preserve it
-                if 'colors' in layout and isinstance(layout['colors'], dict):
-                    existing_colors = layout['colors']
-                else:
-                    existing_colors = {}
-                
-                # Merge layout_config if exists
-                layout_config = existing_colors.get('layout_config', {})
-                layout_config['default_palette'] = palette_name
-                
-                # Add tables config from layout if it exists in colors
-                if 'layout_config' in existing_colors and 'tables' in existing_colors['layout_config']:
-                    layout_config['tables'] = existing_colors['layout_config']['tables']
-                
-                layout['colors'] = {
-                    'layout_config': layout_config,
-                    'palette': palette
-                }
-        
-        # Resolve font_family_ref → font_family from embedded font_families
-        if 'font_family_ref' in layout:
-            font_ref = layout['font_family_ref']
+            # Create colors structure with layout_config
+            layout['colors'] = {
+                'palette': palette
+            }
             
-            # Check if layout has embedded font_families
-            if 'font_families' in layout and font_ref in layout['font_families']:
-                # Use embedded font_families (new model - no fonts.epyson dependency)
-                layout['font_family'] = font_ref
-                layout['text'] = layout['font_families'][font_ref]
+            # If there's a colors section with layout_config, preserve it
+            if 'colors' in layout and isinstance(layout['colors'], dict):
+                existing_colors = layout['colors']
             else:
-                # Legacy fallback: try to load from fonts.epyson if it exists
-                try:
-                    fonts_config = loader.load_external('fonts')
-                    font_families = fonts_config.get('font_families', {})
-                    
-                    if font_ref in font_families:
-                        layout['font_family'] = font_ref
-                        layout['text'] = font_families[font_ref]
-                except FileNotFoundError:
-                    # fonts.epyson doesn't exist - this is expected with new model
-                    # Keep font_family_ref for later resolution
-                    pass
-        
-        # Resolve tables_ref → tables (removed - handled later with nested path support)
-        
-        # Callouts are now integrated directly in each layout file (no more callouts_ref)
-        
-        # Images, tables, notes, and figures are now embedded in layouts (no refs needed)
-        
-        # Embed global format configuration (data_formats)
-        # format.epyson now contains a single 'data_formats' section for all layouts
-        try:
-            format_config = loader.load_external('format')
-            if 'data_formats' in format_config:
-                if 'format' not in layout:
-                    layout['format'] = {}
-                layout['format']['data_formats'] = format_config['data_formats']
-        except FileNotFoundError:
-            # format.epyson doesn't exist - skip format embedding
-            pass
-        
-        # Tables configuration is now embedded directly in each layout file (no more tables_ref)
-        
-        # Images are now embedded directly in each layout file (no more images_ref)
-        
-        # Notes validation now uses hardcoded Quarto types (no more notes.epyson or notes_ref)
-        
-        # Quarto configuration (html_theme, docx_reference) is now embedded directly in each layout file
-        
-        # Resolve html_ref → html
-        if 'html_ref' in layout:
-            ref_parts = layout['html_ref'].split('.')
-            if len(ref_parts) == 2:
-                config_name, variant_name = ref_parts
-                html_config = loader.load_external(config_name)
-                if variant_name in html_config:
-                    layout['html'] = html_config[variant_name]
+                existing_colors = {}
+            
+            # Merge layout_config if exists
+            layout_config = existing_colors.get('layout_config', {})
+            layout_config['default_palette'] = palette_name
+            
+            # Add tables config from layout if it exists in colors
+            if 'layout_config' in existing_colors and 'tables' in existing_colors['layout_config']:
+                layout_config['tables'] = existing_colors['layout_config']['tables']
+            
+            layout['colors'] = {
+                'layout_config': layout_config,
+                'palette': palette
+            }
+    
+    # Resolve font_family_ref → font_family from embedded font_families
+    if 'font_family_ref' in layout:
+        font_ref = layout['font_family_ref']
+        
+        # Check if layout has embedded font_families
+        if 'font_families' in layout and font_ref in layout['font_families']:
+            # Use embedded font_families (new model - no fonts.epyson dependency)
+            layout['font_family'] = font_ref
+            layout['text'] = layout['font_families'][font_ref]
+        else:
+            # Legacy fallback: try to load from fonts.epyson if it exists
+            try:
+                fonts_config = loader.load_external('fonts')
+                font_families = fonts_config.get('font_families', {})
+                
+                if font_ref in font_families:
+                    layout['font_family'] = font_ref
+                    layout['text'] = font_families[font_ref]
+            except FileNotFoundError:
+                # fonts.epyson doesn't exist - this is expected with new model
+                # Keep font_family_ref for later resolution
+                pass
+    
+    # Resolve tables_ref → tables (removed - handled later with nested path support)
+    
+    # Callouts are now integrated directly in each layout file (no more callouts_ref)
     
+    # Images, tables, notes, and figures are now embedded in layouts (no refs needed)
+    
+    # Embed global format configuration (data_formats)
+    # format.epyson now contains a single 'data_formats' section for all layouts
+    try:
+        format_config = loader.load_external('format')
+        if 'data_formats' in format_config:
+            if 'format' not in layout:
+                layout['format'] = {}
+            layout['format']['data_formats'] = format_config['data_formats']
+    except FileNotFoundError:
+        # format.epyson doesn't exist - skip format embedding
+        pass
+    
+    # Tables configuration is now embedded directly in each layout file (no more tables_ref)
+    
+    # Images are now embedded directly in each layout file (no more images_ref)
+    
+    # Notes validation now uses hardcoded Quarto types (no more notes.epyson or notes_ref)
+    
+    # Quarto configuration (html_theme, docx_reference) is now embedded directly in each layout file
+    
+    # Resolve html_ref → html
+    if 'html_ref' in layout:
+        ref_parts = layout['html_ref'].split('.')
+        if len(ref_parts) == 2:
+            config_name, variant_name = ref_parts
+            html_config = loader.load_external(config_name)
+            if variant_name in html_config:
+                layout['html'] = html_config[variant_name]
+    
+    loader._cache[resolved_key] = True
     return layout
 
 
@@ -955,6 +1115,27 @@ def clear_global_cache():
     global _global_loader
     if _global_loader is not None:
         _global_loader.clear_cache()
+    
+    # Compiled formatters are derived from configuration
+    from ePy_docs.core._format import clear_superscript_cache
+    clear_superscript_cache()
+    
+    # Font lists are resolved from layout configuration (only if fonts were used)
+    images_module = sys.modules.get('ePy_docs.core._images')
+    if images_module is not None:
+        images_module.get_font_registry().invalidate()
+    
+    # Output directories are derived from document type configuration
+    from ePy_docs.core._paths import clear_output_directories_cache
+    clear_output_directories_cache()
+    
+    # Caches derived from layouts (PDF config and headers, ...)
+    notify_layout_reload(None)
+    
+    # Stylesheets are keyed by the compiled layout (only if CSS was generated)
+    html_module = sys.modules.get('ePy_docs.core._html')
+    if html_module is not None:
+        html_module.clear_css_cache()
 
 
 def get_current_project_config():
@@ -981,9 +1162,7 @@ def load_epyson(file_path: str) -> Dict[str, Any]:
         FileNotFoundError: If file doesn't exist
         json.JSONDecodeError: If file is not valid JSON
     """
-    path = Path(file_path)
-    with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return _epyson_cache.load(Path(file_path))
 
 
 # Layout Functions - Delegated to ModularConfigLoader (moved from _layouts.py)
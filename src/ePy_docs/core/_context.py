@@ -0,0 +1,72 @@
+"""
+Writer Context Module
+
+Tracks the DocumentWriter that is currently building a document so that
+configuration helpers can reach project, author and client information in
+O(1) instead of walking the call stack.
+
+The current writer is stored in a ContextVar, so writers used from different
+threads (or asyncio tasks) never see each other's metadata. It is only set
+while a writer generates output or builds a table (writer_context). Every
+lookup also accepts an explicit ``writer`` argument, which takes precedence.
+"""
+
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+
+# Weak reference, so a finished writer is not kept alive by the context
+_current_writer: ContextVar[Optional[weakref.ReferenceType]] = ContextVar('epy_docs_current_writer', default=None)
+
+
+def get_current_writer() -> Optional[Any]:
+    """Return the writer active in the current context, if any."""
+    ref = _current_writer.get()
+    return ref() if ref is not None else None
+
+
+@contextmanager
+def writer_context(writer: Any) -> Iterator[Any]:
+    """Make writer the active writer for the duration of the block.
+
+    DocumentWriter wraps generation and table creation in this block; outside
+    of it the previously active writer (usually none) is restored.
+    """
+    token = _current_writer.set(weakref.ref(writer))
+    try:
+        yield writer
+    finally:
+        _current_writer.reset(token)
+
+
+def resolve_writer(writer: Optional[Any] = None) -> Optional[Any]:
+    """Return the explicit writer, or the active one when None."""
+    return writer if writer is not None else get_current_writer()
+
+
+def get_writer_project_config(writer: Optional[Any] = None) -> Dict[str, Any]:
+    """Build the project configuration dict from a writer's metadata.
+
+    Args:
+        writer: DocumentWriter instance (None = active writer)
+
+    Returns:
+        Dict with 'project', 'authors' and 'client' keys for the data that is set
+    """
+    writer = resolve_writer(writer)
+    if writer is None:
+        return {}
+
+    config = {}
+    project_info = getattr(writer, '_project_info', None)
+    if project_info:
+        config['project'] = project_info.copy()
+    authors = getattr(writer, '_authors', None)
+    if authors:
+        config['authors'] = authors
+    client_info = getattr(writer, '_client_info', None)
+    if client_info:
+        config['client'] = client_info
+    return config
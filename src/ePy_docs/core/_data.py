@@ -4,6 +4,7 @@ Refactored module following SOLID principles:
 - DataCache: Unified cache management with temporal overrides
 - DataProcessor: Core data processing and validation utilities
 - DataFrameUtils: DataFrame manipulation and analysis
+- TableProfile: Single-pass cell text statistics shared by table analysis
 - TableAnalyzer: Table-specific analysis and dimension calculations
 
 Version: 3.0.0 - Optimized and modularized
@@ -14,6 +15,7 @@ import json
 import logging
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Union, Tuple
+import numpy as np
 import pandas as pd
 from pandas.api.types import is_numeric_dtype
 
@@ -479,6 +481,210 @@ class DataFrameUtils:
             raise ValueError(f"max_rows must be int, float, or list of int/float, got {type(max_rows)}")
 
 
+# ============================================================================
+# TABLE PROFILING
+# ============================================================================
+
+# Characters that render wider than average in table cells
+TABLE_SPECIAL_CHARS = ('²', '³', '⁰', '¹', '⁴', '⁵', '⁶', '⁷', '⁸', '⁹', '·', '×', '÷', '±', '≤', '≥')
+_SPECIAL_CHARS_PATTERN = '[' + ''.join(TABLE_SPECIAL_CHARS) + ']'
+_BLANK_TEXT = ('nan', 'None', '')
+
+
+class TableProfile:
+    """Text statistics of every cell of a DataFrame, computed in one pass.
+    
+    Cell text follows the renderer's convention, ``str(value)`` of the value
+    ``df.iloc`` returns, so missing values count as 'nan', 'None', 'NaT', ...
+    All statistics are (rows x cols) arrays built with vectorized string
+    operations; the per-column and per-row aggregates used for sizing,
+    splitting and formatting are derived from them on demand.
+    
+    Attributes:
+        lengths: Characters per cell
+        line_counts: Lines per cell (newlines + 1)
+        line_lengths: Length of the longest line of each cell
+        null: Cells holding a missing value
+        blank: Missing cells and cells whose text is 'nan', 'None' or empty
+        special: Cells containing one of TABLE_SPECIAL_CHARS
+        numeric: Cells that are digits once '.' and '-' are removed
+        header_lengths: Characters per column name
+        header_line_counts: Lines per column name
+    """
+    
+    __slots__ = ('lengths', 'line_counts', 'line_lengths', 'null', 'blank',
+                 'special', 'numeric', 'header_lengths', 'header_line_counts')
+    
+    _CELL_FIELDS = ('lengths', 'line_counts', 'line_lengths', 'null', 'blank', 'special', 'numeric')
+    
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields[name])
+    
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> 'TableProfile':
+        """Profile all cells and column names of df.
+        
+        Args:
+            df: DataFrame to profile
+            
+        Returns:
+            TableProfile with one entry per cell
+        """
+        num_rows, num_cols = df.shape
+        text = np.empty((num_rows, num_cols), dtype=object)
+        for col_idx in range(num_cols):
+            column = df.iloc[:, col_idx]
+            # Iterate the scalars iloc yields (numpy scalars, or boxed Timestamp/NA)
+            if isinstance(column.dtype, np.dtype) and column.dtype.kind not in 'mM':
+                values = column.to_numpy()
+            else:
+                values = column.array
+            text[:, col_idx] = [str(value) for value in values]
+        
+        # One flat Series for all cells (column-major), reshaped afterwards
+        cells = cls._text_statistics(pd.Series(text.ravel(order='F'), dtype=object))
+        fields = {name: values.reshape((num_rows, num_cols), order='F') for name, values in cells.items()}
+        fields['null'] = df.isna().to_numpy(dtype=bool).reshape((num_rows, num_cols))
+        fields['blank'] = fields['blank'] | fields['null']
+        
+        headers = cls._text_statistics(pd.Series([str(col) for col in df.columns], dtype=object))
+        fields['header_lengths'] = headers['lengths']
+        fields['header_line_counts'] = headers['line_counts']
+        return cls(**fields)
+    
+    @staticmethod
+    def _text_statistics(text: pd.Series) -> Dict[str, Any]:
+        """Per-string statistics of a Series of str.
+        
+        Statistics are computed once per distinct string and broadcast back,
+        since table columns usually repeat values.
+        """
+        codes, uniques = pd.factorize(text.to_numpy(dtype=object))
+        unique_text = pd.Series(uniques, dtype=object)
+        lengths = unique_text.str.len().to_numpy(dtype=np.int64)
+        line_counts = np.ones(len(unique_text), dtype=np.int64)
+        line_lengths = lengths.copy()
+        
+        multiline = unique_text.str.contains('\n', regex=False).to_numpy(dtype=bool)
+        if multiline.any():
+            multiline_text = unique_text[multiline]
+            line_counts[multiline] = multiline_text.str.count('\n').to_numpy(dtype=np.int64) + 1
+            longest = multiline_text.str.split('\n').explode().str.len().groupby(level=0).max()
+            line_lengths[longest.index.to_numpy()] = longest.to_numpy(dtype=np.int64)
+        
+        unique_stats = {
+            'lengths': lengths,
+            'line_counts': line_counts,
+            'line_lengths': line_lengths,
+            'blank': unique_text.isin(_BLANK_TEXT).to_numpy(dtype=bool),
+            'special': unique_text.str.contains(_SPECIAL_CHARS_PATTERN, regex=True).to_numpy(dtype=bool),
+            'numeric': (unique_text.str.replace('.', '', regex=False)
+                                   .str.replace('-', '', regex=False)
+                                   .str.isdigit().to_numpy(dtype=bool)),
+        }
+        return {name: values[codes] for name, values in unique_stats.items()}
+    
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.lengths.shape
+    
+    # ------------------------------------------------------------------------
+    # Derived profiles
+    # ------------------------------------------------------------------------
+    
+    def slice(self, start: int, stop: int) -> 'TableProfile':
+        """Profile of rows [start, stop), e.g. for df.iloc[start:stop]."""
+        fields = {name: getattr(self, name)[start:stop] for name in self._CELL_FIELDS}
+        return TableProfile(header_lengths=self.header_lengths,
+                            header_line_counts=self.header_line_counts, **fields)
+    
+    def replace_cells(self, rows, cols, texts) -> 'TableProfile':
+        """Profile after setting the given (non-missing) cells to new text.
+        
+        Args:
+            rows: Row positions
+            cols: Column positions (same length as rows)
+            texts: New cell text, one per position
+            
+        Returns:
+            New TableProfile (self if there is nothing to replace)
+        """
+        if len(rows) == 0:
+            return self
+        
+        updated = self._text_statistics(pd.Series([str(text) for text in texts], dtype=object))
+        updated['null'] = np.zeros(len(rows), dtype=bool)
+        fields = {}
+        for name in self._CELL_FIELDS:
+            values = getattr(self, name).copy()
+            values[rows, cols] = updated[name]
+            fields[name] = values
+        return TableProfile(header_lengths=self.header_lengths,
+                            header_line_counts=self.header_line_counts, **fields)
+    
+    def replace_headers(self, headers) -> 'TableProfile':
+        """Profile after renaming the columns."""
+        stats = self._text_statistics(pd.Series([str(col) for col in headers], dtype=object))
+        fields = {name: getattr(self, name) for name in self._CELL_FIELDS}
+        return TableProfile(header_lengths=stats['lengths'],
+                            header_line_counts=stats['line_counts'], **fields)
+    
+    # ------------------------------------------------------------------------
+    # Aggregates
+    # ------------------------------------------------------------------------
+    
+    def column_max_length(self) -> np.ndarray:
+        """Longest non-missing cell per column (0 for all-missing columns)."""
+        return self.lengths.max(axis=0, initial=0, where=~self.null)
+    
+    def row_max_length(self) -> np.ndarray:
+        """Longest non-missing cell per row (0 for all-missing rows)."""
+        return self.lengths.max(axis=1, initial=0, where=~self.null)
+    
+    def column_max_line_length(self) -> np.ndarray:
+        """Longest line per column, missing cells included."""
+        return self.line_lengths.max(axis=0, initial=0)
+    
+    def column_has_special(self) -> np.ndarray:
+        """Whether each column contains any TABLE_SPECIAL_CHARS."""
+        return self.special.any(axis=0)
+    
+    def row_max_lines(self, wrap_length: int = 25) -> np.ndarray:
+        """Estimated lines per row: explicit newlines or wrapping past wrap_length."""
+        wrapped = np.where(self.lengths > wrap_length, self.lengths // wrap_length + 1, 1)
+        return np.maximum(self.line_counts, wrapped).max(axis=1, initial=1)
+    
+    def header_max_lines(self, wrap_length: int = 20) -> int:
+        """Estimated lines of the header row."""
+        wrapped = np.where(self.header_lengths > wrap_length, self.header_lengths // wrap_length + 1, 1)
+        return int(np.maximum(self.header_line_counts, wrapped).max(initial=1))
+    
+    def column_content_stats(self) -> List[Dict[str, Any]]:
+        """Per-column length statistics of the non-blank cells.
+        
+        Returns:
+            One dict per column with 'count', 'avg_length', 'max_length'
+            (None when the column has no non-blank cells) and 'numeric_count'
+        """
+        present = ~self.blank
+        counts = present.sum(axis=0)
+        totals = np.where(present, self.lengths, 0).sum(axis=0)
+        maxima = self.lengths.max(axis=0, initial=0, where=present)
+        numeric_counts = self.numeric.sum(axis=0)
+        
+        stats = []
+        for col_idx in range(self.shape[1]):
+            count = int(counts[col_idx])
+            stats.append({
+                'count': count,
+                'avg_length': int(totals[col_idx]) / count if count else None,
+                'max_length': int(maxima[col_idx]) if count else None,
+                'numeric_count': int(numeric_counts[col_idx]),
+            })
+        return stats
+
+
 # ============================================================================
 # TABLE ANALYSIS
 # ============================================================================
@@ -496,39 +702,28 @@ class TableAnalyzer:
         (35, float('inf')): 1.6
     }
     _SPECIAL_CHAR_FACTOR = 1.05
-    _SPECIAL_CHARS = ['²', '³', '⁰', '¹', '⁴', '⁵', '⁶', '⁷', '⁸', '⁹', '·', '×', '÷', '±', '≤', '≥']
+    _SPECIAL_CHARS = list(TABLE_SPECIAL_CHARS)
     
     @staticmethod
-    def calculate_column_width(col_index: int, column_name: str, df: pd.DataFrame) -> float:
+    def calculate_column_width(col_index: int, column_name: str, df: pd.DataFrame,
+                               profile: Optional[TableProfile] = None) -> float:
         """Calculate specific width factor for each column.
         
         Args:
             col_index: Column index in DataFrame
             column_name: Name of the column
             df: DataFrame containing the data
+            profile: Precomputed TableProfile of df (computed if None)
             
         Returns:
             Width factor for the column
         """
-        max_content_length = len(str(column_name))
-        has_special_chars = False
+        if profile is None:
+            profile = TableProfile.from_dataframe(df)
         
-        # Find maximum content length
-        for row_idx in range(len(df)):
-            cell_value = df.iloc[row_idx, col_index]
-            cell_str = str(cell_value)
-            
-            # Check for special characters
-            if not has_special_chars and any(char in cell_str for char in TableAnalyzer._SPECIAL_CHARS):
-                has_special_chars = True
-            
-            # Handle multiline content
-            if '\n' in cell_str:
-                lines = cell_str.split('\n')
-                max_line_length = max(len(line) for line in lines)
-                max_content_length = max(max_content_length, max_line_length)
-            else:
-                max_content_length = max(max_content_length, len(cell_str))
+        # Longest line of the column (multiline cells count per line)
+        max_content_length = max(len(str(column_name)), int(profile.column_max_line_length()[col_index]))
+        has_special_chars = bool(profile.column_has_special()[col_index])
         
         # Determine width factor based on content length
         width_factor = 1.0  # default
@@ -546,7 +741,8 @@ class TableAnalyzer:
     @staticmethod
     def calculate_row_height(row_index: int, df: pd.DataFrame, is_header: bool,
                            font_size_header: float, font_size_content: float,
-                           layout_style: str, font_family: str) -> float:
+                           layout_style: str, font_family: str,
+                           profile: Optional[TableProfile] = None) -> float:
         """Calculate necessary row height dynamically.
         
         Args:
@@ -557,6 +753,7 @@ class TableAnalyzer:
             font_size_content: Font size for content
             layout_style: Layout style name
             font_family: Font family name
+            profile: Precomputed TableProfile of df (computed if None)
             
         Returns:
             Height factor relative to default cell height
@@ -565,7 +762,7 @@ class TableAnalyzer:
         base_font_size = float(font_size_header if is_header else font_size_content)
         
         # Count maximum lines in this row
-        max_lines_in_row = TableAnalyzer._count_max_lines(df, row_index, is_header)
+        max_lines_in_row = TableAnalyzer._count_max_lines(df, row_index, is_header, profile)
         
         # Calculate line height (baseline: 1.3x font size for readability)
         line_height = base_font_size * 1.3
@@ -591,35 +788,19 @@ class TableAnalyzer:
         return height_factor
     
     @staticmethod
-    def _count_max_lines(df: pd.DataFrame, row_index: int, is_header: bool) -> int:
-        """Count maximum lines in a row."""
-        max_lines = 1
+    def _count_max_lines(df: pd.DataFrame, row_index: int, is_header: bool,
+                         profile: Optional[TableProfile] = None) -> int:
+        """Count maximum lines in a row (newlines or auto-wrap estimation)."""
+        if profile is None:
+            profile = TableProfile.from_dataframe(df)
         
         if is_header:
-            for col in df.columns:
-                col_str = str(col)
-                line_count = col_str.count('\n') + 1
-                max_lines = max(max_lines, line_count)
-                
-                # Auto-wrap estimation for long headers
-                if len(col_str) > 20:
-                    estimated_lines = len(col_str) // 20 + 1
-                    max_lines = max(max_lines, estimated_lines)
-        else:
-            if row_index < len(df):
-                for col in df.columns:
-                    cell_value = df.iloc[row_index, df.columns.get_loc(col)]
-                    cell_str = str(cell_value)
-                    
-                    line_count = cell_str.count('\n') + 1
-                    max_lines = max(max_lines, line_count)
-                    
-                    # Auto-wrap estimation for long content
-                    if len(cell_str) > 25:
-                        estimated_lines = len(cell_str) // 25 + 1
-                        max_lines = max(max_lines, estimated_lines)
-        
-        return max_lines
+            # Long headers wrap every 20 characters
+            return profile.header_max_lines(wrap_length=20)
+        if row_index < len(df):
+            # Long content wraps every 25 characters
+            return int(profile.row_max_lines(wrap_length=25)[row_index])
+        return 1
 
     @staticmethod
     def detect_category(df: pd.DataFrame, config: Dict) -> Tuple[str, Optional[List[str]]]:
@@ -782,66 +963,97 @@ class TablePreparation:
         return DataFrameUtils.split_large_table(df, max_rows_per_table)
 
     @staticmethod
-    def split_by_height(df: pd.DataFrame, max_height: float = 9.0, base_row_height: float = 0.3) -> List[pd.DataFrame]:
-        """Split DataFrame into chunks based on accumulated row height approximation.
+    def estimate_row_heights(df: pd.DataFrame, base_row_height: float = 0.3,
+                             profile: Optional[TableProfile] = None) -> np.ndarray:
+        """Estimate the rendered height of every row from its longest cell.
+
+        A row whose longest non-null cell has n characters spans
+        n // 25 + 1 lines (about 25 characters per line); multi-line rows get
+        a 10% buffer.
+
+        Args:
+            df: DataFrame to measure
+            base_row_height: Base height for a single line text row in inches
+            profile: Precomputed TableProfile of df (computed if None)
+
+        Returns:
+            numpy array with one height (inches) per row
+        """
+        if profile is None:
+            profile = TableProfile.from_dataframe(df)
+
+        estimated_lines = profile.row_max_length() // 25 + 1
+        return np.where(estimated_lines > 1,
+                        base_row_height * estimated_lines * 1.1,
+                        base_row_height)
+
+    @staticmethod
+    def height_split_bounds(profile: TableProfile, max_height: float = 9.0,
+                            base_row_height: float = 0.3) -> List[Tuple[int, int]]:
+        """Row ranges of the chunks split_by_height() produces.
+        
+        Split points are found with a binary search over the cumulative
+        estimated row height.
         
         Args:
-            df: DataFrame to split
+            profile: TableProfile of the DataFrame to split
             max_height: Maximum height per page/chunk in inches (default 9.0)
             base_row_height: Base height for a single line text row in inches
             
         Returns:
-            List of DataFrame chunks
+            List of (start, stop) row positions, one per chunk
         """
-        if df.empty:
+        n_rows, n_cols = profile.shape
+        if n_rows == 0 or n_cols == 0:
             return []
-            
-        chunks = []
-        current_rows = []
         
         # Header estimation (assumes header is present on every page)
-        header_wrapped = any(len(str(col)) > 10 for col in df.columns)
+        header_wrapped = bool((profile.header_lengths > 10).any())
         # Header height + Padding (0.5)
         # Header usually 1.4x base if wrapped, else 1.3x base (approx from TableContentAnalyzer)
         header_height = base_row_height * (1.4 if header_wrapped else 1.2)
         chunk_overhead = header_height + 0.5
+        # Tolerance keeps exact fits inside the chunk despite cumsum rounding
+        row_budget = max_height - chunk_overhead + 1e-9
+        
+        row_heights = TablePreparation.estimate_row_heights(None, base_row_height, profile)
+        cumulative = np.concatenate(([0.0], np.cumsum(row_heights)))
+        
+        bounds = []
+        start = 0
+        while start < n_rows:
+            # Last row that still fits; every chunk keeps at least one row
+            end = int(np.searchsorted(cumulative, cumulative[start] + row_budget, side='right')) - 1
+            end = min(max(end, start + 1), n_rows)
+            bounds.append((start, end))
+            start = end
+            
+        return bounds
+
+    @staticmethod
+    def split_by_height(df: pd.DataFrame, max_height: float = 9.0, base_row_height: float = 0.3,
+                        profile: Optional[TableProfile] = None) -> List[pd.DataFrame]:
+        """Split DataFrame into chunks based on accumulated row height approximation.
         
-        current_height = chunk_overhead
+        Chunks are positional slices of df (see height_split_bounds), so
+        index, columns and dtypes are preserved.
         
-        for idx, row in df.iterrows():
-            # Estimate row height based on content wrapping
-            # Simple heuristic: if any cell > 12 chars, likely wraps
-            row_needs_wrapping = any(len(str(val)) > 12 for val in row if pd.notna(val))
-            
-            if row_needs_wrapping:
-                # 1.3x base height per line approx? 
-                # Simplification: assume wrapped row is ~1.5x height of significant wrap
-                # Or use TableAnalyzer logic if possible. 
-                # For safety, let's look at max length to estimate lines.
-                max_len = max((len(str(val)) for val in row if pd.notna(val)), default=0)
-                estimated_lines = max(1, max_len // 25 + 1) # Width approx 25 chars?
-                row_height = base_row_height * estimated_lines
-                # Add some buffer
-                if estimated_lines > 1:
-                    row_height *= 1.1
-            else:
-                row_height = base_row_height
-            
-            # If adding this row exceeds max_height, split
-            # BUT: Ensure at least one row per chunk if possible
-            if current_height + row_height > max_height and current_rows:
-                chunks.append(pd.DataFrame(current_rows))
-                current_rows = []
-                current_height = chunk_overhead
-            
-            current_rows.append(row)
-            current_height += row_height
-            
-        # Add remaining rows
-        if current_rows:
-            chunks.append(pd.DataFrame(current_rows))
+        Args:
+            df: DataFrame to split
+            max_height: Maximum height per page/chunk in inches (default 9.0)
+            base_row_height: Base height for a single line text row in inches
+            profile: Precomputed TableProfile of df (computed if None)
             
-        return chunks
+        Returns:
+            List of DataFrame chunks
+        """
+        if df.empty:
+            return []
+        if profile is None:
+            profile = TableProfile.from_dataframe(df)
+        
+        bounds = TablePreparation.height_split_bounds(profile, max_height, base_row_height)
+        return [df.iloc[start:stop] for start, stop in bounds]
 
 
 # ============================================================================
@@ -961,49 +1173,44 @@ class TableContentAnalyzer:
     """Analyze table content for optimal styling and rendering."""
     
     @staticmethod
-    def needs_wrapping(df: pd.DataFrame, max_cell_length: int = 12) -> bool:
+    def needs_wrapping(df: pd.DataFrame, max_cell_length: int = 12,
+                       profile: Optional[TableProfile] = None) -> bool:
         """Check if table content needs text wrapping.
         
         Args:
             df: DataFrame to analyze
             max_cell_length: Maximum cell length before wrapping
+            profile: Precomputed TableProfile of df (computed if None)
             
         Returns:
             True if wrapping is needed
         """
-        # Check data cells
-        for _, row in df.iterrows():
-            if any(len(str(val)) > max_cell_length for val in row if pd.notna(val)):
-                return True
-        
-        # Check headers
-        if any(len(str(col)) > max_cell_length for col in df.columns):
-            return True
+        if profile is None:
+            profile = TableProfile.from_dataframe(df)
         
-        return False
+        # Check data cells, then headers
+        return bool((profile.column_max_length() > max_cell_length).any()
+                    or (profile.header_lengths > max_cell_length).any())
     
     @staticmethod
     def calculate_column_widths(df: pd.DataFrame, 
-                               total_width: float) -> List[float]:
+                               total_width: float,
+                               profile: Optional[TableProfile] = None) -> List[float]:
         """Calculate proportional column widths based on content.
         
         Args:
             df: DataFrame to analyze
             total_width: Total available width in inches
+            profile: Precomputed TableProfile of df (computed if None)
             
         Returns:
             List of column widths in inches
         """
-        # Calculate content-based weights
-        col_weights = []
-        for col in df.columns:
-            # Consider header length and max content length
-            header_len = len(str(col))
-            max_content = max(
-                (len(str(val)) for val in df[col] if pd.notna(val)), 
-                default=0
-            )
-            col_weights.append(max(header_len, max_content))
+        if profile is None:
+            profile = TableProfile.from_dataframe(df)
+        
+        # Content-based weights: header length or max content length
+        col_weights = np.maximum(profile.header_lengths, profile.column_max_length()).tolist()
         
         # Normalize to total width
         total_weight = sum(col_weights)
@@ -1016,13 +1223,15 @@ class TableContentAnalyzer:
     @staticmethod
     def calculate_optimal_width(df: pd.DataFrame, 
                                base_width: float,
-                               style_config: Optional[Dict] = None) -> float:
+                               style_config: Optional[Dict] = None,
+                               profile: Optional[TableProfile] = None) -> float:
         """Calculate optimal table width based on content and configuration.
         
         Args:
             df: DataFrame to analyze
             base_width: Base width from configuration
             style_config: Optional style configuration dict
+            profile: Precomputed TableProfile of df (computed if None)
             
         Returns:
             Calculated width in inches (clamped 4-14 inches)
@@ -1033,16 +1242,14 @@ class TableContentAnalyzer:
         if base_width is None or base_width <= 0:
             raise ValueError("base_width must be a positive number")
         
+        if profile is None:
+            profile = TableProfile.from_dataframe(df)
+        
         num_cols = len(df.columns)
         
         # Check if we have long headers or content that might need wrapping
-        max_header_length = max(len(str(col)) for col in df.columns) if len(df.columns) > 0 else 0
-        max_content_length = 0
-        for col in df.columns:
-            # Get non-null values for this column
-            non_null_values = [str(val) for val in df[col] if pd.notna(val)]
-            col_max = max(len(val) for val in non_null_values) if non_null_values else 0
-            max_content_length = max(max_content_length, col_max)
+        max_header_length = int(profile.header_lengths.max(initial=0))
+        max_content_length = int(profile.column_max_length().max(initial=0))
         
         # Adjust width based on content complexity
         width_multiplier = 1.0
@@ -1061,27 +1268,28 @@ class TableContentAnalyzer:
     
     @staticmethod
     def calculate_optimal_height(df: pd.DataFrame,
-                                base_row_height: float = 0.3) -> float:
+                                base_row_height: float = 0.3,
+                                profile: Optional[TableProfile] = None) -> float:
         """Calculate optimal table height based on content and wrapping.
         
         Args:
             df: DataFrame to analyze
             base_row_height: Base row height in inches
+            profile: Precomputed TableProfile of df (computed if None)
             
         Returns:
             Calculated height in inches (clamped 2-12 inches)
         """
+        if profile is None:
+            profile = TableProfile.from_dataframe(df)
+        
         num_rows = len(df) + 1  # Include header
         
         # Check for content that will likely be wrapped
-        wrapped_rows = 0
-        for idx, row in df.iterrows():
-            row_needs_wrapping = any(len(str(val)) > 12 for val in row if pd.notna(val))
-            if row_needs_wrapping:
-                wrapped_rows += 1
+        wrapped_rows = int((profile.row_max_length() > 12).sum())
         
         # Check if headers will be wrapped
-        header_wrapped = any(len(str(col)) > 10 for col in df.columns)
+        header_wrapped = bool((profile.header_lengths > 10).any())
         
         # Adjust height based on wrapping
         if header_wrapped:
@@ -2,13 +2,18 @@
 
 Unified module providing:
 - Document type detection, conversion routing, and batch processing
+  (worker pool, per-file timeouts, Quarto retries, resumable manifest)
 - Column width calculations for multi-column layouts
 - Table and figure width optimization
 - Support for various input formats (QMD, Markdown, Word) to multiple outputs
 """
 
+import hashlib
+import json
 import logging
-from typing import Dict, Any, Optional, List, Union, Tuple
+import os
+import time
+from typing import Callable, Dict, Any, Optional, List, Union, Tuple
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -340,7 +345,19 @@ class DocumentProcessor:
                         output_formats: List[str] = None, **kwargs) -> Dict[str, Path]:
         """Process document to specified formats."""
         output_formats = output_formats or ['pdf', 'html']
+        qmd_path = self._convert_document(input_path, output_dir, layout_name,
+                                          document_type, output_formats, **kwargs)
         
+        # Render to output formats
+        return self._render_formats(qmd_path, output_formats)
+    
+    def _convert_document(self, input_path: Path, output_dir: Path, layout_name: str,
+                          document_type: str, output_formats: List[str], **kwargs) -> Path:
+        """Validate input and convert it to a QMD file in output_dir.
+        
+        Returns:
+            Path to the generated QMD file
+        """
         # Validate input
         self.validate_input_file(input_path)
         
@@ -351,10 +368,8 @@ class DocumentProcessor:
         # Convert to QMD based on input type
         doc_type = self.detect_document_type(input_path)
         converter = self._get_converter(doc_type)
-        qmd_content = converter(input_path, qmd_path, layout_name, document_type, output_formats, **kwargs)
-        
-        # Render to output formats
-        return self._render_formats(qmd_path, output_formats)
+        converter(input_path, qmd_path, layout_name, document_type, output_formats, **kwargs)
+        return qmd_path
     
     def _get_converter(self, doc_type: str):
         """Get appropriate converter function."""
@@ -474,23 +489,289 @@ class DocumentProcessor:
             output_formats=output_formats, **kwargs
         )
     
-    def process_batch(self, input_dir: Path, output_dir: Path, 
-                     pattern: str = '*.md', **kwargs) -> Dict[str, Dict[str, Path]]:
-        """Process multiple documents in directory."""
-        results = {}
-        for file_path in input_dir.glob(pattern):
-            if file_path.is_file():
+    def _render_formats_with_retries(self, qmd_path: Path, output_formats: List[str],
+                                     retries: int = 0, retry_delay: float = 1.0,
+                                     deadline: Optional[float] = None) -> Tuple[Dict[str, Path], int]:
+        """Render QMD to specified formats, retrying failed Quarto runs.
+        
+        Args:
+            qmd_path: Path to QMD file
+            output_formats: Formats to render
+            retries: Extra attempts per format after a Quarto failure (RuntimeError)
+            retry_delay: Seconds to wait before the first retry (grows linearly)
+            deadline: time.monotonic() value by which rendering must finish
+            
+        Returns:
+            Tuple of (results dict as returned by _render_formats, retries used)
+            
+        Raises:
+            TimeoutError: If the deadline passes before all formats are rendered
+        """
+        from ePy_docs.core._quarto import render_qmd
+        
+        results = {'qmd': qmd_path}
+        retries_used = 0
+        for fmt in output_formats:
+            attempt = 0
+            while True:
+                remaining = None
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(f"Timed out before rendering {fmt} for {qmd_path.name}")
                 try:
-                    results[file_path.name] = self.process_document(
-                        input_path=file_path,
-                        output_dir=output_dir / file_path.stem,
-                        **kwargs
-                    )
+                    results[fmt] = render_qmd(qmd_path, output_format=fmt, timeout=remaining)
+                except TimeoutError:
+                    raise
+                except RuntimeError as e:
+                    if attempt < retries:
+                        attempt += 1
+                        retries_used += 1
+                        logger.warning(f"Retrying {fmt} for {qmd_path.name} ({attempt}/{retries}): {e}")
+                        delay = retry_delay * attempt
+                        if remaining is not None:
+                            delay = min(delay, max(remaining, 0))
+                        time.sleep(delay)
+                        continue
+                    logger.warning(f"Failed to render {fmt}: {e}")
+                    results[fmt] = None
                 except Exception as e:
-                    logger.error(f"Error processing {file_path}: {e}")
-                    results[file_path.name] = {'error': str(e)}
+                    logger.warning(f"Failed to render {fmt}: {e}")
+                    results[fmt] = None
+                break
         
-        return results
+        return results, retries_used
+    
+    def process_batch(self, input_dir: Path, output_dir: Path, 
+                     pattern: str = '*.md', max_workers: Optional[int] = 1,
+                     timeout: Optional[float] = None, retries: int = 0,
+                     retry_delay: float = 1.0,
+                     progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+                     resume: bool = False, **kwargs) -> Dict[str, Dict[str, Path]]:
+        """Process multiple documents in directory.
+        
+        Each file is converted to ``output_dir/<stem>/<stem>.qmd`` and rendered.
+        Finished files are recorded in a manifest (BATCH_MANIFEST_NAME in
+        output_dir). With resume=True, re-running a crashed or interrupted
+        batch skips every file whose source, batch options and configuration
+        (package config files, package and Quarto versions) are unchanged and
+        whose outputs exist.
+        
+        Args:
+            input_dir: Directory with source documents
+            output_dir: Root output directory
+            pattern: Glob pattern for source files
+            max_workers: Worker processes (1 = in this process, None = CPU count)
+            timeout: Seconds allowed per file, enforced on its Quarto runs (None = no limit)
+            retries: Extra attempts per format when Quarto fails (0 = no retry)
+            retry_delay: Seconds before the first retry (grows linearly)
+            progress_callback: Called with a metrics dict after every file
+            resume: Skip files the manifest records as finished (off by default)
+            **kwargs: Passed to process_document (layout_name, output_formats, ...)
+            
+        Returns:
+            Dictionary mapping file names to their results, or to {'error': message}
+            
+        Raises:
+            ValueError: If max_workers or retries is invalid
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be a positive integer, got {max_workers}")
+        if retries < 0:
+            raise ValueError(f"retries must be >= 0, got {retries}")
+        
+        # Quarto runs inside each document's folder, so outputs need absolute paths
+        output_dir = Path(output_dir).resolve()
+        files = [file_path for file_path in sorted(Path(input_dir).glob(pattern)) if file_path.is_file()]
+        manifest = BatchManifest(output_dir / BATCH_MANIFEST_NAME, kwargs,
+                                 environment=get_batch_environment_fingerprint() if resume else '')
+        metrics = {
+            'total': len(files), 'processed': 0, 'completed': 0, 'failed': 0,
+            'skipped': 0, 'retries': 0, 'elapsed': 0.0,
+        }
+        start = time.monotonic()
+        results = {}
+        
+        def _record(file_path: Path, status: str, duration: float = 0.0, retries_used: int = 0) -> None:
+            metrics['processed'] += 1
+            metrics[{'done': 'completed', 'failed': 'failed', 'skipped': 'skipped'}[status]] += 1
+            metrics['retries'] += retries_used
+            metrics['elapsed'] = time.monotonic() - start
+            if progress_callback is not None:
+                progress_callback(dict(metrics, file=file_path.name, status=status, duration=duration))
+        
+        def _finish(file_path: Path, outcome: Dict[str, Any]) -> None:
+            if outcome['error'] is not None:
+                logger.error(f"Error processing {file_path}: {outcome['error']}")
+                results[file_path.name] = {'error': outcome['error']}
+                status = 'failed'
+            else:
+                results[file_path.name] = outcome['results']
+                if all(path is not None for path in outcome['results'].values()):
+                    manifest.mark_done(file_path, outcome['results'])
+                    status = 'done'
+                else:
+                    status = 'failed'
+            _record(file_path, status, outcome['duration'], outcome['retries'])
+        
+        pending = []
+        for file_path in files:
+            finished = manifest.get_finished(file_path) if resume else None
+            if finished is not None:
+                results[file_path.name] = finished
+                _record(file_path, 'skipped')
+            else:
+                pending.append(file_path)
+        
+        job_args = (timeout, retries, retry_delay, kwargs)
+        if max_workers == 1 or len(pending) <= 1:
+            for file_path in pending:
+                _finish(file_path, _run_batch_job(file_path, output_dir / file_path.stem, *job_args))
+        else:
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+            
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(_run_batch_job, file_path, output_dir / file_path.stem, *job_args): file_path
+                    for file_path in pending
+                }
+                for future in as_completed(futures):
+                    file_path = futures[future]
+                    try:
+                        outcome = future.result()
+                    except Exception as e:
+                        outcome = {'results': None, 'error': str(e), 'retries': 0, 'duration': 0.0}
+                    _finish(file_path, outcome)
+        
+        return {file_path.name: results[file_path.name] for file_path in files}
+
+
+BATCH_MANIFEST_NAME = '.epy_docs_batch.json'
+
+
+def _run_batch_job(input_path: Path, output_dir: Path, timeout: Optional[float],
+                   retries: int, retry_delay: float, options: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert and render one batch file (runs in a worker process or inline).
+    
+    Returns:
+        Dictionary with 'results', 'error' (None on success), 'retries' and 'duration'
+    """
+    start = time.monotonic()
+    deadline = start + timeout if timeout is not None else None
+    options = dict(options)
+    layout_name = options.pop('layout_name', 'classic')
+    document_type = options.pop('document_type', 'article')
+    output_formats = options.pop('output_formats', None) or ['pdf', 'html']
+    
+    try:
+        qmd_path = _processor._convert_document(input_path, output_dir, layout_name,
+                                                document_type, output_formats, **options)
+        results, retries_used = _processor._render_formats_with_retries(
+            qmd_path, output_formats, retries=retries, retry_delay=retry_delay, deadline=deadline
+        )
+    except Exception as e:
+        return {'results': None, 'error': str(e), 'retries': 0, 'duration': time.monotonic() - start}
+    
+    return {'results': results, 'error': None, 'retries': retries_used, 'duration': time.monotonic() - start}
+
+
+def get_batch_environment_fingerprint() -> str:
+    """Hash the configuration a batch render depends on besides its options.
+    
+    Covers every file under the package config directory (layouts, document
+    types, colors, templates, fonts, bibliography) by path, size and mtime,
+    the package version and the installed Quarto version.
+    
+    Returns:
+        Hex digest; any change invalidates a resumable batch manifest
+    """
+    from ePy_docs.core._config import ModularConfigLoader
+    from ePy_docs.core._quarto import get_quarto_version
+    import ePy_docs
+    
+    config_dir = ModularConfigLoader().config_dir
+    digest = hashlib.sha256()
+    digest.update(f"{getattr(ePy_docs, '__version__', '')}\0{get_quarto_version()}\0".encode('utf-8'))
+    for path in sorted(p for p in config_dir.rglob('*') if p.is_file()):
+        stat = path.stat()
+        digest.update(f"{path.relative_to(config_dir).as_posix()}\0{stat.st_size}\0{stat.st_mtime_ns}\0".encode('utf-8'))
+    return digest.hexdigest()
+
+
+class BatchManifest:
+    """
+    SOLID: Single Responsibility - Record of finished batch files.
+    
+    A JSON file in the batch output directory maps each finished file name to
+    its source signature (mtime, size), a hash of the batch settings and
+    configuration fingerprint, and the rendered outputs. It is rewritten atomically after every finished file,
+    so it survives a crash mid-batch.
+    """
+    
+    VERSION = 1
+    
+    def __init__(self, path: Path, settings: Dict[str, Any], environment: str = ''):
+        """Initialize manifest.
+        
+        Args:
+            path: Manifest file path
+            settings: Batch options; a change invalidates every recorded file
+            environment: Configuration fingerprint (see get_batch_environment_fingerprint);
+                a change invalidates every recorded file
+        """
+        self.path = path
+        self.settings_hash = hashlib.sha256(
+            json.dumps([settings, environment], sort_keys=True, default=str).encode('utf-8')
+        ).hexdigest()
+        self._entries = self._load()
+    
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('version') != self.VERSION:
+            return {}
+        entries = data.get('files')
+        return entries if isinstance(entries, dict) else {}
+    
+    @staticmethod
+    def _signature(file_path: Path) -> Dict[str, int]:
+        stat = file_path.stat()
+        return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+    
+    def get_finished(self, file_path: Path) -> Optional[Dict[str, Path]]:
+        """Return recorded results if file_path is finished and unchanged, else None."""
+        entry = self._entries.get(file_path.name)
+        if not entry or entry.get('settings') != self.settings_hash:
+            return None
+        try:
+            if entry.get('source') != self._signature(file_path):
+                return None
+        except OSError:
+            return None
+        
+        outputs = {fmt: Path(path) for fmt, path in entry.get('outputs', {}).items()}
+        if not outputs or not all(path.exists() for path in outputs.values()):
+            return None
+        return outputs
+    
+    def mark_done(self, file_path: Path, results: Dict[str, Path]) -> None:
+        """Record file_path as finished and persist the manifest."""
+        self._entries[file_path.name] = {
+            'source': self._signature(file_path),
+            'settings': self.settings_hash,
+            'outputs': {fmt: str(Path(path).resolve()) for fmt, path in results.items()},
+        }
+        self._save()
+    
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': self.VERSION, 'files': self._entries}, f, indent=2)
+        os.replace(tmp_path, self.path)
 
 
 # Global internal instances for other modules to access
@@ -0,0 +1,236 @@
+"""Reusable matplotlib figures and memory-driven garbage collection.
+
+Table rendering used to create a pyplot figure per table and run a full
+gc.collect() after each one. Instead:
+
+- FigurePool: Hands out cleared and resized Figure/Axes pairs and takes
+  them back after saving. Figures are created outside pyplot, so they are
+  never registered with the pyplot figure manager.
+- MemoryWatermark: Runs gc.collect() only when the resident set size has
+  grown by more than a watermark since the last collection (or every N
+  checks where RSS cannot be read).
+
+Pool size comes from EPY_DOCS_FIGURE_POOL (default 4; 0 disables reuse) and
+the watermark from EPY_DOCS_GC_WATERMARK_MB (default 256).
+"""
+
+import gc
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_WATERMARK_MB = 256
+FALLBACK_COLLECT_INTERVAL = 100  # checks between collections when RSS is unavailable
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read a non-negative integer environment variable."""
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got '{value}'")
+    if number < 0:
+        raise ValueError(f"{name} must be >= 0, got {number}")
+    return number
+
+
+def current_rss() -> Optional[int]:
+    """Resident set size of this process in bytes (None if it cannot be read)."""
+    if sys.platform.startswith('linux'):
+        try:
+            with open('/proc/self/statm') as f:
+                return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+        except (OSError, ValueError, IndexError):
+            pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except Exception:
+        return None
+
+
+# ============================================================================
+# MEMORY WATERMARK
+# ============================================================================
+
+class MemoryWatermark:
+    """
+    SOLID: Single Responsibility - Decide when a full garbage collection pays off.
+
+    check() is called after each render. It collects when RSS exceeds the
+    level measured after the previous collection by more than the
+    watermark; that level is then re-measured, so memory the allocator keeps
+    does not trigger a collection on every check.
+    """
+
+    def __init__(self, watermark_mb: Optional[int] = None):
+        """Initialize policy.
+
+        Args:
+            watermark_mb: Growth in MiB that triggers a collection
+                (None = EPY_DOCS_GC_WATERMARK_MB, default 256; 0 collects on every check)
+        """
+        self._lock = threading.Lock()
+        self.configure(watermark_mb)
+
+    def configure(self, watermark_mb: Optional[int] = None) -> None:
+        """Set the watermark and reset the baseline and statistics."""
+        if watermark_mb is None:
+            watermark_mb = _env_int('EPY_DOCS_GC_WATERMARK_MB', DEFAULT_WATERMARK_MB)
+        if watermark_mb < 0:
+            raise ValueError(f"watermark_mb must be >= 0, got {watermark_mb}")
+        with self._lock:
+            self.watermark_mb = watermark_mb
+            self._baseline = current_rss()
+            self._checks_since_collect = 0
+            self._stats = {'checks': 0, 'collections': 0}
+
+    def check(self) -> bool:
+        """Collect garbage if memory grew past the watermark.
+
+        Returns:
+            True if a collection ran
+        """
+        with self._lock:
+            self._stats['checks'] += 1
+            self._checks_since_collect += 1
+            rss = current_rss()
+            if rss is None or self._baseline is None:
+                due = self._checks_since_collect >= FALLBACK_COLLECT_INTERVAL
+            else:
+                due = rss - self._baseline > self.watermark_mb * 1024 * 1024
+            if not due:
+                return False
+
+            gc.collect()
+            self._baseline = current_rss()
+            self._checks_since_collect = 0
+            self._stats['collections'] += 1
+            return True
+
+    def stats(self) -> Dict[str, int]:
+        """Counters: checks and collections."""
+        with self._lock:
+            return dict(self._stats)
+
+
+# ============================================================================
+# FIGURE POOL
+# ============================================================================
+
+class FigurePool:
+    """
+    SOLID: Single Responsibility - Reuse matplotlib Figure/Axes objects.
+
+    acquire() returns a figure reset to the current rcParams defaults with a
+    single fresh Axes; release() clears it and keeps up to max_size figures
+    for later renders. Thread-safe; a figure belongs to one caller between
+    acquire() and release().
+    """
+
+    def __init__(self, max_size: Optional[int] = None):
+        """Initialize pool.
+
+        Args:
+            max_size: Figures kept for reuse (None = EPY_DOCS_FIGURE_POOL, default 4; 0 disables reuse)
+        """
+        self._lock = threading.Lock()
+        self._idle: List = []
+        self.configure(max_size)
+
+    def configure(self, max_size: Optional[int] = None) -> None:
+        """Set the pool size, dropping idle figures, and reset statistics."""
+        if max_size is None:
+            max_size = _env_int('EPY_DOCS_FIGURE_POOL', DEFAULT_POOL_SIZE)
+        if max_size < 0:
+            raise ValueError(f"max_size must be >= 0, got {max_size}")
+        with self._lock:
+            self.max_size = max_size
+            self._idle.clear()
+            self._stats = {'created': 0, 'reused': 0, 'released': 0}
+
+    def acquire(self, figsize: Tuple[float, float]):
+        """Get a figure of the given size with one Axes.
+
+        Args:
+            figsize: (width, height) in inches
+
+        Returns:
+            (Figure, Axes) tuple
+        """
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        with self._lock:
+            fig = self._idle.pop() if self._idle else None
+            self._stats['reused' if fig is not None else 'created'] += 1
+
+        if fig is None:
+            fig = Figure(figsize=figsize)
+        else:
+            self._reset(fig, figsize)
+        FigureCanvasAgg(fig)
+        return fig, fig.add_subplot()
+
+    def release(self, fig) -> None:
+        """Return a figure to the pool (or discard it when the pool is full)."""
+        from matplotlib.backend_bases import FigureCanvasBase
+
+        fig.clear()
+        # Drop the Agg canvas and its cached renderer buffer while idle
+        FigureCanvasBase(fig)
+        with self._lock:
+            self._stats['released'] += 1
+            if len(self._idle) < self.max_size:
+                self._idle.append(fig)
+
+    @contextmanager
+    def figure(self, figsize: Tuple[float, float]) -> Iterator[Tuple]:
+        """Context manager around acquire()/release()."""
+        fig, ax = self.acquire(figsize)
+        try:
+            yield fig, ax
+        finally:
+            self.release(fig)
+
+    def stats(self) -> Dict[str, int]:
+        """Counters: figures created, reused and released, and figures idle."""
+        with self._lock:
+            return dict(self._stats, idle=len(self._idle))
+
+    @staticmethod
+    def _reset(fig, figsize: Tuple[float, float]) -> None:
+        """Restore the figure-level state a new Figure would get from rcParams."""
+        from matplotlib import rcParams
+
+        fig.set_dpi(rcParams['figure.dpi'])
+        fig.set_size_inches(figsize, forward=False)
+        fig.set_facecolor(rcParams['figure.facecolor'])
+        fig.set_edgecolor(rcParams['figure.edgecolor'])
+        fig.set_frameon(rcParams['figure.frameon'])
+        fig.subplotpars.update(**{
+            name: rcParams[f'figure.subplot.{name}']
+            for name in ('left', 'right', 'bottom', 'top', 'wspace', 'hspace')
+        })
+        fig.set_layout_engine(None)
+
+
+_figure_pool = FigurePool()
+_memory_watermark = MemoryWatermark()
+
+
+def get_figure_pool() -> FigurePool:
+    """Return the process-wide figure pool."""
+    return _figure_pool
+
+
+def get_memory_watermark() -> MemoryWatermark:
+    """Return the process-wide garbage collection policy."""
+    return _memory_watermark
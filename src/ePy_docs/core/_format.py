@@ -5,6 +5,7 @@ SOLID-compliant module with specialized classes:
 - FormatValidator: Input validation and sanitization
 - TextProcessor: Core text processing and wrapping
 - SuperscriptFormatter: Specialized superscript handling  
+- CompiledSuperscriptFormatter: Single-pass superscript replacement, cached per layout/format
 - ContentGenerator: Document content generation utilities
 
 Version: 4.0.0 - Zero hardcoding, fail-fast validation
@@ -12,8 +13,13 @@ Version: 4.0.0 - Zero hardcoding, fail-fast validation
 
 import re
 import textwrap
-from typing import Dict, Any, Optional, List
-import pandas as pd
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple, TYPE_CHECKING
+
+from ePy_docs.core._lazy import is_na
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 # ============================================================================
@@ -23,8 +29,9 @@ import pandas as pd
 class FormatConfig:
     """Centralized format configuration management with strict validation."""
     
-    def __init__(self):
+    def __init__(self, layout_name: Optional[str] = None):
         self._config = None
+        self._layout_name = layout_name
     
     @property
     def config(self) -> Dict[str, Any]:
@@ -39,7 +46,7 @@ class FormatConfig:
         if self._config is None:
             from ePy_docs.core._config import get_config_section
             
-            self._config = get_config_section('format')
+            self._config = get_config_section('format', self._layout_name)
             
             if not self._config:
                 raise ValueError(
@@ -174,7 +181,7 @@ class FormatValidator:
     @staticmethod
     def sanitize_text(text: Any) -> str:
         """Convert input to string and sanitize."""
-        if text is None or pd.isna(text):
+        if text is None or is_na(text):
             return ""
         
         # Handle pandas Series (defensive programming)
@@ -190,8 +197,9 @@ class FormatValidator:
         return text_lower in missing_indicators
     
     @staticmethod
-    def validate_dataframe(df: pd.DataFrame) -> None:
+    def validate_dataframe(df: 'pd.DataFrame') -> None:
         """Validate DataFrame input."""
+        import pandas as pd
         if not isinstance(df, pd.DataFrame):
             raise TypeError(f"Expected pandas DataFrame, got {type(df).__name__}")
         
@@ -265,7 +273,7 @@ class TextProcessor:
         
         return self.wrap_text(text)
     
-    def process_dataframe_content(self, df: pd.DataFrame) -> pd.DataFrame:
+    def process_dataframe_content(self, df: 'pd.DataFrame') -> 'pd.DataFrame':
         """Process DataFrame content with text wrapping and cleaning.
         
         Args:
@@ -303,6 +311,77 @@ class TextProcessor:
 # SPECIALIZED FORMATTING
 # ============================================================================
 
+class CompiledSuperscriptFormatter:
+    """Superscript mapping compiled into a single alternation regex.
+    
+    Patterns are tried longest first, so ``^10`` wins over ``^1`` and every
+    string is processed in one pass regardless of the mapping size.
+    """
+    
+    __slots__ = ('mapping', '_pattern', '_trigger')
+    
+    def __init__(self, mapping: Dict[str, str]):
+        self.mapping = dict(mapping)
+        patterns = sorted((p for p in self.mapping if p), key=len, reverse=True)
+        self._pattern = re.compile('|'.join(map(re.escape, patterns))) if patterns else None
+        
+        # Cheap pre-check: skip the regex when the shared lead character is absent
+        leads = {p[0] for p in patterns}
+        self._trigger = leads.pop() if len(leads) == 1 else None
+    
+    def replace(self, text: str) -> str:
+        """Replace all superscript patterns in text in a single pass."""
+        if self._pattern is None or not text:
+            return text
+        if self._trigger is not None and self._trigger not in text:
+            return text
+        return self._pattern.sub(lambda match: self.mapping[match.group(0)], text)
+    
+    def format(self, text: Any) -> str:
+        """Sanitize text and replace superscripts (as SuperscriptFormatter.format_superscripts)."""
+        text = FormatValidator.sanitize_text(text)
+        return self.replace(text) if text else text
+
+
+@lru_cache(maxsize=64)
+def _build_superscript_formatter(output_format: str,
+                                 layout_name: Optional[str]) -> Tuple[Optional[CompiledSuperscriptFormatter], str]:
+    """Build (and memoize) a compiled formatter, or the reason it is unavailable."""
+    try:
+        mapping = FormatConfig(layout_name).get_superscript_config(output_format)
+    except Exception as e:
+        return None, str(e)
+    return CompiledSuperscriptFormatter(mapping), ''
+
+
+def get_superscript_formatter(output_format: str = 'matplotlib',
+                              layout_name: Optional[str] = None) -> CompiledSuperscriptFormatter:
+    """Get the compiled superscript formatter for a layout and output format.
+    
+    Formatters (and configuration failures) are cached with LRU eviction;
+    call clear_superscript_cache() after changing configuration files.
+    
+    Args:
+        output_format: Target output format ('matplotlib', 'html', 'latex')
+        layout_name: Layout name (None = default layout)
+        
+    Returns:
+        Compiled formatter
+        
+    Raises:
+        ValueError: If the format configuration is missing or invalid
+    """
+    formatter, error = _build_superscript_formatter(output_format, layout_name)
+    if formatter is None:
+        raise ValueError(error)
+    return formatter
+
+
+def clear_superscript_cache() -> None:
+    """Discard compiled superscript formatters."""
+    _build_superscript_formatter.cache_clear()
+
+
 class SuperscriptFormatter:
     """Specialized superscript handling with caching."""
     
@@ -327,18 +406,13 @@ class SuperscriptFormatter:
         if not text:
             return text
         
-        # Use cached configuration
+        # Use cached compiled configuration
         if output_format not in self._cache:
-            self._cache[output_format] = self.config.get_superscript_config(output_format)
-        
-        superscript_config = self._cache[output_format]
-        
-        # Apply mappings
-        result_text = text
-        for pattern, replacement in superscript_config.items():
-            result_text = result_text.replace(pattern, replacement)
+            self._cache[output_format] = CompiledSuperscriptFormatter(
+                self.config.get_superscript_config(output_format)
+            )
         
-        return result_text
+        return self._cache[output_format].replace(text)
     
     def format_table_cell_text(self, text: str, output_format: str = 'matplotlib') -> str:
         """Format table cell text with superscripts and citations.
@@ -1,7 +1,7 @@
 """HTML generation utilities for ePy_docs.
 
 SOLID-compliant HTML and CSS generation with specialized classes:
-- CacheManager: Caching for HTML and CSS generation
+- CacheManager: Caching for HTML and CSS generation (memory + user cache dir)
 - ThemeResolver: Theme resolution and configuration  
 - TemplateProcessor: CSS template processing
 - CssGenerator: CSS content generation
@@ -9,17 +9,42 @@ SOLID-compliant HTML and CSS generation with specialized classes:
 Version: 3.0.0 - Zero hardcoding, zero wrappers, fail-fast validation
 """
 
+import hashlib
+import json
+import os
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
 
 class CacheManager:
-    """Manages caching for HTML and CSS generation with efficient storage."""
+    """Manages caching for HTML and CSS generation with efficient storage.
     
-    def __init__(self):
-        """Initialize cache manager with empty storage."""
+    CSS can also be persisted under the user cache directory (one file per
+    key) so other processes reuse it; only content-hashed keys should be
+    persisted. Disable the persistent layer with EPY_DOCS_CSS_CACHE=0.
+    """
+    
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """Initialize cache manager with empty storage.
+        
+        Args:
+            cache_dir: Directory for persisted CSS (None = user cache directory)
+        """
         self._html_cache: Dict[str, Dict[str, Any]] = {}
         self._css_cache: Dict[str, str] = {}
+        self._css_dir = Path(cache_dir) if cache_dir else None
+        self.persist_css = os.environ.get('EPY_DOCS_CSS_CACHE', '1').lower() not in ('0', 'false', 'no', 'off')
+        self.css_hits = 0
+        self.css_disk_hits = 0
+        self.css_misses = 0
+    
+    @property
+    def css_dir(self) -> Path:
+        """Directory holding persisted CSS files."""
+        if self._css_dir is None:
+            from ePy_docs.core._paths import get_cache_directory
+            self._css_dir = get_cache_directory('css')
+        return self._css_dir
     
     def get_html_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
         """Retrieve HTML configuration from cache."""
@@ -30,18 +55,72 @@ class CacheManager:
         """Store HTML configuration in cache."""
         self._html_cache[cache_key] = config
     
-    def get_css_cache(self, cache_key: str) -> Optional[str]:
-        """Retrieve CSS content from cache."""
-        return self._css_cache.get(cache_key)
-    
-    def set_css_cache(self, cache_key: str, css_content: str) -> None:
-        """Store CSS content in cache."""
+    def get_css_cache(self, cache_key: str, persistent: bool = False) -> Optional[str]:
+        """Retrieve CSS content from cache.
+        
+        Args:
+            cache_key: Cache key
+            persistent: Also look in the persistent CSS directory
+        """
+        css_content = self._css_cache.get(cache_key)
+        if css_content is not None:
+            self.css_hits += 1
+            return css_content
+        
+        if persistent and self.persist_css:
+            try:
+                with open(self.css_dir / f"{cache_key}.css", 'r', encoding='utf-8', newline='') as f:
+                    css_content = f.read()
+            except (OSError, UnicodeDecodeError):
+                css_content = None
+            if css_content is not None:
+                self.css_disk_hits += 1
+                self._css_cache[cache_key] = css_content
+                return css_content
+        
+        self.css_misses += 1
+        return None
+    
+    def set_css_cache(self, cache_key: str, css_content: str, persistent: bool = False) -> None:
+        """Store CSS content in cache.
+        
+        Args:
+            cache_key: Cache key
+            css_content: CSS content
+            persistent: Also write it to the persistent CSS directory
+        """
         self._css_cache[cache_key] = css_content
-    
-    def clear_cache(self) -> None:
-        """Clear all cached content."""
+        if persistent and self.persist_css:
+            # Atomic write; failures only cost the speed-up
+            css_path = self.css_dir / f"{cache_key}.css"
+            try:
+                css_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = css_path.with_name(f"{css_path.name}.{os.getpid()}.tmp")
+                with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+                    f.write(css_content)
+                os.replace(tmp_path, css_path)
+            except OSError:
+                pass
+    
+    def clear_cache(self, persistent: bool = False) -> None:
+        """Clear all cached content.
+        
+        Args:
+            persistent: Also delete persisted CSS files
+        """
         self._html_cache.clear()
         self._css_cache.clear()
+        if persistent and self.css_dir.exists():
+            for css_path in self.css_dir.glob('*.css'):
+                try:
+                    css_path.unlink()
+                except OSError:
+                    pass
+    
+    def stats(self) -> Dict[str, int]:
+        """CSS cache counters."""
+        return {'hits': self.css_hits, 'disk_hits': self.css_disk_hits,
+                'misses': self.css_misses, 'entries': len(self._css_cache)}
 
 
 class ThemeResolver:
@@ -403,7 +482,81 @@ def get_html_config(layout_name: str, document_type: str = 'report') -> Dict[str
     return base_config
 
 
+# Bump when the generated CSS changes for the same configuration
+CSS_CACHE_VERSION = 1
+
+_css_cache = CacheManager()
+_css_keys: Dict[str, tuple] = {}
+
+
+def get_css_cache() -> CacheManager:
+    """Return the process-wide CSS cache."""
+    return _css_cache
+
+
+def css_cache_key(layout_name: str) -> str:
+    """Content hash of everything generate_css() reads for a layout.
+    
+    Covers the resolved layout, its colors and the callouts configuration,
+    plus the package version and this module's modification time. Computed
+    once per compiled layout object (reload_layout() yields a new one).
+    
+    Args:
+        layout_name: Layout style name
+        
+    Returns:
+        Hex digest usable as a persistent cache key
+    """
+    from ePy_docs.core._config import compile_layout, get_layout_colors, get_config_section
+    from ePy_docs.core._layout import thaw
+    import ePy_docs
+    
+    compiled = compile_layout(layout_name)
+    memo = _css_keys.get(layout_name)
+    if memo is not None and memo[0] is compiled:
+        return memo[1]
+    
+    payload = json.dumps([
+        CSS_CACHE_VERSION,
+        getattr(ePy_docs, '__version__', ''),
+        Path(__file__).stat().st_mtime_ns,
+        layout_name,
+        thaw(compiled.raw),
+        get_layout_colors(layout_name),
+        get_config_section('callouts'),
+    ], sort_keys=True, default=str)
+    key = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    _css_keys[layout_name] = (compiled, key)
+    return key
+
+
+def clear_css_cache(persistent: bool = False) -> None:
+    """Forget generated CSS (and persisted CSS files if persistent)."""
+    _css_keys.clear()
+    _css_cache.clear_cache(persistent)
+
+
 def generate_css(layout_name: str) -> str:
+    """Generate CSS content for a layout, using the content-hashed CSS cache.
+    
+    The stylesheet is looked up by css_cache_key() in memory, then in the
+    user cache directory, and only built when neither has it.
+    
+    Args:
+        layout_name: Layout style name
+        
+    Returns:
+        CSS content as string
+    """
+    cache_key = css_cache_key(layout_name)
+    css_content = _css_cache.get_css_cache(cache_key, persistent=True)
+    if css_content is None:
+        css_content = _build_layout_css(layout_name)
+        _css_cache.set_css_cache(cache_key, css_content, persistent=True)
+    return css_content
+
+
+def _build_layout_css(layout_name: str) -> str:
     """Generate CSS content dynamically from layout configuration.
     
     Generates complete CSS based on:
@@ -421,14 +574,14 @@ def generate_css(layout_name: str) -> str:
         CSS content as string
     """
     from ePy_docs.core._config import (
-        load_layout, 
+        compile_layout, 
         get_layout_colors, 
         get_font_css_config,
         get_config_section
     )
     
-    # Load layout
-    layout = load_layout(layout_name, resolve_refs=True)
+    # Compiled layout (fonts resolved once per layout)
+    fonts = compile_layout(layout_name).fonts
     
     # Get colors from palette
     palette_colors = get_layout_colors(layout_name)
@@ -436,24 +589,17 @@ def generate_css(layout_name: str) -> str:
     # Get font CSS for custom fonts
     font_css = get_font_css_config(layout_name)
     
-    # Get font configuration from embedded font_families
-    font_family_value = layout.get('font_family', 'default')
-    
-    # Resolve font family from embedded configuration
-    if isinstance(font_family_value, dict):
-        font_config = font_family_value
-    else:
-        font_families = layout.get('font_families', {})
-        font_config = font_families.get(font_family_value, {})
-        if not font_config:
-            # Fallback to default if not found
-            font_config = font_families.get('default', {'primary': 'Calibri', 'fallback': ['Arial', 'sans-serif']})
+    # Font configuration from embedded font_families
+    font_config = fonts.family_config
+    if not font_config:
+        # Fallback to default if not found
+        font_config = fonts.families.get('default', {'primary': 'Calibri', 'fallback': ['Arial', 'sans-serif']})
     
     primary_font = font_config.get('primary', 'Calibri')
     
     # Get fallback fonts - handle both list and string formats
     fallback_fonts = font_config.get('fallback', ['Arial', 'sans-serif'])
-    if isinstance(fallback_fonts, list):
+    if isinstance(fallback_fonts, (list, tuple)):
         # Join list with commas
         fallback_font = ', '.join(fallback_fonts)
     else:
@@ -0,0 +1,158 @@
+"""Per-format image output for rendered tables and plots.
+
+Tables and plots are always saved as PNG. In 'vector' mode the same drawn
+figure is also saved as SVG (used by HTML output) and PDF (used by LaTeX
+output), and the generated markdown selects the file per output format with
+Quarto conditional content. Other formats (DOCX, ...) keep the PNG.
+
+Select the mode with EPY_DOCS_IMAGE_OUTPUT: 'raster' (PNG only; default) or
+'vector' (PNG + SVG + PDF).
+"""
+
+import os
+from pathlib import Path
+from typing import Callable, Dict, Tuple, Union
+
+from ePy_docs.core._paths import write_creating_parent
+
+
+IMAGE_OUTPUT_MODES = ('raster', 'vector')
+RASTER_FORMATS = ('png',)
+VECTOR_FORMATS = ('png', 'svg', 'pdf')
+IMAGE_EXTENSIONS = VECTOR_FORMATS
+
+# Vector variant -> Quarto format alias it is shown in
+VECTOR_TARGETS = {'svg': 'html', 'pdf': 'latex'}
+
+
+def validate_image_output(mode: str) -> str:
+    """Normalize an image output mode, raising ValueError if unknown."""
+    mode = str(mode).lower()
+    if mode not in IMAGE_OUTPUT_MODES:
+        raise ValueError(f"Unknown image output mode '{mode}'. Use one of: {', '.join(IMAGE_OUTPUT_MODES)}")
+    return mode
+
+
+class ImageOutputPolicy:
+    """
+    SOLID: Single Responsibility - Decide which image formats are written.
+
+    Process-wide, like the table image cache: worker processes receive the
+    resolved formats with each render instead of reading this object.
+    """
+
+    def __init__(self, mode: str = None):
+        """Initialize policy.
+
+        Args:
+            mode: 'raster' or 'vector' (None = EPY_DOCS_IMAGE_OUTPUT, default 'raster')
+
+        Raises:
+            ValueError: If mode is unknown
+        """
+        self.configure(mode or os.environ.get('EPY_DOCS_IMAGE_OUTPUT', 'raster'))
+
+    def configure(self, mode: str) -> None:
+        """Change the output mode."""
+        self.mode = validate_image_output(mode)
+
+    @property
+    def formats(self) -> Tuple[str, ...]:
+        """Formats written for each figure; the PNG always comes first."""
+        return VECTOR_FORMATS if self.mode == 'vector' else RASTER_FORMATS
+
+
+_image_output_policy = ImageOutputPolicy()
+
+
+def get_image_output_policy() -> ImageOutputPolicy:
+    """Return the process-wide image output policy."""
+    return _image_output_policy
+
+
+# ============================================================================
+# SAVING
+# ============================================================================
+
+def variant_path(image_path: Union[str, Path], fmt: str) -> Path:
+    """Path of the `fmt` variant saved next to a PNG."""
+    return Path(image_path).with_suffix(f'.{fmt}')
+
+
+def save_figure(fig, output_path: Union[str, Path], formats: Tuple[str, ...] = RASTER_FORMATS,
+                **savefig_kwargs) -> str:
+    """Save a figure as PNG plus any other requested formats.
+
+    With several formats and bbox_inches='tight', the figure is drawn once
+    and its tight bounding box is reused by every savefig call, so all
+    variants share the same crop and only the backend output is repeated.
+    Existing files are removed first: earlier versions hardlinked them to cache entries.
+    A missing output directory is created on the first failed save.
+
+    Args:
+        fig: Matplotlib figure
+        output_path: PNG path; other formats use the same name and directory
+        formats: Formats to write (see ImageOutputPolicy.formats)
+        **savefig_kwargs: Arguments for Figure.savefig
+
+    Returns:
+        Path of the PNG as a string
+    """
+    targets = [variant_path(output_path, fmt) for fmt in formats]
+    for target in targets:
+        if target.exists():
+            target.unlink()
+
+    if len(targets) > 1 and savefig_kwargs.get('bbox_inches') == 'tight':
+        import matplotlib
+        pad_inches = savefig_kwargs.pop('pad_inches', None)
+        if not isinstance(pad_inches, (int, float)):
+            pad_inches = matplotlib.rcParams['savefig.pad_inches']
+            if not isinstance(pad_inches, (int, float)):
+                pad_inches = 0.1
+        fig.canvas.draw()
+        renderer = fig.canvas.get_renderer()
+        savefig_kwargs['bbox_inches'] = fig.get_tightbbox(renderer).padded(pad_inches)
+
+    for target in targets:
+        write_creating_parent(target, lambda: fig.savefig(target, **savefig_kwargs))
+
+    return str(variant_path(output_path, 'png'))
+
+
+# ============================================================================
+# MARKDOWN
+# ============================================================================
+
+def conditional_image_markdown(build: Callable[[str], str], rel_path: str,
+                               formats: Tuple[str, ...] = RASTER_FORMATS) -> str:
+    """Markdown that references the best image variant for each output format.
+
+    Args:
+        build: Returns the image markdown for a relative image path
+        rel_path: Relative path of the PNG
+        formats: Formats that were saved for the image
+
+    Returns:
+        build(rel_path) for PNG-only output; otherwise one Quarto
+        '.content-visible' block per vector variant and a PNG block hidden
+        in the formats those variants cover
+    """
+    vector_formats = [fmt for fmt in formats if fmt in VECTOR_TARGETS]
+    if not vector_formats:
+        return build(rel_path)
+
+    png_path = Path(rel_path)
+    blocks = []
+    for fmt in vector_formats:
+        path = png_path.with_suffix(f'.{fmt}').as_posix()
+        blocks.append(f'::: {{.content-visible when-format="{VECTOR_TARGETS[fmt]}"}}\n{build(path)}\n:::')
+
+    # Raster fallback, nested so it is hidden in every vector target
+    fallback = build(png_path.as_posix())
+    for depth, fmt in enumerate(reversed(vector_formats)):
+        fence = ':' * (3 + depth)
+        fallback = f'{fence} {{.content-hidden when-format="{VECTOR_TARGETS[fmt]}"}}\n{fallback}\n{fence}'
+    blocks.append(fallback)
+
+    return '\n\n'.join(blocks)
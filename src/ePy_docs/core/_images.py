@@ -4,10 +4,226 @@ Provides unified image handling, plot generation, and markdown creation
 with centralized configuration management and intelligent caching.
 """
 
-from typing import Tuple, List, Optional, Dict, Any, Union
+from typing import Tuple, List, Optional, Dict, Any, Union, Callable
 from pathlib import Path
-import shutil
+import os
+import threading
 from ePy_docs.core._data import TableDimensionCalculator
+from ePy_docs.core._lazy import ensure_matplotlib
+from ePy_docs.core._paths import write_creating_parent
+from ePy_docs.core._assets import stage_asset
+from ePy_docs.core._figures import get_memory_watermark
+from ePy_docs.core._image_output import (
+    RASTER_FORMATS, conditional_image_markdown, get_image_output_policy, save_figure
+)
+
+
+class FontRegistry:
+    """Process-wide registry of matplotlib fonts and per-layout font lists.
+    
+    Package fonts are added to matplotlib's existing FontManager once, font
+    lists are resolved once per layout, and rcParams are only written when the
+    active layout changes. The FontManager itself is never rebuilt, which
+    would rescan every system font.
+    """
+    
+    FONT_EXTENSIONS = ('.ttf', '.otf')
+    
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._package_fonts_registered = False
+        self._registered_files = set()
+        self._font_lists: Dict[str, List[str]] = {}
+        self._active_layout = None
+        self._stats = {
+            'font_files_registered': 0,
+            'font_list_hits': 0,
+            'font_list_misses': 0,
+            'rcparams_updates': 0,
+            'rcparams_skipped': 0,
+            'rebuilds_avoided': 0,
+        }
+    
+    @staticmethod
+    def get_package_fonts_dir() -> Path:
+        """Directory holding the fonts shipped with the package."""
+        return Path(__file__).parent.parent / 'config' / 'assets' / 'fonts'
+    
+    def register_font_file(self, font_path: Union[str, Path]) -> bool:
+        """Add a font file to matplotlib's FontManager (once per file).
+        
+        Args:
+            font_path: Path to a .ttf/.otf font file
+            
+        Returns:
+            True if the font is available to matplotlib
+        """
+        import matplotlib.font_manager as fm
+        
+        font_path = os.fsdecode(font_path)
+        with self._lock:
+            if font_path in self._registered_files:
+                return True
+            
+            # Fonts added elsewhere (e.g. at package import) are not added twice
+            if not any(entry.fname == font_path for entry in fm.fontManager.ttflist):
+                try:
+                    fm.fontManager.addfont(font_path)
+                except AttributeError:
+                    # addfont() appends the font and then clears the lookup cache
+                    # through the instance attribute, which ePy_docs wraps at import
+                    pass
+                except (OSError, RuntimeError, ValueError):
+                    return False
+                
+                # Drop cached lookups so the new family can be found
+                cache_clear = getattr(fm.FontManager._findfont_cached, 'cache_clear', None)
+                if cache_clear is not None:
+                    cache_clear()
+                self._stats['font_files_registered'] += 1
+            
+            self._registered_files.add(font_path)
+            return True
+    
+    def register_package_fonts(self) -> int:
+        """Register every font in config/assets/fonts (only the first call does work).
+        
+        Returns:
+            Number of package font files available to matplotlib
+        """
+        with self._lock:
+            if not self._package_fonts_registered:
+                self._package_fonts_registered = True
+                fonts_dir = self.get_package_fonts_dir()
+                if fonts_dir.exists():
+                    for font_file in sorted(fonts_dir.iterdir()):
+                        if font_file.suffix.lower() in self.FONT_EXTENSIONS:
+                            self.register_font_file(font_file)
+            return len(self._registered_files)
+    
+    def register_font(self, font_name: str) -> bool:
+        """Make a font family available to matplotlib by name.
+        
+        Looks for {font_name}.otf in the package fonts folder and, on Windows,
+        for common file names in the system fonts folder.
+        
+        Args:
+            font_name: Font family name from the layout configuration
+            
+        Returns:
+            True if a font file was registered for the name
+        """
+        self.register_package_fonts()
+        
+        font_file = self.get_package_fonts_dir() / f"{font_name}.otf"
+        if font_file.exists():
+            return self._note_rebuild_avoided(self.register_font_file(font_file))
+        
+        if os.name == 'nt':
+            import matplotlib.font_manager as fm
+            windows_fonts_dir = Path(os.environ.get('WINDIR', 'C:\\Windows')) / 'Fonts'
+            
+            # Try common font filename patterns for Arial Narrow
+            font_patterns = [
+                'ARIALN.TTF',  # Arial Narrow
+                'ARIALNB.TTF',  # Arial Narrow Bold
+                f'{font_name.replace(" ", "")}.ttf',
+                f'{font_name.replace(" ", "_")}.ttf',
+                f'{font_name.replace(" ", "")}.TTF',
+                f'{font_name.replace(" ", "_")}.TTF',
+            ]
+            
+            for pattern in font_patterns:
+                font_path = windows_fonts_dir / pattern
+                if font_path.exists() and self._note_rebuild_avoided(self.register_font_file(font_path)):
+                    if any(f.name == font_name for f in fm.fontManager.ttflist):
+                        return True
+        
+        return False
+    
+    def get_font_list(self, layout_style: str, resolver: Callable[[str], List[str]]) -> List[str]:
+        """Return the font list for a layout, resolving it on first use.
+        
+        Args:
+            layout_style: Layout name
+            resolver: Callable building the font list from configuration
+            
+        Returns:
+            Copy of the memoized font list
+        """
+        with self._lock:
+            font_list = self._font_lists.get(layout_style)
+            if font_list is not None:
+                self._stats['font_list_hits'] += 1
+                return list(font_list)
+        
+        font_list = list(resolver(layout_style))
+        with self._lock:
+            self._stats['font_list_misses'] += 1
+            self._font_lists[layout_style] = font_list
+        return list(font_list)
+    
+    def apply_layout(self, layout_style: str, font_list: List[str]) -> bool:
+        """Point matplotlib rcParams at a layout's fonts if not already active.
+        
+        Args:
+            layout_style: Layout name
+            font_list: Font list for the layout
+            
+        Returns:
+            True if rcParams were updated
+        """
+        from matplotlib import rcParams
+        
+        with self._lock:
+            if (self._active_layout == layout_style
+                    and rcParams['font.sans-serif'] == font_list
+                    and rcParams['font.family'] == ['sans-serif']):
+                self._stats['rcparams_skipped'] += 1
+                return False
+            
+            rcParams.update({
+                'font.sans-serif': font_list,
+                'font.family': 'sans-serif',
+                'font.size': 10,
+                'axes.unicode_minus': False
+            })
+            self._active_layout = layout_style
+            self._stats['rcparams_updates'] += 1
+            return True
+    
+    def _note_rebuild_avoided(self, registered: bool) -> bool:
+        """Count a font file registration by name; earlier versions rebuilt the FontManager after each."""
+        if registered:
+            with self._lock:
+                self._stats['rebuilds_avoided'] += 1
+        return registered
+    
+    def invalidate(self, layout_style: Optional[str] = None) -> None:
+        """Forget memoized font lists (all layouts if layout_style is None)."""
+        with self._lock:
+            if layout_style is None:
+                self._font_lists.clear()
+                self._active_layout = None
+            else:
+                self._font_lists.pop(layout_style, None)
+                if self._active_layout == layout_style:
+                    self._active_layout = None
+    
+    def stats(self) -> Dict[str, int]:
+        """Registry counters, including how many FontManager rebuilds were avoided."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['layouts_cached'] = len(self._font_lists)
+            return stats
+
+
+_font_registry = FontRegistry()
+
+
+def get_font_registry() -> FontRegistry:
+    """Return the process-wide font registry."""
+    return _font_registry
 
 
 class ImageProcessor:
@@ -29,6 +245,7 @@ class ImageProcessor:
     
     def _early_matplotlib_setup(self):
         """Configure matplotlib BEFORE any plotting to avoid font warnings."""
+        ensure_matplotlib()
         try:
             import matplotlib
             matplotlib.use('Agg')  # Non-interactive backend
@@ -39,16 +256,11 @@ class ImageProcessor:
             rcParams['font.size'] = 10
             rcParams['axes.unicode_minus'] = False
             
-            # Register Arial Narrow if available
+            # Register package fonts (Arial Narrow, etc.) once per process
             try:
-                from pathlib import Path
-                import matplotlib.font_manager as fm
-                package_root = Path(__file__).parent.parent
-                arial_narrow_path = package_root / 'config' / 'assets' / 'fonts' / 'arial_narrow.TTF'
-                if arial_narrow_path.exists():
-                    fm.fontManager.addfont(str(arial_narrow_path))
+                get_font_registry().register_package_fonts()
             except Exception as e:
-                self.logger.debug(f"Could not register Arial Narrow: {e}")
+                self.logger.debug(f"Could not register package fonts: {e}")
                 
         except Exception as e:
             self.logger.debug(f"Early matplotlib setup failed: {e}")
@@ -158,8 +370,11 @@ class ImageProcessor:
             self._display_figure_in_notebook(fig)
         
         # Process figure or image
+        image_formats = RASTER_FORMATS
         if fig is not None:
-            final_path = self._save_plot_to_output(fig, figure_counter, output_dir, document_type, layout_style)
+            image_formats = get_image_output_policy().formats
+            final_path = self._save_plot_to_output(fig, figure_counter, output_dir, document_type, layout_style,
+                                                   image_formats=image_formats)
         elif img_path is not None:
             final_path = self._process_image_file(img_path, figure_counter, output_dir, document_type)
         else:
@@ -170,7 +385,8 @@ class ImageProcessor:
         
         # Generate markdown
         markdown = self._build_plot_markdown(
-            final_path, title, caption, figure_counter, plot_width, document_columns, label
+            final_path, title, caption, figure_counter, plot_width, document_columns, label,
+            image_formats=image_formats
         )
         
         return markdown, figure_counter, final_path
@@ -179,7 +395,6 @@ class ImageProcessor:
         """Process and copy image file to standardized location."""
         # Get output directory
         target_dir = self._get_output_directory(output_dir, document_type)
-        target_dir.mkdir(parents=True, exist_ok=True)
         
         # Generate standardized filename
         source = Path(source_path)
@@ -194,11 +409,8 @@ class ImageProcessor:
                 print(f"WARNING: Source image not found: {source_path}")
                 return Path(source_path)
             
-            # Ensure destination directory exists
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Copy the file
-            shutil.copy2(source, dest_path)
+            # Stage the file (skipped when already up to date)
+            write_creating_parent(dest_path, lambda: stage_asset(source, dest_path))
             return dest_path
         except Exception as e:
             # More detailed error reporting
@@ -206,10 +418,18 @@ class ImageProcessor:
             # Return original path if copy fails, but this should be rare now
             return Path(source_path)
     
-    def _save_plot_to_output(self, fig, counter: int, output_dir: Optional[str], document_type: str, layout_style: str = None) -> str:
-        """Save matplotlib figure to output directory."""
+    def _save_plot_to_output(self, fig, counter: int, output_dir: Optional[str], document_type: str, layout_style: str = None,
+                             image_formats: Optional[Tuple[str, ...]] = None) -> str:
+        """Save matplotlib figure to output directory.
+        
+        Args:
+            image_formats: Formats to write (None = process-wide image output policy).
+                          The returned path is always the PNG.
+        """
+        if image_formats is None:
+            image_formats = get_image_output_policy().formats
+        
         target_dir = self._get_output_directory(output_dir, document_type)
-        target_dir.mkdir(parents=True, exist_ok=True)
         
         # Generate filename and save
         filename = f"{self._get_figure_prefix()}{counter}.png"
@@ -233,20 +453,20 @@ class ImageProcessor:
             except:
                 facecolor = 'white'  # Fallback
         
-        fig.savefig(
+        save_figure(
+            fig,
             output_path,
+            image_formats,
             dpi=plot_config.get('dpi', 300),
             bbox_inches=plot_config.get('bbox_inches', 'tight'),
             facecolor=facecolor
         )
         
-        # Clean up matplotlib thoroughly
+        # Close the figure; collect garbage only past the memory watermark
         try:
             import matplotlib.pyplot as plt
             plt.close(fig)
-            # Force garbage collection for better memory management
-            import gc
-            gc.collect()
+            get_memory_watermark().check()
         except Exception:
             pass  # Ignore cleanup errors
         
@@ -329,15 +549,10 @@ class ImageProcessor:
         if output_dir is not None:
             return Path(output_dir)
         
-        # Use caching for repeated calls
-        cache_key = f"output_dir_{document_type}"
-        if cache_key not in self._path_cache:
-            from ePy_docs.core._config import get_absolute_output_directories
-            output_dirs = get_absolute_output_directories(document_type=document_type)
-            figures_dir = Path(output_dirs['figures'])
-            self._path_cache[cache_key] = figures_dir
-        
-        return self._path_cache[cache_key]
+        # Memoized per (document_type, cwd) by the path resolver
+        from ePy_docs.core._paths import get_absolute_output_directories
+        output_dirs = get_absolute_output_directories(document_type=document_type)
+        return Path(output_dirs['figures'])
     
     def _build_image_markdown(self, img_path: Path, caption: str, width: str, alt_text: str, 
                              counter: int, document_columns: int = 1, label: str = None) -> str:
@@ -423,11 +638,14 @@ class ImageProcessor:
         return ''.join(parts)
     
     def _build_plot_markdown(self, img_path: str, title: str, caption: str, counter: int, 
-                            width: str = None, document_columns: int = 1, label: str = None) -> str:
+                            width: str = None, document_columns: int = 1, label: str = None,
+                            image_formats: Tuple[str, ...] = RASTER_FORMATS) -> str:
         """Build markdown for plot content.
         
         Args:
             label: Custom label for cross-referencing. If None, uses counter.
+            image_formats: Formats saved for the plot; vector variants are
+                          referenced per output format
         """
         parts = []
         
@@ -502,7 +720,11 @@ class ImageProcessor:
             caption_escaped = caption.replace('"', '\\"')
             attrs.append(f'fig-cap="{caption_escaped}"')
         
-        parts.append(f"![{alt_text}]({img_path_normalized})" + "{" + " ".join(attrs) + "}\n\n")
+        figure = conditional_image_markdown(
+            lambda path: f"![{alt_text}]({path})" + "{" + " ".join(attrs) + "}",
+            img_path_normalized, image_formats
+        )
+        parts.append(figure + "\n\n")
         
         return ''.join(parts)
     
@@ -639,32 +861,20 @@ class ImageProcessor:
         return self.convert_rgb_to_matplotlib([250, 250, 250])
     
     def setup_matplotlib_fonts(self, layout_style: str) -> List[str]:
-        """Configure matplotlib fonts from epyson configuration - RESPECTS USER CONFIG."""
-        import matplotlib.pyplot as plt
-        from matplotlib import rcParams
+        """Configure matplotlib fonts from epyson configuration - RESPECTS USER CONFIG.
         
-        # Get configured fonts from epyson - THIS IS WHAT THE USER CONFIGURED
-        font_list = self._get_font_list_from_config(layout_style)
+        Font lists are memoized per layout in the process-wide FontRegistry and
+        rcParams are only rewritten when the layout changes.
+        """
+        registry = get_font_registry()
+        registry.register_package_fonts()
         
-        self.logger.debug(f"Configuring matplotlib with fonts from epyson: {font_list}")
+        # Get configured fonts from epyson - THIS IS WHAT THE USER CONFIGURED
+        font_list = registry.get_font_list(layout_style, self._get_font_list_from_config)
         
         # Configure matplotlib with configuration-only fonts
-        rcParams.update({
-            'font.sans-serif': font_list,
-            'font.family': 'sans-serif', 
-            'font.size': 10,
-            'axes.unicode_minus': False
-        })
         # Note: serif and monospace fonts should come from configuration if needed
-        
-        # Clear matplotlib font cache to force reload
-        try:
-            import matplotlib.font_manager as fm
-            if hasattr(fm, 'get_fontconfig_fonts'):
-                fm.fontManager = fm.FontManager()  # Force rebuild
-            self.logger.debug("Rebuilt matplotlib font manager")
-        except Exception as e:
-            self.logger.debug(f"Could not rebuild font manager: {e}")
+        registry.apply_layout(layout_style, font_list)
         
         self.logger.debug(f"Configured matplotlib fonts: {font_list[:3]}...")
         return font_list
@@ -672,96 +882,18 @@ class ImageProcessor:
 
     
     def _get_font_list_from_config(self, layout_style: str) -> List[str]:
-        """Extract font list from epyson configuration."""
-        from ePy_docs.core._config import get_layout, get_config_section
+        """Extract font list from the compiled layout configuration."""
+        from ePy_docs.core._config import compile_layout
         
         try:
-            # Get layout configuration
-            layout_data = get_layout(layout_style)
-            self.logger.debug(f"Layout data for {layout_style}: {layout_data}")
-            
-            # Try different approaches to get font configuration
-            font_list = []
-            
-            # Approach 1: From resolved 'text' field (most common after resolve_refs=True)
-            if 'text' in layout_data and isinstance(layout_data['text'], dict):
-                font_info = layout_data['text']
-                if 'primary' in font_info:
-                    primary_font = font_info['primary']
-                    font_list.append(primary_font)
-                    self._register_font_if_exists(primary_font)
-                if 'fallback' in font_info:
-                    fallback_fonts = font_info['fallback']
-                    if isinstance(fallback_fonts, str):
-                        font_list.extend([f.strip() for f in fallback_fonts.split(',')])
-                    elif isinstance(fallback_fonts, list):
-                        font_list.extend(fallback_fonts)
-            
-            # Approach 2: Direct from layout font_family (if it's a dict)
-            if not font_list and 'font_family' in layout_data:
-                font_info = layout_data['font_family']
-                if isinstance(font_info, dict):
-                    if 'primary' in font_info:
-                        primary_font = font_info['primary']
-                        font_list.append(primary_font)
-                        self._register_font_if_exists(primary_font)
-                    if 'fallback' in font_info:
-                        font_list.append(font_info['fallback'])
-                elif isinstance(font_info, str):
-                    # It's a reference, try to resolve it from layout's font_families
-                    if 'font_families' in layout_data and font_info in layout_data['font_families']:
-                        font_config = layout_data['font_families'][font_info]
-                        if 'primary' in font_config:
-                            primary_font = font_config['primary']
-                            font_list.append(primary_font)
-                            self._register_font_if_exists(primary_font)
-                        if 'fallback' in font_config:
-                            fallback_fonts = font_config['fallback']
-                            if isinstance(fallback_fonts, str):
-                                font_list.extend([f.strip() for f in fallback_fonts.split(',')])
-                            elif isinstance(fallback_fonts, list):
-                                font_list.extend(fallback_fonts)
+            fonts = compile_layout(layout_style).fonts
             
-            # Approach 2: From font_family_ref
-            if not font_list and 'font_family_ref' in layout_data:
-                font_family_ref = layout_data['font_family_ref']
-                if 'font_families' in layout_data and font_family_ref in layout_data['font_families']:
-                    font_config = layout_data['font_families'][font_family_ref]
-                    if 'primary' in font_config:
-                        primary_font = font_config['primary']
-                        font_list.append(primary_font)
-                        self._register_font_if_exists(primary_font)
-                    if 'fallback' in font_config:
-                        fallback_fonts = font_config['fallback']
-                        if isinstance(fallback_fonts, str):
-                            font_list.extend([f.strip() for f in fallback_fonts.split(',')])
-                        elif isinstance(fallback_fonts, list):
-                            font_list.extend(fallback_fonts)
-            
-            # Approach 3: Get font from layout's embedded font_families using layout_style name
-            if not font_list and 'font_families' in layout_data:
-                # Try to get font using layout_style as key (e.g., 'technical', 'classic')
-                if layout_style in layout_data['font_families']:
-                    font_config = layout_data['font_families'][layout_style]
-                    if 'primary' in font_config:
-                        primary_font = font_config['primary']
-                        font_list.append(primary_font)
-                        self._register_font_if_exists(primary_font)
-                    if 'fallback' in font_config:
-                        fallback_fonts = font_config['fallback']  
-                        if isinstance(fallback_fonts, str):
-                            font_list.extend([f.strip() for f in fallback_fonts.split(',')])
-                        elif isinstance(fallback_fonts, list):
-                            font_list.extend(fallback_fonts)
-            
-            # Ensure Arial Narrow is preserved and properly processed
-            processed_fonts = []
-            for font in font_list:
-                # Keep Arial Narrow as is - it's a valid font
-                processed_fonts.append(font)
+            # Custom font files (e.g. handwritten) must be known to matplotlib
+            if fonts.registered_primary:
+                self._register_font_if_exists(fonts.registered_primary)
             
             # Use only fonts from configuration - NO hardcoded fallbacks
-            final_list = processed_fonts if processed_fonts else []
+            final_list = list(fonts.font_list)
             
             if not final_list:
                 raise ValueError(f"No fonts configured for layout '{layout_style}'. Check layout configuration.")
@@ -771,10 +903,6 @@ class ImageProcessor:
         except Exception as e:
             self.logger.error(f"Error extracting fonts for {layout_style}: {e}")
             raise ValueError(f"Font configuration error for layout '{layout_style}': {e}")
-            
-        except Exception as e:
-            self.logger.debug(f"Error in _get_font_list_from_config: {e}")
-            raise ValueError(f"Font configuration failed for layout '{layout_style}': {e}")
     
     def setup_matplotlib_palette(self, palette_name: Optional[str] = None) -> List[List[float]]:
         """Configure matplotlib color cycle with colors from a specific palette.
@@ -951,77 +1079,12 @@ class ImageProcessor:
     
     def _register_font_if_exists(self, font_name: str):
         """Register custom font file with matplotlib if it exists."""
-        import matplotlib.font_manager as fm
-        from pathlib import Path
-        import os
-        
         try:
-            # Use default font file template (fonts.epyson no longer exists)
-            font_file_template = "{font_name}.otf"
-            
-            # First try package fonts folder
-            package_root = Path(__file__).parent.parent
-            font_filename = font_file_template.format(font_name=font_name)
-            font_file = package_root / 'config' / 'assets' / 'fonts' / font_filename
-            
-            if font_file.exists():
-                # Register font with matplotlib
-                fm.fontManager.addfont(str(font_file))
-                self._rebuild_font_cache(fm)
-                return True
-            
-            # If not found in package, try system fonts (Windows)
-            if os.name == 'nt':  # Windows
-                windows_fonts_dir = Path(os.environ.get('WINDIR', 'C:\\Windows')) / 'Fonts'
-                
-                # Try common font filename patterns for Arial Narrow
-                font_patterns = [
-                    'ARIALN.TTF',  # Arial Narrow
-                    'ARIALNB.TTF',  # Arial Narrow Bold
-                    f'{font_name.replace(" ", "")}.ttf',
-                    f'{font_name.replace(" ", "_")}.ttf',
-                    f'{font_name.replace(" ", "")}.TTF',
-                    f'{font_name.replace(" ", "_")}.TTF',
-                ]
-                
-                for pattern in font_patterns:
-                    font_path = windows_fonts_dir / pattern
-                    if font_path.exists():
-                        try:
-                            fm.fontManager.addfont(str(font_path))
-                            self._rebuild_font_cache(fm)
-                            
-                            # Verify registration
-                            font_registered = any(f.name == font_name for f in fm.fontManager.ttflist)
-                            if font_registered:
-                                self.logger.debug(f"✅ Fuente {font_name} registrada desde sistema: {font_path}")
-                                return True
-                        except Exception as e:
-                            self.logger.debug(f"Failed to register {font_path}: {e}")
-                            continue
-            
-            return False
-                
+            return get_font_registry().register_font(font_name)
         except Exception as e:
             self.logger.debug(f"Error registering font {font_name}: {e}")
             return False
     
-    def _rebuild_font_cache(self, fm):
-        """Force matplotlib to rebuild font cache."""
-        try:
-            fm.fontManager._init()
-        except AttributeError:
-            try:
-                fm._rebuild()
-            except AttributeError:
-                # Clear and rebuild font cache manually
-                fm.fontManager.ttflist = []
-                fm.fontManager.afmlist = []
-                try:
-                    fm.fontManager._load_fonts()
-                except AttributeError:
-                    pass
-    
     def _extract_font_family_from_layout(self, layout_data: Dict[str, Any]) -> str:
         """Extract font family from layout configuration."""
         if 'font_family_ref' in layout_data:
@@ -7,37 +7,27 @@ that can be processed through the standard add_table() pipeline for consistent f
 
 import pandas as pd
 from typing import Dict, List, Optional, Any
-import inspect
 
+from ._context import get_writer_project_config
 
-def _get_project_config_from_stack() -> Dict[str, Any]:
-    """Get project configuration from DocumentWriter instance in call stack."""
-    for frame_info in inspect.stack():
-        frame_locals = frame_info.frame.f_locals
-        for name, obj in frame_locals.items():
-            if hasattr(obj, '_project_info') or hasattr(obj, '_authors') or hasattr(obj, '_client_info'):
-                config = {}
-                if hasattr(obj, '_project_info') and obj._project_info:
-                    config['project'] = obj._project_info
-                if hasattr(obj, '_authors') and obj._authors:
-                    config['authors'] = obj._authors
-                if hasattr(obj, '_client_info') and obj._client_info:
-                    config['client'] = obj._client_info
-                return config
-    return {}
 
+def _get_project_config(writer=None) -> Dict[str, Any]:
+    """Get project configuration from the given or active DocumentWriter."""
+    return get_writer_project_config(writer)
 
-def get_project_table_data(language: str = 'en') -> Optional[pd.DataFrame]:
+
+def get_project_table_data(language: str = 'en', writer=None) -> Optional[pd.DataFrame]:
     """
     Generate project information as DataFrame.
     
     Args:
         language: Language code ('en', 'es')
+        writer: DocumentWriter instance (None = active writer)
         
     Returns:
         DataFrame with project information or None if no data available
     """
-    config = _get_project_config_from_stack()
+    config = _get_project_config(writer)
     project_info = config.get('project', {})
     
     if not project_info:
@@ -105,17 +95,18 @@ def get_project_table_data(language: str = 'en') -> Optional[pd.DataFrame]:
     return pd.DataFrame(data)
 
 
-def get_authors_table_data(language: str = 'en') -> Optional[pd.DataFrame]:
+def get_authors_table_data(language: str = 'en', writer=None) -> Optional[pd.DataFrame]:
     """
     Generate authors information as DataFrame.
     
     Args:
         language: Language code ('en', 'es')
+        writer: DocumentWriter instance (None = active writer)
         
     Returns:
         DataFrame with authors information or None if no data available
     """
-    config = _get_project_config_from_stack()
+    config = _get_project_config(writer)
     authors = config.get('authors', [])
     
     if not authors:
@@ -180,17 +171,18 @@ def get_authors_table_data(language: str = 'en') -> Optional[pd.DataFrame]:
     return pd.DataFrame(data)
 
 
-def get_client_table_data(language: str = 'en') -> Optional[pd.DataFrame]:
+def get_client_table_data(language: str = 'en', writer=None) -> Optional[pd.DataFrame]:
     """
     Generate client information as DataFrame.
     
     Args:
         language: Language code ('en', 'es')
+        writer: DocumentWriter instance (None = active writer)
         
     Returns:
         DataFrame with client information or None if no data available
     """
-    config = _get_project_config_from_stack()
+    config = _get_project_config(writer)
     client_info = config.get('client', {})
     
     if not client_info:
@@ -231,23 +223,24 @@ def get_client_table_data(language: str = 'en') -> Optional[pd.DataFrame]:
     return pd.DataFrame(data)
 
 
-def get_project_info_dataframe(info_type: str, language: str = 'en') -> Optional[pd.DataFrame]:
+def get_project_info_dataframe(info_type: str, language: str = 'en', writer=None) -> Optional[pd.DataFrame]:
     """
     Get project information as DataFrame for the specified type.
     
     Args:
         info_type: Type of information ('project', 'authors', 'client')
         language: Language code ('en', 'es')
+        writer: DocumentWriter instance (None = active writer)
         
     Returns:
         DataFrame with the requested information or None if not available
     """
     if info_type == 'project':
-        return get_project_table_data(language)
+        return get_project_table_data(language, writer)
     elif info_type == 'authors':
-        return get_authors_table_data(language)
+        return get_authors_table_data(language, writer)
     elif info_type == 'client':
-        return get_client_table_data(language)
+        return get_client_table_data(language, writer)
     else:
         return None
 
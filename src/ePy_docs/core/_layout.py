@@ -0,0 +1,290 @@
+"""Compiled layout configuration.
+
+A layout .epyson file is resolved once (see _config.load_layout) and then
+compiled into an immutable CompiledLayout with typed sub-objects:
+
+- FontSpec: Font family, fallbacks and the matplotlib font list
+- PaletteSpec: Embedded layout palette, flattened for table rendering
+- TableSpec: Table configuration and styling
+- CodeSpec: Code chunk types, spacing and caption format
+- CalloutSpec: Callout defaults and variants
+- MarginSpec: Page margins in cm
+
+All objects use __slots__ and reject attribute assignment; nested mappings
+are read-only views and lists become tuples. Consumers that need to modify a
+slice call thaw() to get a private mutable copy.
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+
+# ============================================================================
+# FREEZING HELPERS
+# ============================================================================
+
+_EMPTY = MappingProxyType({})
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, (dict, MappingProxyType)):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Recursively convert frozen mappings/tuples back to dicts/lists."""
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
+
+
+def _split_fallback(fallback: Any) -> Tuple[str, ...]:
+    """Normalize a fallback font specification ('A, B' or ['A', 'B'])."""
+    if isinstance(fallback, str):
+        return tuple(f.strip() for f in fallback.split(','))
+    if isinstance(fallback, (list, tuple)):
+        return tuple(fallback)
+    return ()
+
+
+class _FrozenSlots:
+    """Base for immutable __slots__ objects."""
+
+    __slots__ = ()
+
+    def _set(self, **values) -> None:
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+# ============================================================================
+# SUB-OBJECTS
+# ============================================================================
+
+class FontSpec(_FrozenSlots):
+    """Fonts of a layout.
+
+    Attributes:
+        family: Resolved 'font_family' value (family name or inline dict)
+        family_ref: 'font_family_ref' value
+        families: Embedded font_families
+        family_config: Font family entry the layout uses
+        primary: Primary font name
+        fallback: Fallback specification as written in the layout
+        latex_primary: Primary font for LaTeX output
+        font_list: Primary followed by fallbacks, as used by matplotlib
+        registered_primary: Font a custom font file may be registered for
+    """
+
+    __slots__ = ('family', 'family_ref', 'families', 'family_config', 'primary',
+                 'fallback', 'latex_primary', 'font_list', 'registered_primary')
+
+    def __init__(self, layout: Mapping[str, Any], layout_name: str):
+        family = layout.get('font_family')
+        family_ref = layout.get('font_family_ref')
+        families = layout.get('font_families', _EMPTY)
+
+        if isinstance(family, Mapping):
+            family_config = family
+        else:
+            family_config = families.get(family or family_ref, _EMPTY)
+
+        font_list, registered_primary = self._resolve_font_list(layout, layout_name)
+        self._set(
+            family=family,
+            family_ref=family_ref,
+            families=families,
+            family_config=family_config,
+            primary=family_config.get('primary'),
+            fallback=family_config.get('fallback'),
+            latex_primary=family_config.get('latex_primary'),
+            font_list=font_list,
+            registered_primary=registered_primary,
+        )
+
+    @staticmethod
+    def _resolve_font_list(layout: Mapping[str, Any], layout_name: str) -> Tuple[Tuple[str, ...], Optional[str]]:
+        """Build the matplotlib font list (primary + fallbacks) for a layout."""
+        families = layout.get('font_families', _EMPTY)
+        candidates = []
+
+        # From resolved 'text' field (most common after resolve_refs=True)
+        text = layout.get('text')
+        if isinstance(text, Mapping):
+            candidates.append(text)
+
+        # Direct from layout font_family (inline dict or reference)
+        font_family = layout.get('font_family')
+        if isinstance(font_family, Mapping):
+            candidates.append(font_family)
+        elif isinstance(font_family, str) and font_family in families:
+            candidates.append(families[font_family])
+
+        # From font_family_ref
+        if layout.get('font_family_ref') in families:
+            candidates.append(families[layout['font_family_ref']])
+
+        # From embedded font_families using the layout name
+        if layout_name in families:
+            candidates.append(families[layout_name])
+
+        for font_info in candidates:
+            font_list = []
+            primary = font_info.get('primary')
+            if primary:
+                font_list.append(primary)
+            font_list.extend(_split_fallback(font_info.get('fallback')))
+            if font_list:
+                return tuple(font_list), primary
+        return (), None
+
+
+class PaletteSpec(_FrozenSlots):
+    """Embedded layout palette.
+
+    Attributes:
+        raw: Palette section as written in the layout
+        colors: Named colors (RGB lists)
+        flattened: colors plus page_*/code_*/table_* entries, border and caption color
+    """
+
+    __slots__ = ('raw', 'colors', 'flattened')
+
+    def __init__(self, palette: Mapping[str, Any]):
+        flattened = {}
+        if 'colors' in palette:
+            flattened.update(palette['colors'])
+        for section in ('page', 'code', 'table'):
+            if section in palette:
+                for key, value in palette[section].items():
+                    flattened[f'{section}_{key}'] = value
+        for key in ('border_color', 'caption_color'):
+            if key in palette:
+                flattened[key] = palette[key]
+
+        self._set(
+            raw=palette,
+            colors=palette.get('colors', _EMPTY),
+            flattened=MappingProxyType(flattened),
+        )
+
+
+class TableSpec(_FrozenSlots):
+    """Table configuration (config) and its styling section."""
+
+    __slots__ = ('config', 'styling')
+
+    def __init__(self, tables: Mapping[str, Any]):
+        self._set(config=tables, styling=tables.get('styling', _EMPTY))
+
+
+class CodeSpec(_FrozenSlots):
+    """Code chunk configuration.
+
+    Attributes:
+        chunk_types: Chunk type definitions (display_chunk, executable_chunk)
+        code_chunks: Layout code_chunks section (None if absent)
+        spacing: Spacing around chunks (None if code_chunks is absent)
+        caption_format: Caption format (None if code_chunks is absent)
+        code: Layout 'code' section used by tables
+    """
+
+    __slots__ = ('chunk_types', 'code_chunks', 'spacing', 'caption_format', 'code')
+
+    def __init__(self, layout: Mapping[str, Any]):
+        code_chunks = layout.get('code_chunks')
+        self._set(
+            chunk_types=layout.get('chunk_types'),
+            code_chunks=code_chunks,
+            spacing=code_chunks.get('spacing', freeze({'before': '\n\n', 'after': '\n\n'})) if code_chunks is not None else None,
+            caption_format=code_chunks.get('caption_format', '{caption}') if code_chunks is not None else None,
+            code=layout.get('code', _EMPTY),
+        )
+
+
+class CalloutSpec(_FrozenSlots):
+    """Callout configuration: shared format, per-type variants and everything else."""
+
+    __slots__ = ('config', 'format', 'variants')
+
+    def __init__(self, callouts: Mapping[str, Any]):
+        self._set(
+            config=callouts,
+            format=callouts.get('format', _EMPTY),
+            variants=MappingProxyType({key: value for key, value in callouts.items()
+                                       if key not in ('format', '_defaults') and isinstance(value, Mapping)}),
+        )
+
+
+class MarginSpec(_FrozenSlots):
+    """Page margins in cm (None for sides the layout does not define)."""
+
+    __slots__ = ('top', 'bottom', 'left', 'right')
+
+    def __init__(self, margins: Mapping[str, Any]):
+        self._set(**{side: margins.get(side) for side in self.__slots__})
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {side: getattr(self, side) for side in self.__slots__}
+
+
+# ============================================================================
+# COMPILED LAYOUT
+# ============================================================================
+
+class CompiledLayout(_FrozenSlots):
+    """Immutable, fully resolved layout configuration.
+
+    Attributes:
+        name: Layout name
+        raw: Complete resolved layout (read-only view)
+        fonts: FontSpec
+        palette: PaletteSpec (None if the layout has no embedded palette)
+        tables: TableSpec
+        code: CodeSpec
+        callouts: CalloutSpec
+        margins: MarginSpec
+        typography: Typography section
+        format: Format section (includes data_formats after resolution)
+        text_wrapping: format.text_wrapping (default max_width 80)
+    """
+
+    __slots__ = ('name', 'raw', 'fonts', 'palette', 'tables', 'code', 'callouts',
+                 'margins', 'typography', 'format', 'text_wrapping')
+
+    def __init__(self, layout_name: str, layout: Mapping[str, Any]):
+        raw = freeze(layout)
+        format_section = raw.get('format', _EMPTY)
+        self._set(
+            name=layout_name,
+            raw=raw,
+            fonts=FontSpec(raw, layout_name),
+            palette=PaletteSpec(raw['palette']) if 'palette' in raw else None,
+            tables=TableSpec(raw.get('tables', _EMPTY)),
+            code=CodeSpec(raw),
+            callouts=CalloutSpec(raw.get('callouts', _EMPTY)),
+            margins=MarginSpec(raw.get('margins', _EMPTY)),
+            typography=raw.get('typography', _EMPTY),
+            format=format_section,
+            text_wrapping=format_section.get('text_wrapping', freeze({'max_width': 80})),
+        )
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Read a top-level section of the resolved layout."""
+        return self.raw.get(key, default)
@@ -0,0 +1,224 @@
+"""Deferred initialization of heavy third-party libraries.
+
+matplotlib, numpy and pandas are only needed for tables, plots and font
+handling. Importing ePy_docs (and building Markdown/QMD text) must not pay
+their start-up cost, so modules that need them call the helpers below on
+first use instead of importing them at package import time.
+"""
+
+import sys
+import threading
+from pathlib import Path
+from typing import Any
+
+
+# ============================================================================
+# MATPLOTLIB
+# ============================================================================
+
+_matplotlib_lock = threading.Lock()
+_matplotlib_configured = False
+
+
+def ensure_matplotlib() -> None:
+    """Configure matplotlib once, before any table, plot or font API uses it.
+
+    Selects the non-interactive backend, applies safe font defaults, keeps
+    font lookups from failing when fallback is disabled, and registers Arial
+    Narrow from the package fonts. Safe to call repeatedly and from several
+    threads.
+    """
+    global _matplotlib_configured
+    if _matplotlib_configured:
+        return
+
+    with _matplotlib_lock:
+        if _matplotlib_configured:
+            return
+
+        try:
+            import matplotlib
+            matplotlib.use('Agg')  # Non-interactive backend
+            from matplotlib import rcParams
+            import matplotlib.font_manager as fm
+            import logging
+
+            # Suppress matplotlib font warnings
+            logging.getLogger('matplotlib.font_manager').setLevel(logging.ERROR)
+            # PDF/SVG output subsets fonts with fontTools, which logs every table at INFO
+            logging.getLogger('fontTools').setLevel(logging.WARNING)
+
+            # Set safe defaults with proper fallback - NO DejaVu Sans to avoid errors if not installed
+            rcParams['font.sans-serif'] = ['Arial', 'Helvetica', 'sans-serif']
+            rcParams['font.family'] = 'sans-serif'
+            rcParams['font.size'] = 10
+            rcParams['axes.unicode_minus'] = False
+            rcParams['mathtext.fallback'] = 'cm'  # Enable fallback for math text
+
+            # CRITICAL: Enable default font fallback in matplotlib
+            # This prevents "fallback to the default font was disabled" errors
+            # MONKEY-PATCH: Wrap matplotlib's _findfont_cached to prevent fallback disabling
+            from types import MethodType
+
+            if hasattr(fm, 'fontManager') and hasattr(fm.fontManager, '_findfont_cached'):
+                # Patch _findfont_cached which is where fallback_to_default gets set to False
+                _original_findfont_cached = fm.FontManager._findfont_cached
+
+                def _safe_findfont_cached(self, *args, **kwargs):
+                    """Wrapper that prevents disabling fallback."""
+                    try:
+                        return _original_findfont_cached(self, *args, **kwargs)
+                    except (ValueError, RuntimeError) as e:
+                        # If it fails, return a valid font path
+                        if "fallback to the default font was disabled" in str(e):
+                            # Return Arial or first available font
+                            for font_entry in self.ttflist:
+                                if 'arial' in font_entry.name.lower() and font_entry.fname:
+                                    if Path(font_entry.fname).is_file():
+                                        return font_entry.fname
+                            # Return first valid font
+                            for font_entry in self.ttflist:
+                                if font_entry.fname:
+                                    if Path(font_entry.fname).is_file():
+                                        return font_entry.fname
+                        raise
+
+                fm.fontManager._findfont_cached = MethodType(_safe_findfont_cached, fm.fontManager)
+
+            # Register Arial Narrow from package if available
+            package_root = Path(__file__).parent.parent
+            arial_narrow_path = package_root / 'config' / 'assets' / 'fonts' / 'arial_narrow.TTF'
+            if arial_narrow_path.exists():
+                fm.fontManager.addfont(str(arial_narrow_path))
+        except Exception:
+            pass  # Silently fail if matplotlib not available
+        finally:
+            # Published last: the unlocked fast path must not skip a setup in progress
+            _matplotlib_configured = True
+
+
+def is_matplotlib_configured() -> bool:
+    """Whether ensure_matplotlib() has run in this process."""
+    return _matplotlib_configured
+
+
+# ============================================================================
+# PANDAS
+# ============================================================================
+
+def get_pandas():
+    """Import pandas on demand.
+
+    Returns:
+        The pandas module, or None if it is not installed
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        return None
+    return pd
+
+
+def is_na(value: Any) -> Any:
+    """pd.isna() that only imports pandas for values that can come from it.
+
+    Plain Python values are answered directly; numpy/pandas scalars (which
+    can only exist once those libraries are loaded) are passed to pd.isna().
+    """
+    if value is None:
+        return True
+    if isinstance(value, float):
+        return value != value
+    if isinstance(value, (str, int)):
+        return False
+    if 'pandas' in sys.modules or 'numpy' in sys.modules:
+        pd = get_pandas()
+        if pd is not None:
+            return pd.isna(value)
+    return False
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+HEAVY_MODULES = ('matplotlib', 'pandas', 'numpy')
+
+_IMPORT_PROBE = """
+import json, sys, time
+heavy = {heavy!r}
+start = time.perf_counter()
+import ePy_docs
+import_seconds = time.perf_counter() - start
+after_import = [name for name in heavy if name in sys.modules]
+from ePy_docs.writers import DocumentWriter
+start = time.perf_counter()
+DocumentWriter('report')
+writer_seconds = time.perf_counter() - start
+after_writer = [name for name in heavy if name in sys.modules]
+print(json.dumps({{'import_seconds': import_seconds, 'writer_seconds': writer_seconds,
+                  'after_import': after_import, 'after_writer': after_writer}}))
+"""
+
+
+def benchmark_import(runs: int = 3, python: str = None) -> dict:
+    """
+    Measure `import ePy_docs` in fresh interpreters and detect eager heavy imports.
+    
+    Each run starts a new subprocess (working directory: a temporary
+    directory), times `import ePy_docs` and `DocumentWriter('report')`, and
+    records which of matplotlib, pandas and numpy are in sys.modules after
+    each step. Any of them being loaded means a module-level import crept
+    back into the package.
+    
+    Args:
+        runs: Fresh interpreters to start (>= 1)
+        python: Interpreter to run (None = sys.executable)
+        
+    Returns:
+        Dictionary with per-run seconds ('import', 'writer'), 'import_min',
+        'import_mean', the heavy modules loaded 'after_import' and
+        'after_writer' (union over runs) and 'lazy' (True if none were loaded)
+        
+    Raises:
+        ValueError: If runs < 1
+        RuntimeError: If the probe interpreter fails
+    """
+    import json
+    import os
+    import subprocess
+    import tempfile
+    
+    if runs < 1:
+        raise ValueError(f"runs must be >= 1, got {runs}")
+    
+    probe = _IMPORT_PROBE.format(heavy=HEAVY_MODULES)
+    package_parent = str(Path(__file__).resolve().parent.parent.parent)
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [package_parent, env.get('PYTHONPATH')]))
+    
+    import_times, writer_times = [], []
+    after_import, after_writer = set(), set()
+    with tempfile.TemporaryDirectory(prefix='epy_docs_import_') as tmp_dir:
+        for _ in range(runs):
+            result = subprocess.run(
+                [python or sys.executable, '-c', probe],
+                cwd=tmp_dir, env=env, capture_output=True, text=True
+            )
+            if result.returncode != 0:
+                raise RuntimeError(f"Import probe failed: {result.stderr.strip()}")
+            data = json.loads(result.stdout.strip().splitlines()[-1])
+            import_times.append(data['import_seconds'])
+            writer_times.append(data['writer_seconds'])
+            after_import.update(data['after_import'])
+            after_writer.update(data['after_writer'])
+    
+    return {
+        'import': import_times,
+        'writer': writer_times,
+        'import_min': min(import_times),
+        'import_mean': sum(import_times) / len(import_times),
+        'after_import': sorted(after_import),
+        'after_writer': sorted(after_writer),
+        'lazy': not (after_import or after_writer),
+    }
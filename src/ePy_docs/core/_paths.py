@@ -4,17 +4,28 @@ Configuration Path Utilities
 Utilities for path resolution and output directory management.
 """
 
-import inspect
+import os
+import sys
+import threading
 from pathlib import Path
-from typing import Dict
+from typing import Callable, Dict, Optional, Tuple, TypeVar, Union
+
+
+T = TypeVar('T')
+
+# Memoized output directories, keyed by (document_type, cwd)
+_output_directories_cache: Dict[Tuple[str, str], Dict[str, str]] = {}
+_paths_lock = threading.Lock()
 
 
 def get_caller_directory() -> Path:
     """Get the directory of the script/notebook that called the library."""
-    frame_stack = inspect.stack()
+    # Walk raw frames (no FrameInfo/source context, unlike inspect.stack())
+    frame = sys._getframe(1)
     
-    for frame_info in frame_stack:
-        frame_file = Path(frame_info.filename)
+    while frame is not None:
+        frame_file = Path(frame.f_code.co_filename)
+        frame = frame.f_back
         
         if 'ePy_docs' not in str(frame_file):
             if frame_file.name == '<stdin>' or frame_file.name.startswith('<ipython'):
@@ -25,18 +36,102 @@ def get_caller_directory() -> Path:
     return Path.cwd()
 
 
+def get_cache_directory(subdir: Optional[str] = None) -> Path:
+    """Get the per-user cache directory for ePy_docs.
+    
+    Resolution order: ``EPY_DOCS_CACHE_DIR``, then ``XDG_CACHE_HOME`` (or
+    ``LOCALAPPDATA`` on Windows), then ``~/.cache``. The directory is not created.
+    
+    Args:
+        subdir: Optional subdirectory name (e.g. 'tables')
+    """
+    override = os.environ.get('EPY_DOCS_CACHE_DIR')
+    if override:
+        cache_dir = Path(override).expanduser()
+    else:
+        if sys.platform == 'win32':
+            base = os.environ.get('LOCALAPPDATA') or Path.home() / 'AppData' / 'Local'
+        else:
+            base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+        cache_dir = Path(base) / 'ePy_docs'
+    
+    return cache_dir / subdir if subdir else cache_dir
+
+
 def get_absolute_output_directories(document_type: str = "report") -> Dict[str, str]:
     """Get absolute paths for output directories.
     
+    Results are memoized per (document_type, current working directory);
+    call clear_output_directories_cache() after changing document configs.
+    
     Args:
         document_type: Type of document (must exist in documents.epyson)
         
+    Returns:
+        New dict mapping directory names to absolute paths
+        
     Raises:
         ValueError: If document_type not found or configuration invalid
     """
+    cwd = os.getcwd()
+    cache_key = (document_type, cwd)
+    directories = _output_directories_cache.get(cache_key)
+    if directories is None:
+        directories = _build_output_directories(document_type, Path(cwd))
+        with _paths_lock:
+            _output_directories_cache[cache_key] = directories
+    return dict(directories)
+
+
+def clear_output_directories_cache() -> None:
+    """Forget memoized output directories."""
+    with _paths_lock:
+        _output_directories_cache.clear()
+
+
+def write_creating_parent(path: Union[str, Path], write: Callable[[], T]) -> T:
+    """Run a write into path, creating its parent directory only if it is missing.
+    
+    Save paths call this instead of mkdir() before every write: the writer
+    creates the output tree once, and a directory removed afterwards (or a
+    custom output_dir) is recreated here on the first failed write.
+    
+    Args:
+        path: File the write creates
+        write: Performs the write
+        
+    Returns:
+        The result of write()
+    """
+    try:
+        return write()
+    except FileNotFoundError:
+        parent = Path(path).parent
+        if parent.is_dir():
+            raise
+        parent.mkdir(parents=True, exist_ok=True)
+        return write()
+
+
+def ensure_output_tree(document_type: str = "report") -> Dict[str, str]:
+    """Create the output, tables and figures directories of a document type.
+    
+    Callers track whether they already did this (see
+    DocumentWriterCore._prepare_output_tree); nothing is memoized here.
+    
+    Returns:
+        Output directories as returned by get_absolute_output_directories()
+    """
+    directories = get_absolute_output_directories(document_type)
+    for name in ('output', 'tables', 'figures'):
+        Path(directories[name]).mkdir(parents=True, exist_ok=True)
+    return directories
+
+
+def _build_output_directories(document_type: str, base_path: Path) -> Dict[str, str]:
+    """Resolve output directories for a document type relative to base_path."""
     from ._config import ModularConfigLoader
     
-    base_path = Path.cwd()
     
     # Load document configuration from individual file
     config_loader = ModularConfigLoader()
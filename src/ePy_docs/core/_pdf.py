@@ -5,17 +5,24 @@ Refactored module following SOLID principles:
 - PdfEngineSelector: Specialized PDF engine selection logic
 - GeometryProcessor: Page geometry and layout calculations
 - HeaderGenerator: LaTeX header and styling generation
+- PdfConfigCache: Memoized PDF configs and headers per layout
 - PdfOrchestrator: Unified facade orchestrating PDF operations
 
 Version: 3.0.0 - Zero hardcoding, fail-fast validation
 """
 
-from typing import Dict, Any, List, Optional
+import copy
+import hashlib
+import json
+import re
+import threading
+from typing import Callable, Dict, Any, List, Optional
 from pathlib import Path
 from abc import ABC, abstractmethod
 
 # Import shared validation
 from ePy_docs.core._validation import PdfValidator
+from ePy_docs.core._config import register_layout_reload_hook
 
 
 # ============================================================================
@@ -66,6 +73,7 @@ class PdfConfig:
                     "\\usepackage{booktabs}",
                     "\\usepackage{longtable}",
                     "\\usepackage{array}",
+                    "\\usepackage{colortbl}",
                     "\\usepackage{fontspec}",
                     "\\usepackage{unicode-math}",
                     "\\usepackage{geometry}",
@@ -273,6 +281,9 @@ class HeaderGenerator:
     def generate_header(self, layout_name: str = 'classic', fonts_dir: Optional[Path] = None, document_type: str = 'report') -> str:
         """Generate LaTeX include-in-header configuration.
         
+        Headers are memoized per (layout, document_type, fonts_dir) in the
+        PDF config cache.
+        
         Args:
             layout_name: Name of the layout
             fonts_dir: Absolute path to fonts directory
@@ -281,6 +292,13 @@ class HeaderGenerator:
         Returns:
             LaTeX commands for document header
         """
+        key = ('header', layout_name, document_type, str(fonts_dir) if fonts_dir else None)
+        return _pdf_config_cache.get(
+            key, lambda: self._build_header(layout_name, fonts_dir, document_type)
+        )
+    
+    def _build_header(self, layout_name: str, fonts_dir: Optional[Path], document_type: str) -> str:
+        """Build the LaTeX header (uncached)."""
         layout_name = self.validator.validate_layout_name(layout_name)
         
         # Build header components
@@ -299,6 +317,40 @@ class HeaderGenerator:
         
         return '\n\n'.join(filter(None, header_parts))
     
+    # Kept out of precompiled formats: fontspec loads OpenType fonts that
+    # XeTeX/LuaTeX cannot dump (and pdfLaTeX cannot use), the Quarto template
+    # loads geometry again with options, and hyperref/unicode-math must come
+    # after packages the template adds later.
+    _FORMAT_EXCLUDED_PACKAGES = frozenset({'fontspec', 'unicode-math', 'geometry', 'hyperref'})
+    _USEPACKAGE_PATTERN = re.compile(r'^\\usepackage(?:\[[^\]]*\])?\{([^}]*)\}\s*$')
+    
+    def generate_format_preamble(self, layout_name: str = 'classic', document_type: str = 'report') -> str:
+        """Extract the package imports of the header that can be precompiled.
+        
+        Used to build a LaTeX format file (mylatexformat) so repeated PDF
+        renders with the same layout skip loading these packages.
+        
+        Args:
+            layout_name: Name of the layout
+            document_type: Type of document (report, article, paper, book)
+            
+        Returns:
+            Newline-separated \\usepackage lines from generate_header()
+        """
+        header = self.generate_header(layout_name, None, document_type)
+        
+        packages = []
+        for line in header.splitlines():
+            match = self._USEPACKAGE_PATTERN.match(line.strip())
+            if not match:
+                continue
+            names = {name.strip() for name in match.group(1).split(',')}
+            if names & self._FORMAT_EXCLUDED_PACKAGES or line.strip() in packages:
+                continue
+            packages.append(line.strip())
+        
+        return '\n'.join(packages)
+    
     def _get_font_configuration(self, layout_name: str, fonts_dir: Optional[Path]) -> str:
         """Get font configuration from layout."""
         try:
@@ -509,6 +561,100 @@ class HeaderGenerator:
             raise ValueError(f"Invalid hex color '{hex_color}': {e}")
 
 
+# ============================================================================
+# PDF CONFIG CACHE
+# ============================================================================
+
+class PdfConfigCache:
+    """Memoized PDF configurations and LaTeX headers.
+    
+    Entries are keyed by (layout, document_type, fonts_dir). Configurations
+    are returned as deep copies because callers extend them (e.g. append to
+    include-in-header). Each configuration also gets a fingerprint: the
+    SHA-256 of its canonical JSON serialization (serialize_pdf_config), so
+    incremental builds can compare PDF settings without rebuilding them.
+    
+    Layout reloads invalidate entries through the _config layout reload hook.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[tuple, Any] = {}
+        self._fingerprints: Dict[tuple, str] = {}
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: tuple, builder: Callable[[], Any]) -> Any:
+        """Return the cached value for key, building it on first use.
+        
+        Args:
+            key: Cache key; its second item is the layout name
+            builder: Zero-argument callable producing the value
+            
+        Returns:
+            Deep copy of the cached value
+        """
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                return copy.deepcopy(self._entries[key])
+        
+        value = builder()
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = value
+            self._fingerprints.pop(key, None)
+        return copy.deepcopy(value)
+    
+    def fingerprint(self, key: tuple, builder: Callable[[], Any]) -> str:
+        """Return the SHA-256 of the serialized value for key."""
+        with self._lock:
+            digest = self._fingerprints.get(key)
+        if digest is None:
+            value = self.get(key, builder)
+            digest = hashlib.sha256(serialize_pdf_config(value).encode('utf-8')).hexdigest()
+            with self._lock:
+                self._fingerprints[key] = digest
+        return digest
+    
+    def invalidate(self, layout_name: Optional[str] = None) -> None:
+        """Drop entries for one layout (None = all layouts)."""
+        with self._lock:
+            if layout_name is None:
+                self._entries.clear()
+                self._fingerprints.clear()
+                return
+            for key in [key for key in self._entries if key[1] == layout_name]:
+                del self._entries[key]
+                self._fingerprints.pop(key, None)
+    
+    def stats(self) -> Dict[str, int]:
+        """Cache counters."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries)}
+
+
+def serialize_pdf_config(value: Any) -> str:
+    """Deterministic string form of a PDF config (sorted keys, no whitespace)."""
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+
+
+_pdf_config_cache = PdfConfigCache()
+
+
+def get_pdf_config_cache() -> PdfConfigCache:
+    """Return the process-wide PDF config cache."""
+    return _pdf_config_cache
+
+
+def invalidate_pdf_config_cache(layout_name: Optional[str] = None) -> None:
+    """Invalidation hook: forget PDF configs and headers of a layout (None = all)."""
+    _pdf_config_cache.invalidate(layout_name)
+
+
+register_layout_reload_hook(invalidate_pdf_config_cache)
+
+
 # ============================================================================
 # UNIFIED PDF ORCHESTRATOR
 # ============================================================================
@@ -542,8 +688,25 @@ class PdfOrchestrator:
             **kwargs: Additional PDF options
             
         Returns:
-            Dictionary with PDF configuration for Quarto YAML
+            Dictionary with PDF configuration for Quarto YAML (memoized per
+            layout, document type, fonts directory and options)
         """
+        def build() -> Dict[str, Any]:
+            return self._build_pdf_config(layout_name, document_type, fonts_dir, **kwargs)
+        
+        try:
+            key = ('orchestrator', layout_name, document_type,
+                   str(fonts_dir) if fonts_dir else None, tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            return build()  # Unhashable options: build without caching
+        if config is not None:
+            return build()
+        return _pdf_config_cache.get(key, build)
+    
+    def _build_pdf_config(self, layout_name: str, document_type: str,
+                          fonts_dir: Optional[Path], **kwargs) -> Dict[str, Any]:
+        """Build the generate_pdf_config() result (uncached)."""
         layout_name = self._validator.validate_layout_name(layout_name)
         
         # Get document class mapping
@@ -651,6 +814,10 @@ class PdfOrchestrator:
         """
         return self._header_generator.generate_header(layout_name, fonts_dir, document_type)
     
+    def get_pdf_format_preamble(self, layout_name: str = 'classic', document_type: str = 'report') -> str:
+        """Get the header packages that can be precompiled into a LaTeX format."""
+        return self._header_generator.generate_format_preamble(layout_name, document_type)
+    
     def validate_document_class(self, document_class: str) -> bool:
         """Validate document class."""
         try:
@@ -684,8 +851,32 @@ def get_pdf_config(layout_name: str = 'classic',
     Raises:
         ValueError: If layout or document_type invalid
     """
+    if config is not None:
+        return _build_pdf_config(layout_name, document_type, fonts_dir)
+    key = ('config', layout_name, document_type, str(fonts_dir) if fonts_dir else None)
+    return _pdf_config_cache.get(key, lambda: _build_pdf_config(layout_name, document_type, fonts_dir))
+
+
+def get_pdf_config_fingerprint(layout_name: str = 'classic',
+                               document_type: str = 'report',
+                               fonts_dir: Optional[str] = None) -> str:
+    """SHA-256 of the serialized get_pdf_config() result (memoized).
+    
+    Args:
+        layout_name: Layout name
+        document_type: Document type
+        fonts_dir: Optional custom fonts directory path
+        
+    Returns:
+        Hex digest that changes whenever the PDF configuration changes
+    """
+    key = ('config', layout_name, document_type, str(fonts_dir) if fonts_dir else None)
+    return _pdf_config_cache.fingerprint(key, lambda: _build_pdf_config(layout_name, document_type, fonts_dir))
+
+
+def _build_pdf_config(layout_name: str, document_type: str, fonts_dir: Optional[str]) -> Dict[str, Any]:
+    """Build the get_pdf_config() result (uncached)."""
     from ePy_docs.core._config import get_document_type_config
-    from pathlib import Path
     
     # Initialize orchestrator
     orchestrator = PdfOrchestrator()
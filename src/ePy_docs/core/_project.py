@@ -417,12 +417,13 @@ no se permite la reproducción parcial sin autorización previa.
     return legend_content
 
 
-def get_project_metadata(document_type: str = 'paper') -> Dict[str, Any]:
+def get_project_metadata(document_type: str = 'paper', writer=None) -> Dict[str, Any]:
     """
     Extract metadata from project configuration.
     
     Args:
         document_type: Type of document ('paper', 'book', 'report', 'notebook')
+        writer: DocumentWriter instance (None = active writer)
     """
     try:
         from ePy_docs.core._config import ModularConfigLoader
@@ -431,13 +432,13 @@ def get_project_metadata(document_type: str = 'paper') -> Dict[str, Any]:
             from ePy_docs.core._config import get_config_loader
             config_loader = get_config_loader()
             if config_loader:
-                full_config = config_loader.load_project()
+                full_config = config_loader.load_project(writer)
             else:
                 config_loader = ModularConfigLoader()
-                full_config = config_loader.load_project()
+                full_config = config_loader.load_project(writer)
         except:
             config_loader = ModularConfigLoader()
-            full_config = config_loader.load_project()
+            full_config = config_loader.load_project(writer)
         
         metadata = {}
         
@@ -5,18 +5,25 @@ Handles:
 - Quarto YAML generation
 - QMD file creation
 - Quarto rendering (qmd -> pdf/html)
+- Render services (cold subprocess, warm precompiled LaTeX preamble)
 - Format coordination
 """
 
-from typing import Dict, List, Optional, Tuple, Union, TYPE_CHECKING, Any
+from typing import Dict, List, Optional, Tuple, Union, TYPE_CHECKING, Any, Iterable, Iterator
 
 if TYPE_CHECKING:
     import pandas as pd
 from pathlib import Path
+import os
 import subprocess
+import threading
 import yaml
-import inspect
 import shutil
+import hashlib
+import json
+import logging
+import re
+from abc import ABC, abstractmethod
 from datetime import datetime
 
 from ._project import (
@@ -25,6 +32,9 @@ from ._project import (
     get_translation, detect_language_from_config
 )
 from ._format import escape_latex_text
+from ._context import resolve_writer
+
+logger = logging.getLogger(__name__)
 
 
 # =============================================================================
@@ -32,56 +42,54 @@ from ._format import escape_latex_text
 # =============================================================================
 
 
-def _get_authors_for_yaml() -> Optional[Union[str, List[Dict[str, str]]]]:
+def _get_authors_for_yaml(writer=None) -> Optional[Union[str, List[Dict[str, str]]]]:
     """
-    Get authors from DocumentWriter instance in call stack for YAML metadata.
+    Get authors from the given or active DocumentWriter for YAML metadata.
+    
+    Args:
+        writer: DocumentWriter instance (None = active writer)
     
     Returns:
         - String with single author name if only one author
         - List of author dictionaries for multiple authors
         - None if no authors found
     """
-    # Look for DocumentWriter instance in call stack
-    for frame_info in inspect.stack():
-        frame_locals = frame_info.frame.f_locals
-        for name, obj in frame_locals.items():
-            if hasattr(obj, '_authors') and obj._authors:
-                authors = obj._authors
-                
-                if len(authors) == 1:
-                    # Single author - return just the name as string
-                    return authors[0].get('name', 'Anonymous')
-                else:
-                    # Multiple authors - return list of dictionaries
-                    author_list = []
-                    for author in authors:
-                        author_dict = {'name': author.get('name', 'Anonymous')}
-                        
-                        # Add affiliation if available
-                        if author.get('affiliation'):
-                            affiliations = author['affiliation']
-                            if isinstance(affiliations, list) and affiliations:
-                                author_dict['affiliation'] = affiliations[0]  # Use first affiliation
-                            elif isinstance(affiliations, str):
-                                author_dict['affiliation'] = affiliations
-                        
-                        # Add email if available
-                        if author.get('contact'):
-                            contacts = author['contact']
-                            if isinstance(contacts, list) and contacts:
-                                # Look for email in contacts
-                                for contact in contacts:
-                                    if '@' in str(contact):
-                                        author_dict['email'] = contact
-                                        break
-                            elif isinstance(contacts, str) and '@' in contacts:
-                                author_dict['email'] = contacts
-                        
-                        author_list.append(author_dict)
-                    
-                    return author_list
+    authors = getattr(resolve_writer(writer), '_authors', None)
+    if not authors:
+        return None
     
-    return None
+    if len(authors) == 1:
+        # Single author - return just the name as string
+        return authors[0].get('name', 'Anonymous')
+    else:
+        # Multiple authors - return list of dictionaries
+        author_list = []
+        for author in authors:
+            author_dict = {'name': author.get('name', 'Anonymous')}
+
+            # Add affiliation if available
+            if author.get('affiliation'):
+                affiliations = author['affiliation']
+                if isinstance(affiliations, list) and affiliations:
+                    author_dict['affiliation'] = affiliations[0]  # Use first affiliation
+                elif isinstance(affiliations, str):
+                    author_dict['affiliation'] = affiliations
+
+            # Add email if available
+            if author.get('contact'):
+                contacts = author['contact']
+                if isinstance(contacts, list) and contacts:
+                    # Look for email in contacts
+                    for contact in contacts:
+                        if '@' in str(contact):
+                            author_dict['email'] = contact
+                            break
+                elif isinstance(contacts, str) and '@' in contacts:
+                    author_dict['email'] = contacts
+
+            author_list.append(author_dict)
+
+        return author_list
 
 
 def generate_quarto_yaml(
@@ -104,7 +112,8 @@ def generate_quarto_yaml(
     warning: bool = False,
     message: bool = False,
     page_header: str = None,
-    page_footer: str = None
+    page_footer: str = None,
+    writer=None
 ) -> Dict[str, Any]:
     """
     Generate complete Quarto YAML frontmatter.
@@ -130,6 +139,7 @@ def generate_quarto_yaml(
         message: Show messages in output
         page_header: Custom header text for PDF pages
         page_footer: Custom footer text for PDF pages
+        writer: DocumentWriter providing authors (None = active writer)
         
     Returns:
         Dictionary with Quarto YAML configuration
@@ -150,7 +160,7 @@ def generate_quarto_yaml(
     # Base metadata
     yaml_config = {
         'title': title,
-        'author': _get_authors_for_yaml() or author or 'Anonymous',
+        'author': _get_authors_for_yaml(writer) or author or 'Anonymous',
         'lang': language,
     }
     
@@ -610,7 +620,7 @@ def _fix_image_paths_to_absolute(content: str, base_dir: Path) -> str:
 
 def create_qmd_file(
     output_path: Path,
-    content: str,
+    content: Union[str, Iterable[str]],
     yaml_config: Dict[str, Any],
     fix_image_paths: bool = False,
     layout_name: str = 'classic',
@@ -620,10 +630,13 @@ def create_qmd_file(
     Create QMD file with YAML frontmatter and content.
     
     Also generates the styles.css file for HTML rendering with the correct layout.
+    The YAML header and the content chunks are streamed to disk one after
+    another, so a large content buffer is never joined into a single string.
     
     Args:
         output_path: Path to save QMD file
-        content: Markdown content body
+        content: Markdown content body (string, or iterable of chunks such as
+            a ContentBuffer)
         yaml_config: YAML frontmatter configuration
         fix_image_paths: Convert relative image paths to absolute (default: True)
         layout_name: Layout name for CSS generation
@@ -652,30 +665,78 @@ def create_qmd_file(
     if fix_image_paths:
         # Use the directory where the QMD will be saved as base
         base_dir = output_path.parent
+        if not isinstance(content, str):
+            content = ''.join(content)
         content = _fix_image_paths_to_absolute(content, base_dir)
     
     # Generate and save CSS file for HTML rendering
     from ePy_docs.core._html import generate_css
     css_content = generate_css(layout_name=layout_name)
     css_path = output_path.parent / 'styles.css'
-    with open(css_path, 'w', encoding='utf-8') as f:
-        f.write(css_content)
+    _write_text_if_changed(css_path, css_content)
     
     # Generate YAML frontmatter
     yaml_str = yaml.dump(yaml_config, default_flow_style=False, sort_keys=False)
     
-    # Combine YAML and content
-    qmd_content = f'''---
-{yaml_str}---
+    # Stream YAML and content (unchanged files keep their timestamps)
+    body = [content] if isinstance(content, str) else content
+    _write_stream_if_changed(output_path, _iter_qmd_parts(yaml_str, body))
+    
+    return output_path
 
-{content}
-'''
+
+def _iter_qmd_parts(yaml_str: str, body: Iterable[str]) -> Iterator[str]:
+    """Yield the pieces of a QMD document: frontmatter, body chunks, final newline."""
+    yield '---\n'
+    yield yaml_str
+    yield '---\n\n'
+    yield from body
+    yield '\n'
+
+
+def _write_stream_if_changed(path: Path, parts: Iterable[str]) -> bool:
+    """Stream text parts to path unless the file already has exactly this content.
     
-    # Write to file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(qmd_content)
+    The parts are written to a sibling temporary file, which replaces path
+    only if the bytes differ.
     
-    return output_path
+    Returns:
+        True if the file was written
+    """
+    import filecmp
+    
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+        for part in parts:
+            f.write(part)
+    
+    try:
+        if path.exists() and filecmp.cmp(tmp_path, path, shallow=False):
+            tmp_path.unlink()
+            return False
+    except OSError:
+        pass
+    
+    os.replace(tmp_path, path)
+    return True
+
+
+def _write_text_if_changed(path: Path, text: str) -> bool:
+    """Write text to path unless the file already has exactly this content.
+    
+    Returns:
+        True if the file was written
+    """
+    try:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            if f.read() == text:
+                return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(text)
+    return True
 
 
 def _copy_layout_fonts_to_output(layout_name: str, output_dir: Path) -> Path:
@@ -684,8 +745,8 @@ def _copy_layout_fonts_to_output(layout_name: str, output_dir: Path) -> Path:
     Returns:
         Path to fonts directory (absolute path)
     """
-    import shutil
     from ePy_docs.core._config import get_loader
+    from ePy_docs.core._assets import stage_asset
     
     fonts_dir = output_dir / 'fonts'
     
@@ -715,9 +776,9 @@ def _copy_layout_fonts_to_output(layout_name: str, output_dir: Path) -> Path:
                 # Create fonts subdirectory in output
                 fonts_dir.mkdir(exist_ok=True)
                 
-                # Copy font file
+                # Stage font file (skipped when already up to date)
                 dest_font = fonts_dir / font_filename
-                shutil.copy2(source_font, dest_font)
+                stage_asset(source_font, dest_font)
                 
     except Exception:
         # Don't fail if font copy fails
@@ -746,8 +807,7 @@ def _copy_bibliography_files_to_output(
         Tuple of (bibliography_relative_path, csl_relative_path)
         Returns None for paths that weren't provided or couldn't be copied
     """
-    import shutil
-    from pathlib import Path
+    from ePy_docs.core._assets import stage_asset
     
     bib_relative = None
     csl_relative = None
@@ -757,9 +817,9 @@ def _copy_bibliography_files_to_output(
         try:
             source_bib = Path(bibliography_path)
             if source_bib.exists():
-                # Copy to output directory with same filename
+                # Stage in output directory with same filename
                 dest_bib = output_dir / source_bib.name
-                shutil.copy2(source_bib, dest_bib)
+                stage_asset(source_bib, dest_bib)
                 # Return just the filename (relative to .qmd location)
                 bib_relative = source_bib.name
         except Exception as e:
@@ -770,9 +830,9 @@ def _copy_bibliography_files_to_output(
         try:
             source_csl = Path(csl_path)
             if source_csl.exists():
-                # Copy to output directory with same filename
+                # Stage in output directory with same filename
                 dest_csl = output_dir / source_csl.name
-                shutil.copy2(source_csl, dest_csl)
+                stage_asset(source_csl, dest_csl)
                 # Return just the filename (relative to .qmd location)
                 csl_relative = source_csl.name
         except Exception as e:
@@ -788,7 +848,10 @@ def _copy_bibliography_files_to_output(
 def render_qmd(
     qmd_path: Path,
     output_format: Optional[str] = None,
-    output_dir: Optional[Path] = None
+    output_dir: Optional[Path] = None,
+    output_name: Optional[str] = None,
+    timeout: Optional[float] = None,
+    env: Optional[Dict[str, str]] = None
 ) -> Path:
     """
     Render QMD file using Quarto.
@@ -797,12 +860,16 @@ def render_qmd(
         qmd_path: Path to QMD file
         output_format: Specific format to render ('pdf', 'html', or None for all)
         output_dir: Output directory (optional)
+        output_name: Output filename, written next to the QMD (optional)
+        timeout: Seconds before the Quarto process is killed (None = no limit)
+        env: Environment for the Quarto process (None = inherit)
         
     Returns:
         Path to output file
         
     Raises:
         RuntimeError: If Quarto rendering fails
+        TimeoutError: If Quarto does not finish within timeout
     """
     if not qmd_path.exists():
         raise FileNotFoundError(f"QMD file not found: {qmd_path}")
@@ -814,9 +881,11 @@ def render_qmd(
         cmd.extend(['--to', output_format])
         
         # For HTML, specify output filename to match the QMD base name
-        if output_format == 'html':
-            html_filename = qmd_path.with_suffix('.html').name
-            cmd.extend(['--output', html_filename])
+        if output_format == 'html' and not output_name:
+            output_name = qmd_path.with_suffix('.html').name
+    
+    if output_name:
+        cmd.extend(['--output', output_name])
     
     if output_dir:
         cmd.extend(['--output-dir', str(output_dir)])
@@ -828,11 +897,15 @@ def render_qmd(
             check=True,
             capture_output=True,
             text=True,
-            cwd=qmd_path.parent
+            cwd=qmd_path.parent,
+            timeout=timeout,
+            env=env
         )
         
         # Determine output file path
-        if output_format == 'pdf':
+        if output_name:
+            output_file = qmd_path.with_name(output_name)
+        elif output_format == 'pdf':
             output_file = qmd_path.with_suffix('.pdf')
         elif output_format == 'html':
             output_file = qmd_path.with_suffix('.html')
@@ -846,6 +919,137 @@ def render_qmd(
     except subprocess.CalledProcessError as e:
         error_msg = f"Quarto rendering failed:\n{e.stderr}"
         raise RuntimeError(error_msg) from e
+    except subprocess.TimeoutExpired as e:
+        raise TimeoutError(f"Quarto rendering of {qmd_path.name} timed out after {timeout:.1f}s") from e
+
+
+_FORMAT_EXTENSIONS = {'html': '.html', 'pdf': '.pdf', 'docx': '.docx'}
+
+
+# Isolated working directory -> directory of the QMD it was copied from
+_ISOLATED_SOURCES: Dict[str, str] = {}
+_isolated_lock = threading.Lock()
+
+
+def _source_document_dir(qmd_path: Path) -> str:
+    """Resolved directory of a QMD, seen through _render_isolated's copies."""
+    document_dir = str(qmd_path.parent.resolve())
+    with _isolated_lock:
+        return _ISOLATED_SOURCES.get(document_dir, document_dir)
+
+
+def _stage_document_dir(source_dir: Path, work_dir: Path, skip: Iterable[str]) -> None:
+    """Mirror a document directory into a working directory.
+    
+    Entries are symlinked (copied where symlinks are unavailable), so images,
+    CSS, fonts, bibliography and template partials resolve as in the source.
+    """
+    skip = set(skip)
+    for entry in source_dir.iterdir():
+        if entry.name in skip or entry.name.startswith('.') or Path(entry.name).stem in skip:
+            continue
+        target = work_dir / entry.name
+        try:
+            os.symlink(entry.resolve(), target, target_is_directory=entry.is_dir())
+        except OSError:
+            if entry.is_dir():
+                shutil.copytree(entry, target)
+            else:
+                shutil.copy2(entry, target)
+
+
+def _render_isolated(qmd_path: Path, output_format: str, renderer=None) -> Path:
+    """Render one format from its own working directory.
+    
+    Quarto names its intermediates after the input (``<stem>_files/``,
+    ``<stem>.tex``) and keeps freeze/cache state in ``.quarto/`` under the
+    render directory, so concurrent renders from one directory would race on
+    both. Each format instead renders a copy of the QMD inside a private
+    directory created next to the document directory (``..`` still resolves
+    to the same place) that mirrors the document's assets; the output is
+    moved back next to the original QMD and the directory is removed.
+    """
+    import tempfile
+    
+    source_dir = qmd_path.parent.resolve()
+    output_name = qmd_path.with_suffix(_FORMAT_EXTENSIONS[output_format]).name
+    work_dir = Path(tempfile.mkdtemp(prefix=f".{source_dir.name}__{output_format}_",
+                                     dir=source_dir.parent))
+    document_dir = _source_document_dir(qmd_path)
+    with _isolated_lock:
+        _ISOLATED_SOURCES[str(work_dir.resolve())] = document_dir
+    try:
+        stem = qmd_path.stem
+        skip = {stem, f"{stem}_files"}  # the QMD, its outputs and intermediates
+        _stage_document_dir(source_dir, work_dir, skip)
+        isolated_qmd = work_dir / qmd_path.name
+        shutil.copyfile(qmd_path, isolated_qmd)
+        
+        output = (renderer or render_qmd)(isolated_qmd, output_format=output_format, output_name=output_name)
+        final = qmd_path.with_name(output_name)
+        os.replace(output, final)
+        return final
+    finally:
+        with _isolated_lock:
+            _ISOLATED_SOURCES.pop(str(work_dir.resolve()), None)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def render_formats_concurrently(
+    qmd_path: Path,
+    output_formats: List[str],
+    max_workers: int = 4,
+    renderer=None
+) -> Dict[str, Union[Path, Exception]]:
+    """
+    Render several formats of one QMD at the same time.
+    
+    Each format runs in its own ``quarto`` subprocess (at most ``max_workers``
+    at once). HTML renders the original QMD so its ``<stem>_files`` support
+    folder keeps the expected name; PDF and DOCX render copies from their
+    own working directories (see _render_isolated), so no two Quarto
+    processes share a cwd or its ``.quarto/`` state.
+    Formats without a known output extension run afterwards, one by one.
+    
+    Args:
+        qmd_path: Path to QMD file
+        output_formats: Formats to render
+        max_workers: Maximum number of concurrent Quarto processes
+        renderer: Callable with render_qmd's signature (None = render_qmd)
+        
+    Returns:
+        Dictionary mapping each format to its output path, or to the
+        exception raised while rendering it
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    renderer = renderer or render_qmd
+    
+    def _render(fmt: str) -> Union[Path, Exception]:
+        try:
+            if fmt == 'html':
+                return renderer(qmd_path, output_format=fmt)
+            return _render_isolated(qmd_path, fmt, renderer)
+        except Exception as e:
+            return e
+    
+    concurrent = [fmt for fmt in output_formats if fmt in _FORMAT_EXTENSIONS]
+    sequential = [fmt for fmt in output_formats if fmt not in _FORMAT_EXTENSIONS]
+    
+    outcomes = {}
+    if concurrent:
+        workers = max(1, min(max_workers, len(concurrent)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for fmt, outcome in zip(concurrent, executor.map(_render, concurrent)):
+                outcomes[fmt] = outcome
+    
+    for fmt in sequential:
+        try:
+            outcomes[fmt] = renderer(qmd_path, output_format=fmt)
+        except Exception as e:
+            outcomes[fmt] = e
+    
+    return outcomes
 
 
 def render_to_pdf(qmd_path: Path) -> Path:
@@ -858,13 +1062,487 @@ def render_to_html(qmd_path: Path) -> Path:
     return render_qmd(qmd_path, output_format='html')
 
 
+# =============================================================================
+# RENDER SERVICE
+# =============================================================================
+
+# Template partial that carries the precompiled part of the LaTeX preamble
+FORMAT_PARTIAL_NAME = 'doc-class.tex'
+
+# TeX binary that dumps a format for each engine Quarto may run
+_FORMAT_ENGINES = {'pdflatex': 'pdftex', 'xelatex': 'xetex'}
+
+FORMAT_BUILD_TIMEOUT = 300  # seconds
+
+# Package options Quarto's LaTeX template passes right after the doc-class
+# partial. The format loads packages (xcolor, ...) before the template runs,
+# so it must see the same options or LaTeX reports an option clash.
+_TEMPLATE_PACKAGE_OPTIONS = (
+    ('hyperref', 'unicode'),
+    ('url', 'hyphens'),
+    ('xcolor', 'dvipsnames,svgnames,x11names'),
+)
+
+
+class RenderService(ABC):
+    """
+    SOLID: Strategy Pattern - How QMD files are handed to Quarto.
+    
+    create_and_render() calls prepare() before the QMD file is written and
+    render() once per output format. A service can outlive a single document,
+    so it may keep state (working directories, compiled LaTeX formats)
+    between renders.
+    """
+    
+    def prepare(self, yaml_config: Dict[str, Any], output_dir: Path,
+                layout_name: str, document_type: str) -> None:
+        """Adjust the YAML configuration of a document about to be written."""
+    
+    @abstractmethod
+    def render(self, qmd_path: Path, output_format: Optional[str] = None,
+               output_name: Optional[str] = None, timeout: Optional[float] = None) -> Path:
+        """Render a QMD file (same contract as render_qmd)."""
+    
+    def close(self) -> None:
+        """Release resources held by the service."""
+    
+    def stats(self) -> Dict[str, Any]:
+        """Render counters."""
+        return {}
+    
+    def __enter__(self) -> 'RenderService':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class SubprocessRenderService(RenderService):
+    """Cold renders: every call starts a fresh ``quarto render`` (default)."""
+    
+    def __init__(self):
+        self._renders = 0
+    
+    def render(self, qmd_path: Path, output_format: Optional[str] = None,
+               output_name: Optional[str] = None, timeout: Optional[float] = None) -> Path:
+        self._renders += 1
+        return render_qmd(qmd_path, output_format=output_format, output_name=output_name, timeout=timeout)
+    
+    def stats(self) -> Dict[str, Any]:
+        return {'renders': self._renders}
+
+
+class LocalRenderService(RenderService):
+    """
+    Render service that keeps LaTeX preamble work between PDF renders.
+    
+    Experimental and opt-in (use_render_server()); the default service is
+    SubprocessRenderService.
+    
+    Each layout's header packages (HeaderGenerator.generate_format_preamble)
+    are dumped once into a LaTeX format with mylatexformat, stored under a
+    persistent working directory. Documents get a ``doc-class.tex`` template
+    partial holding the class line and those packages followed by
+    ``\\endofdump``; PDF renders run with TEXFORMATS pointing at the format,
+    so LaTeX starts from it and skips that part of the preamble.
+    
+    pdfLaTeX and XeLaTeX are supported (LuaLaTeX renders normally). Any
+    failure falls back to a plain render with Quarto's own template, and the
+    reason is logged: preparing or building a format (engine or mylatexformat
+    missing, ...) renders the document without it; a failed warm render
+    removes the partial from the QMD, renders it again and discards the
+    format.
+    """
+    
+    def __init__(self, work_dir: Optional[Union[str, Path]] = None, precompile: bool = True):
+        """Initialize service.
+        
+        Args:
+            work_dir: Persistent working directory (None = user cache directory)
+            precompile: Build and use precompiled preamble formats
+        """
+        from ePy_docs.core._paths import get_cache_directory
+        self.work_dir = Path(work_dir) if work_dir else get_cache_directory('render')
+        self.precompile = precompile
+        self._lock = threading.RLock()
+        self._documents: Dict[str, Tuple[str, Path]] = {}  # document dir -> (format key, format dir)
+        self._failed = set()  # format keys that could not be built
+        self._stats = {'renders': 0, 'warm_renders': 0, 'formats_built': 0,
+                       'format_failures': 0, 'fallbacks': 0}
+    
+    @staticmethod
+    def _documentclass_line(pdf_config: Dict[str, Any]) -> str:
+        """Reproduce the \\documentclass line of Quarto's doc-class partial."""
+        options = []
+        if pdf_config.get('fontsize'):
+            options.append(str(pdf_config['fontsize']))
+        papersize = pdf_config.get('papersize')
+        if papersize:
+            papersize = str(papersize)
+            options.append(papersize if papersize.endswith('paper') else f"{papersize}paper")
+        classoption = pdf_config.get('classoption') or []
+        if isinstance(classoption, str):
+            classoption = [classoption]
+        options.extend(str(option) for option in classoption)
+        documentclass = pdf_config.get('documentclass', 'article')
+        return f"\\documentclass[{','.join(options)}]{{{documentclass}}}"
+    
+    @staticmethod
+    def _template_package_options(pdf_config: Dict[str, Any]) -> str:
+        """\\PassOptionsToPackage lines Quarto's template emits after the class line."""
+        lines = []
+        for package, options in _TEMPLATE_PACKAGE_OPTIONS:
+            if package == 'hyperref':
+                extra = pdf_config.get('hyperrefoptions') or []
+                if isinstance(extra, str):
+                    extra = [extra]
+                options = ','.join([options] + [str(option) for option in extra])
+            lines.append(f"\\PassOptionsToPackage{{{options}}}{{{package}}}")
+        return '\n'.join(lines)
+    
+    def prepare(self, yaml_config: Dict[str, Any], output_dir: Path,
+                layout_name: str, document_type: str) -> None:
+        """Add the precompiled-preamble partial to the PDF configuration."""
+        document_dir = str(Path(output_dir).resolve())
+        with self._lock:
+            self._documents.pop(document_dir, None)
+        
+        pdf_config = yaml_config.get('format', {}).get('pdf')
+        if not self.precompile or not isinstance(pdf_config, dict):
+            return
+        engine = pdf_config.get('pdf-engine', 'xelatex')
+        if engine not in _FORMAT_ENGINES:
+            return
+        
+        try:
+            from ePy_docs.core._pdf import PdfOrchestrator
+            packages = PdfOrchestrator().get_pdf_format_preamble(layout_name, document_type)
+            preamble = (f"{self._documentclass_line(pdf_config)}\n"
+                        f"{self._template_package_options(pdf_config)}\n"
+                        f"\\providecommand{{\\endofdump}}{{}}\n{packages}\n\\endofdump\n")
+            key = hashlib.sha256(f"{engine}\n{preamble}".encode('utf-8')).hexdigest()[:16]
+            format_dir = self._ensure_format(key, engine, preamble)
+        except Exception as e:
+            logger.warning(f"Precompiled preamble disabled for layout '{layout_name}': {e}")
+            return
+        if format_dir is None:
+            return
+        
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        _write_text_if_changed(Path(output_dir) / FORMAT_PARTIAL_NAME, preamble)
+        partials = list(pdf_config.get('template-partials', []))
+        if FORMAT_PARTIAL_NAME not in partials:
+            partials.append(FORMAT_PARTIAL_NAME)
+        pdf_config['template-partials'] = partials
+        with self._lock:
+            self._documents[document_dir] = (key, format_dir)
+    
+    def _ensure_format(self, key: str, engine: str, preamble: str) -> Optional[Path]:
+        """Return the directory holding the compiled format, building it if needed."""
+        with self._lock:
+            if key in self._failed:
+                return None
+            format_dir = self.work_dir / 'formats' / key
+            format_file = format_dir / f"{engine}.fmt"
+            if format_file.exists():
+                return format_dir
+            
+            format_dir.mkdir(parents=True, exist_ok=True)
+            (format_dir / 'preamble.tex').write_text(preamble, encoding='utf-8')
+            cmd = [_FORMAT_ENGINES[engine], '-ini', '-interaction=batchmode',
+                   f"-jobname={engine}", f"&{engine}", 'mylatexformat.ltx', 'preamble.tex']
+            reason = None
+            try:
+                subprocess.run(cmd, cwd=format_dir, check=True, capture_output=True,
+                               stdin=subprocess.DEVNULL, timeout=FORMAT_BUILD_TIMEOUT)
+            except (OSError, subprocess.SubprocessError) as e:
+                reason = str(e)
+            
+            if not format_file.exists():
+                self._failed.add(key)
+                self._stats['format_failures'] += 1
+                log_tail = self._log_tail(format_dir / f"{engine}.log")
+                logger.warning(f"Could not build {engine} preamble format {key}; rendering without it: "
+                               f"{reason or 'no format file written'}{log_tail}")
+                return None
+            self._stats['formats_built'] += 1
+            return format_dir
+    
+    def render(self, qmd_path: Path, output_format: Optional[str] = None,
+               output_name: Optional[str] = None, timeout: Optional[float] = None) -> Path:
+        with self._lock:
+            self._stats['renders'] += 1
+            document = self._documents.get(_source_document_dir(qmd_path))
+        
+        if document is None or output_format != 'pdf':
+            return render_qmd(qmd_path, output_format=output_format, output_name=output_name, timeout=timeout)
+        
+        key, format_dir = document
+        env = dict(os.environ, TEXFORMATS=f"{format_dir}{os.pathsep}")
+        try:
+            output = render_qmd(qmd_path, output_format=output_format, output_name=output_name,
+                                timeout=timeout, env=env)
+        except Exception as e:
+            # Render with Quarto's own template; the format is not used again
+            logger.warning(f"Warm PDF render of {qmd_path.name} failed, rendering without "
+                           f"preamble format {key}: {e}")
+            with self._lock:
+                self._stats['fallbacks'] += 1
+                self._failed.add(key)
+                self._documents.pop(_source_document_dir(qmd_path), None)
+                shutil.rmtree(format_dir, ignore_errors=True)
+            _remove_template_partial(qmd_path, FORMAT_PARTIAL_NAME)
+            return render_qmd(qmd_path, output_format=output_format, output_name=output_name, timeout=timeout)
+        
+        with self._lock:
+            self._stats['warm_renders'] += 1
+        return output
+    
+    @staticmethod
+    def _log_tail(log_path: Path, lines: int = 10) -> str:
+        """Last lines of a TeX log, prefixed with a newline ('' if unreadable)."""
+        try:
+            tail = log_path.read_text(encoding='utf-8', errors='replace').splitlines()[-lines:]
+        except OSError:
+            return ''
+        return '\n' + '\n'.join(tail)
+    
+    def clear(self) -> None:
+        """Delete compiled formats (they are rebuilt on the next prepare())."""
+        with self._lock:
+            self._documents.clear()
+            self._failed.clear()
+            shutil.rmtree(self.work_dir / 'formats', ignore_errors=True)
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._stats, formats=len({key for key, _ in self._documents.values()}))
+
+
+def _remove_template_partial(qmd_path: Path, partial_name: str) -> None:
+    """Drop a template partial from the PDF format of a written QMD file."""
+    text = qmd_path.read_text(encoding='utf-8')
+    if not text.startswith('---\n'):
+        return
+    end = text.find('\n---\n', 4)
+    if end < 0:
+        return
+    front_matter = yaml.safe_load(text[4:end + 1]) or {}
+    pdf_config = front_matter.get('format', {}).get('pdf')
+    if not isinstance(pdf_config, dict) or partial_name not in pdf_config.get('template-partials', []):
+        return
+    
+    partials = [name for name in pdf_config['template-partials'] if name != partial_name]
+    if partials:
+        pdf_config['template-partials'] = partials
+    else:
+        del pdf_config['template-partials']
+    yaml_str = yaml.dump(front_matter, default_flow_style=False, sort_keys=False)
+    qmd_path.write_text(f"---\n{yaml_str}{text[end + 1:]}", encoding='utf-8')
+
+
+_render_service: RenderService = SubprocessRenderService()
+
+
+def get_render_service() -> RenderService:
+    """Get the render service used by create_and_render()."""
+    return _render_service
+
+
+def set_render_service(service: Optional[RenderService] = None) -> RenderService:
+    """Install a render service process-wide.
+    
+    Args:
+        service: Service to use (None = cold SubprocessRenderService)
+        
+    Returns:
+        The previously installed service (not closed)
+    """
+    global _render_service
+    previous = _render_service
+    _render_service = service if service is not None else SubprocessRenderService()
+    return previous
+
+
+def use_render_server(enabled: bool = True, work_dir: Optional[Union[str, Path]] = None) -> RenderService:
+    """Switch between warm (LocalRenderService) and cold rendering.
+    
+    An already installed LocalRenderService with the same working directory
+    is kept, so its compiled formats stay in use.
+    
+    Args:
+        enabled: Use LocalRenderService (False = cold renders)
+        work_dir: Working directory for compiled formats (None = user cache directory)
+        
+    Returns:
+        The active render service
+    """
+    current = get_render_service()
+    if enabled:
+        if not isinstance(current, LocalRenderService) or (
+                work_dir is not None and current.work_dir != Path(work_dir)):
+            set_render_service(LocalRenderService(work_dir)).close()
+    elif isinstance(current, LocalRenderService):
+        set_render_service(None).close()
+    return get_render_service()
+
+
+# =============================================================================
+# INCREMENTAL BUILD MANIFEST
+# =============================================================================
+
+BUILD_MANIFEST_VERSION = 1
+
+_IMAGE_REFERENCE_PATTERNS = (
+    re.compile(r'!\[[^\]]*\]\(\s*<?([^)\s>]+)>?'),
+    re.compile(r'<img[^>]*\ssrc=["\']([^"\']+)["\']', re.IGNORECASE),
+)
+
+
+def get_build_manifest_path(qmd_path: Path) -> Path:
+    """Return the build manifest location for a QMD file."""
+    return qmd_path.with_name(f"{qmd_path.stem}.build.json")
+
+
+def _hash_file(path: Path, digest=None):
+    """Feed file contents into a hash (or a 'missing' marker if absent)."""
+    digest = digest if digest is not None else hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    except OSError:
+        digest.update(b'<missing>')
+    return digest
+
+
+def _find_referenced_images(qmd_text: str, base_dir: Path) -> List[Path]:
+    """Collect local image files referenced from markdown/HTML in the QMD."""
+    images = set()
+    for pattern in _IMAGE_REFERENCE_PATTERNS:
+        for match in pattern.finditer(qmd_text):
+            ref = match.group(1).strip()
+            if not ref or '://' in ref or ref.startswith('data:'):
+                continue
+            ref_path = Path(ref)
+            images.add(ref_path if ref_path.is_absolute() else base_dir / ref_path)
+    return sorted(images)
+
+
+def compute_build_inputs_hash(qmd_path: Path) -> str:
+    """Hash everything Quarto reads when rendering a QMD file.
+    
+    Covers the QMD text, styles.css, files in fonts/, the bibliography and CSL
+    files declared in the YAML front matter, and every referenced local image.
+    
+    Args:
+        qmd_path: Path to the written QMD file
+        
+    Returns:
+        Hex digest of all render inputs
+    """
+    base_dir = qmd_path.parent
+    qmd_text = qmd_path.read_text(encoding='utf-8')
+    
+    inputs = [qmd_path, base_dir / 'styles.css']
+    
+    fonts_dir = base_dir / 'fonts'
+    if fonts_dir.is_dir():
+        inputs.extend(sorted(p for p in fonts_dir.iterdir() if p.is_file()))
+    
+    # Bibliography/CSL are referenced by filename in the front matter
+    for key in ('bibliography', 'csl'):
+        match = re.search(rf'^{key}:\s*(.+?)\s*$', qmd_text, re.MULTILINE)
+        if match:
+            inputs.append(base_dir / match.group(1).strip('\'"'))
+    
+    inputs.extend(_find_referenced_images(qmd_text, base_dir))
+    
+    digest = hashlib.sha256()
+    for path in inputs:
+        try:
+            name = path.relative_to(base_dir).as_posix()
+        except ValueError:
+            name = str(path)
+        digest.update(name.encode('utf-8') + b'\0')
+        _hash_file(path, digest)
+        digest.update(b'\0')
+    
+    return digest.hexdigest()
+
+
+def load_build_manifest(qmd_path: Path) -> Dict[str, Any]:
+    """Load the build manifest for a QMD file (empty if absent or stale)."""
+    manifest_path = get_build_manifest_path(qmd_path)
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {'version': BUILD_MANIFEST_VERSION, 'outputs': {}}
+    
+    if not isinstance(manifest, dict) or manifest.get('version') != BUILD_MANIFEST_VERSION:
+        return {'version': BUILD_MANIFEST_VERSION, 'outputs': {}}
+    manifest.setdefault('outputs', {})
+    return manifest
+
+
+def save_build_manifest(qmd_path: Path, manifest: Dict[str, Any]) -> None:
+    """Write the build manifest next to the QMD file (best effort)."""
+    manifest_path = get_build_manifest_path(qmd_path)
+    try:
+        tmp_path = manifest_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        tmp_path.replace(manifest_path)
+    except OSError:
+        pass
+
+
+def get_up_to_date_output(manifest: Dict[str, Any], fmt: str, inputs_hash: str) -> Optional[Path]:
+    """Return the recorded output for fmt if it was built from identical inputs.
+    
+    The output file must still exist with the size and modification time
+    recorded when it was rendered.
+    """
+    entry = manifest.get('outputs', {}).get(fmt)
+    if not entry or entry.get('inputs') != inputs_hash:
+        return None
+    
+    output_file = Path(entry.get('path', ''))
+    try:
+        stat = output_file.stat()
+    except OSError:
+        return None
+    
+    if not output_file.is_file() or stat.st_size != entry.get('size') or stat.st_mtime_ns != entry.get('mtime_ns'):
+        return None
+    return output_file
+
+
+def record_build_output(manifest: Dict[str, Any], fmt: str, inputs_hash: str,
+                        output_file: Optional[Path]) -> None:
+    """Record a rendered output in the manifest (directories are not tracked)."""
+    outputs = manifest.setdefault('outputs', {})
+    if output_file is None or not Path(output_file).is_file():
+        outputs.pop(fmt, None)
+        return
+    
+    stat = Path(output_file).stat()
+    outputs[fmt] = {
+        'inputs': inputs_hash,
+        'path': str(Path(output_file).resolve()),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+    }
+
+
 # =============================================================================
 # COMPLETE WORKFLOW
 # =============================================================================
 
 def create_and_render(
     output_path: Path,
-    content: str,
+    content: Union[str, Iterable[str]],
     title: str,
     layout_name: str = 'classic',
     document_type: str = 'article',
@@ -873,14 +1551,21 @@ def create_and_render(
     bibliography_path: str = None,
     csl_path: str = None,
     page_header: str = None,
-    page_footer: str = None
+    page_footer: str = None,
+    force: bool = False,
+    render_workers: int = 1,
+    writer=None
 ) -> Dict[str, Path]:
     """
     Complete workflow: create QMD and render to specified formats.
     
+    Formats whose inputs (QMD, CSS, fonts, bibliography, images) are unchanged
+    since the last render, according to the build manifest stored next to the
+    QMD, are returned without invoking Quarto.
+    
     Args:
         output_path: Path to save QMD file
-        content: Markdown content
+        content: Markdown content (string or iterable of chunks, e.g. a ContentBuffer)
         title: Document title
         layout_name: Layout name
         document_type: Document type
@@ -890,6 +1575,10 @@ def create_and_render(
         csl_path: Path to CSL style file (.csl) - will be copied to output directory
         page_header: Custom header text for PDF pages
         page_footer: Custom footer text for PDF pages
+        force: Render every format even if the build manifest says it is up to date
+        render_workers: Maximum number of formats rendered at the same time
+            (1 = one Quarto process after another)
+        writer: DocumentWriter providing project metadata (None = active writer)
         
     Returns:
         Dictionary mapping format names to output file paths
@@ -922,7 +1611,7 @@ def create_and_render(
     
     # Get project metadata for title, author, etc.
     from ePy_docs.core._project import get_project_metadata
-    project_info = get_project_metadata()
+    project_info = get_project_metadata(writer=writer)
     
     # Use project metadata or provided title
     final_title = title or project_info.get('name', 'Document')
@@ -943,9 +1632,14 @@ def create_and_render(
         bibliography_path=bib_relative,  # Use relative path (just filename)
         csl_path=csl_relative,           # Use relative path (just filename)
         page_header=page_header,
-        page_footer=page_footer
+        page_footer=page_footer,
+        writer=writer
     )
     
+    # Let the render service adjust the YAML (e.g. precompiled preamble partial)
+    render_service = get_render_service()
+    render_service.prepare(yaml_config, output_dir, layout_name, document_type)
+    
     # Create QMD file with CSS generation
     # Don't fix image paths since our tables already generate correct relative paths
     qmd_path = create_qmd_file(output_path, content, yaml_config, fix_image_paths=False, 
@@ -954,36 +1648,70 @@ def create_and_render(
     # Render to each format with progress bar
     results = {'qmd': qmd_path}
     
-    # Generate formats without progress bar
-    format_iterator = output_formats
-    print(f"Generando {len(output_formats)} formato(s)...")
+    # Incremental build: compare render inputs with the last successful build
+    manifest = load_build_manifest(qmd_path)
+    inputs_hash = compute_build_inputs_hash(qmd_path)
     
-    for i, fmt in enumerate(format_iterator):
-        print(f"  [{i+1}/{len(output_formats)}] Generando {fmt.upper()}...")
+    # Formats already rendered from identical inputs are reused as-is
+    total = len(output_formats)
+    pending = []
+    print(f"Generando {total} formato(s)...")
+    
+    for i, fmt in enumerate(output_formats):
+        up_to_date = None if force else get_up_to_date_output(manifest, fmt, inputs_hash)
+        if up_to_date is not None:
+            results[fmt] = up_to_date
+            print(f"  [{i+1}/{total}] {fmt.upper()} sin cambios (se reutiliza)")
+        else:
+            pending.append((i, fmt))
+    
+    # Concurrent mode: every pending format runs in its own Quarto process
+    outcomes = None
+    if render_workers and render_workers > 1 and len(pending) > 1:
+        for i, fmt in pending:
+            print(f"  [{i+1}/{total}] Generando {fmt.upper()} (en paralelo)...")
+        outcomes = render_formats_concurrently(
+            qmd_path, [fmt for _, fmt in pending], max_workers=render_workers,
+            renderer=render_service.render
+        )
+    
+    for i, fmt in pending:
+        if outcomes is None:
+            print(f"  [{i+1}/{total}] Generando {fmt.upper()}...")
+            try:
+                outcome = render_service.render(qmd_path, output_format=fmt)
+            except Exception as e:
+                outcome = e
+        else:
+            outcome = outcomes[fmt]
+            print(f"  [{i+1}/{total}] {fmt.upper()}:")
         
-        try:
-            output_file = render_qmd(qmd_path, output_format=fmt)
-            results[fmt] = output_file
+        if not isinstance(outcome, Exception):
+            results[fmt] = outcome
+            record_build_output(manifest, fmt, inputs_hash, outcome)
             print(f"      ✅ {fmt.upper()} generado")
-        except Exception as e:
-            error_msg = str(e)
-            
-            # Check if error is just Chrome warnings but file was actually created
-            expected_output = qmd_path.with_suffix(f'.{fmt}')
-            if expected_output.exists():
-                # File was created successfully despite warnings
-                results[fmt] = expected_output
-                print(f"      ✅ {fmt.upper()} generado (con advertencias)")
-            else:
-                # Actual failure
-                print(f"      ❌ Error generando {fmt.upper()}")
-                if fmt in ['pdf', 'docx']:
-                    print(f"         Detalles: {error_msg[:100]}...")
-                    if 'chromium' in error_msg.lower() or 'chrome' in error_msg.lower():
-                        print("         💡 Puede requerir Chromium: quarto install tool chromium")
-                results[fmt] = None
+            continue
+        
+        error_msg = str(outcome)
+        
+        # Check if error is just Chrome warnings but file was actually created
+        expected_output = qmd_path.with_suffix(f'.{fmt}')
+        if expected_output.exists():
+            # File was created successfully despite warnings
+            results[fmt] = expected_output
+            print(f"      ✅ {fmt.upper()} generado (con advertencias)")
+        else:
+            # Actual failure
+            print(f"      ❌ Error generando {fmt.upper()}")
+            if fmt in ['pdf', 'docx']:
+                print(f"         Detalles: {error_msg[:100]}...")
+                if 'chromium' in error_msg.lower() or 'chrome' in error_msg.lower():
+                    print("         💡 Puede requerir Chromium: quarto install tool chromium")
+            results[fmt] = None
+            record_build_output(manifest, fmt, inputs_hash, None)
     
     # Generation completed
+    save_build_manifest(qmd_path, manifest)
     
     return results
 
@@ -1109,6 +1837,82 @@ def diagnose_pdf_issues() -> str:
     return diagnostic
 
 
+def benchmark_pdf_render(
+    content: str = "# Benchmark\n\nRender latency benchmark.\n",
+    layout_name: str = 'classic',
+    document_type: str = 'report',
+    runs: int = 3,
+    output_dir: Optional[Path] = None,
+    work_dir: Optional[Path] = None
+) -> Dict[str, Any]:
+    """
+    Compare cold and warm (LocalRenderService) PDF render latency.
+    
+    The same document is rendered ``runs`` times with each service (build
+    manifest bypassed). The first warm run also builds the preamble format,
+    so it is reported separately from the warm mean.
+    
+    Args:
+        content: Markdown body of the benchmark document
+        layout_name: Layout to render with
+        document_type: Document type
+        runs: Renders per service (>= 1)
+        output_dir: Directory for the benchmark document (None = temporary)
+        work_dir: LocalRenderService working directory (None = temporary)
+        
+    Returns:
+        Dictionary with per-run seconds ('cold', 'warm'), 'cold_mean',
+        'warm_first', 'warm_mean' (excluding the first warm run when
+        runs > 1) and the warm service stats
+        
+    Raises:
+        ValueError: If runs < 1
+        RuntimeError: If a PDF could not be rendered
+    """
+    import tempfile
+    import time
+    
+    if runs < 1:
+        raise ValueError(f"runs must be >= 1, got {runs}")
+    
+    with tempfile.TemporaryDirectory(prefix='epy_docs_bench_') as tmp_dir:
+        output_dir = Path(output_dir) if output_dir else Path(tmp_dir) / 'output'
+        work_dir = Path(work_dir) if work_dir else Path(tmp_dir) / 'render'
+        
+        def _timed_runs(service: RenderService, name: str) -> List[float]:
+            (output_dir / name).mkdir(parents=True, exist_ok=True)
+            previous = set_render_service(service)
+            timings = []
+            try:
+                for _ in range(runs):
+                    start = time.perf_counter()
+                    results = create_and_render(
+                        output_dir / name / 'benchmark.qmd', content, 'Benchmark',
+                        layout_name=layout_name, document_type=document_type,
+                        output_formats=['pdf'], force=True
+                    )
+                    timings.append(time.perf_counter() - start)
+                    if results.get('pdf') is None:
+                        raise RuntimeError(f"PDF render failed during {name} benchmark run")
+            finally:
+                set_render_service(previous)
+            return timings
+        
+        cold = _timed_runs(SubprocessRenderService(), 'cold')
+        warm_service = LocalRenderService(work_dir)
+        warm = _timed_runs(warm_service, 'warm')
+        warm_steady = warm[1:] or warm
+        
+        return {
+            'cold': cold,
+            'warm': warm,
+            'cold_mean': sum(cold) / len(cold),
+            'warm_first': warm[0],
+            'warm_mean': sum(warm_steady) / len(warm_steady),
+            'warm_stats': warm_service.stats(),
+        }
+
+
 # =============================================================================
 # QUARTO FILE PROCESSING FOR WRITER
 # =============================================================================
@@ -1236,9 +2040,10 @@ def _process_image_line(line: str, file_path: str, core, show_figure: bool = Fal
     output_dir = Path(core.output_dir) / 'figures'
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    # Copy image to figures/ with original filename
+    # Stage image in figures/ with original filename
+    from ePy_docs.core._assets import stage_asset
     dest_image = output_dir / source_image.name
-    shutil.copy2(source_image, dest_image)
+    stage_asset(source_image, dest_image)
     
     # Update markdown line with new path
     new_path = f'figures/{source_image.name}'
@@ -1577,16 +2382,17 @@ def prepare_generation(writer_instance, output_filename: str = None):
         output_filename: Optional output filename
         
     Returns:
-        Tuple of (content, title)
+        Tuple of (content, title); content is the writer's buffer, which is
+        streamed to the QMD file rather than joined here
         
     Raises:
         ValueError: If buffer is empty
     """
-    # Get content from buffer (writers.py provides content_buffer directly)
-    content = ''.join(writer_instance.content_buffer)
+    # Content buffer (writers.py provides content_buffer directly)
+    content = writer_instance.content_buffer
     
     # Validate content is not empty
-    if not content or content.strip() == '':
+    if not content or all(not chunk.strip() for chunk in content):
         raise ValueError("Cannot generate document: buffer is empty. Add some content first.")
     
     # Integrity legend is now handled in the title page (include-before-body)
@@ -10,7 +10,8 @@ Handles:
 
 from typing import Dict, Any, List, Optional
 from pathlib import Path
-import shutil
+
+from ._assets import stage_asset
 
 
 # =============================================================================
@@ -173,7 +174,7 @@ def copy_bibliography_to_output(
     filename: str = 'references.bib'
 ) -> Path:
     """
-    Copy bibliography file to output directory.
+    Copy bibliography file to output directory (skipped when up to date).
     
     Args:
         source_path: Source bibliography file
@@ -186,7 +187,7 @@ def copy_bibliography_to_output(
     output_dir.mkdir(parents=True, exist_ok=True)
     dest_path = output_dir / filename
     
-    shutil.copy2(source_path, dest_path)
+    stage_asset(source_path, dest_path)
     
     return dest_path
 
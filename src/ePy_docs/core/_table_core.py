@@ -6,17 +6,30 @@ Consolidates table configuration, styling, and cell formatting logic.
 - FontManager: Handles font selection and sizing
 - ColorManager: Handles color palettes and application
 - CellFormatter: Handles cell content formatting and layout
+- PreparedTableCells: Batched bold-marker and superscript preprocessing
+- GlyphAdvanceCache: Text widths from font glyph advances (column widths)
 """
 
+from ePy_docs.core._lazy import ensure_matplotlib
+ensure_matplotlib()  # Backend and font fallback before pyplot is imported
+
 import matplotlib.pyplot as plt
 from matplotlib import rcParams
 from typing import Dict, Any, Tuple, List, Optional, Union
+from collections import OrderedDict
+import json
+import threading
 import warnings
 import logging
+import numpy as np
 import pandas as pd
 from ePy_docs.core._images import convert_rgb_to_matplotlib, get_palette_color_by_tone
-from ePy_docs.core._data import TableContentAnalyzer
-from ePy_docs.core._format import TableTextWrapper, SuperscriptFormatter, FormatConfig
+from ePy_docs.core._data import TableContentAnalyzer, TableProfile
+from ePy_docs.core._format import (
+    TableTextWrapper, SuperscriptFormatter, FormatConfig,
+    CompiledSuperscriptFormatter, get_superscript_formatter
+)
+from ePy_docs.core._config import register_layout_reload_hook
 
 # ============================================================================
 # MATPLOTLIB CONFIGURATION
@@ -42,6 +55,140 @@ def configure_matplotlib_for_tables():
     rcParams['ps.fonttype'] = 42
 
 
+# ============================================================================
+# CELL PREPROCESSING
+# ============================================================================
+
+_BOLD_MARKDOWN_PATTERN = r'\*\*(.*?)\*\*'
+
+
+class PreparedTableCells:
+    """Cell contents of a DataFrame preprocessed once for table rendering.
+    
+    Attributes:
+        values: Per-column lists of cell values as ``df.iloc`` returns them,
+            with bold cells replaced by their cleaned text
+        text: Object array (rows x cols) of cleaned cell text
+        bold: Boolean array (rows x cols) marking cells that had bold markers
+        display: Object array (rows x cols) of superscript-processed text
+        headers: Column names with bold markers removed
+        header_bold: Boolean array marking headers that had bold markers
+        display_headers: Superscript-processed header text
+    """
+    
+    __slots__ = ('values', 'text', 'bold', 'display',
+                 'headers', 'header_bold', 'display_headers')
+    
+    def __init__(self, values, text, bold, display, headers, header_bold, display_headers):
+        self.values = values
+        self.text = text
+        self.bold = bold
+        self.display = display
+        self.headers = headers
+        self.header_bold = header_bold
+        self.display_headers = display_headers
+    
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.text.shape
+    
+    def value(self, row: int, col: int):
+        """Return the (cleaned) value of a body cell, 0-based row."""
+        return self.values[col][row]
+    
+    def bold_cells(self) -> Dict[Tuple[int, int], bool]:
+        """Bold cells keyed by matplotlib table coordinates (header is row 0)."""
+        cells = {(0, int(col)): True for col in np.flatnonzero(self.header_bold)}
+        rows, cols = np.nonzero(self.bold)
+        cells.update({(int(row) + 1, int(col)): True for row, col in zip(rows, cols)})
+        return cells
+
+
+def _column_cell_values(column: pd.Series) -> List[Any]:
+    """Return a column's values exactly as scalar ``iloc`` access yields them."""
+    if isinstance(column.dtype, np.dtype) and column.dtype.kind not in 'mM':
+        # NumPy-backed: iterating the ndarray yields the same numpy scalars as iloc
+        return list(column.to_numpy())
+    # Extension and datetime-like arrays box their scalars (Timestamp, NA, ...)
+    return list(column.array)
+
+
+def _strip_bold_markers(text: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """Remove ``**bold**`` / ``<strong>`` markers; return (cleaned, bold_mask)."""
+    has_markdown = text.str.contains('**', regex=False)
+    has_html = ~has_markdown & text.str.contains('<strong>', regex=False)
+    
+    cleaned = text.copy()
+    if has_markdown.any():
+        cleaned[has_markdown] = text[has_markdown].str.replace(_BOLD_MARKDOWN_PATTERN, r'\1', regex=True)
+    if has_html.any():
+        cleaned[has_html] = (text[has_html]
+                             .str.replace('<strong>', '', regex=False)
+                             .str.replace('</strong>', '', regex=False))
+    return cleaned, has_markdown | has_html
+
+
+def _process_superscripts_batch(text: pd.Series) -> pd.Series:
+    """Apply superscript processing only to cells containing '^'."""
+    display = text.copy()
+    has_caret = text.str.contains('^', regex=False)
+    if has_caret.any():
+        display[has_caret] = text[has_caret].map(CellFormatter._process_superscripts_static)
+    return display
+
+
+def prepare_table_cells(df: pd.DataFrame) -> PreparedTableCells:
+    """Detect bold markers and process superscripts for all cells in one pass.
+    
+    Works column by column with vectorized string operations instead of
+    per-cell ``df.iloc`` access. Cell text follows the renderer's convention:
+    ``str(value)``, or an empty string for ``None``.
+    
+    Args:
+        df: DataFrame to render
+        
+    Returns:
+        PreparedTableCells with cleaned text, bold mask and display text
+    """
+    num_rows, num_cols = df.shape
+    values = []
+    text = np.empty((num_rows, num_cols), dtype=object)
+    display = np.empty((num_rows, num_cols), dtype=object)
+    bold = np.zeros((num_rows, num_cols), dtype=bool)
+    
+    for col_idx in range(num_cols):
+        column_values = _column_cell_values(df.iloc[:, col_idx])
+        raw_text = pd.Series(
+            ["" if value is None else str(value) for value in column_values], dtype=object
+        )
+        cleaned, bold_mask = _strip_bold_markers(raw_text)
+        
+        if bold_mask.any():
+            for row_idx in np.flatnonzero(bold_mask.to_numpy()):
+                column_values[row_idx] = cleaned.iat[row_idx]
+        
+        values.append(column_values)
+        text[:, col_idx] = cleaned.to_numpy()
+        display[:, col_idx] = _process_superscripts_batch(cleaned).to_numpy()
+        bold[:, col_idx] = bold_mask.to_numpy()
+    
+    # Headers: bold detection prefers '**' over '<strong>' for display, while the
+    # cleaned column names strip both kinds of markers
+    header_text = pd.Series([str(col) for col in df.columns], dtype=object)
+    header_display_source, header_bold = _strip_bold_markers(header_text)
+    headers = [
+        name.replace('<strong>', '').replace('</strong>', '') if '<strong>' in name else name
+        for name in header_display_source
+    ]
+    display_headers = list(_process_superscripts_batch(header_display_source))
+    
+    return PreparedTableCells(
+        values=values, text=text, bold=bold, display=display,
+        headers=headers, header_bold=header_bold.to_numpy(),
+        display_headers=display_headers
+    )
+
+
 # ============================================================================
 # CONFIGURATION MANAGER
 # ============================================================================
@@ -68,11 +215,13 @@ class TableConfigManager:
             return self._cache[cache_key]
         
         try:
-            from ePy_docs.core._config import load_layout, get_config_section
-            layout_config = load_layout(layout_style, resolve_refs=True)
+            from ePy_docs.core._config import compile_layout, get_config_section
+            from ePy_docs.core._layout import thaw
+            layout = compile_layout(layout_style)
+            fonts = layout.fonts
             
-            font_family = layout_config.get('font_family')
-            font_family_ref = layout_config.get('font_family_ref')
+            font_family = thaw(fonts.family)
+            font_family_ref = fonts.family_ref
             
             if not font_family and not font_family_ref:
                 raise ValueError(f"Layout '{layout_style}' must have 'font_family' or 'font_family_ref'")
@@ -86,48 +235,32 @@ class TableConfigManager:
                     'fallback': font_family.get('fallback')
                 }
             elif font_family_ref:
-                font_families = layout_config.get('font_families', {})
-                if font_family_ref not in font_families:
+                if font_family_ref not in fonts.families:
                     raise ValueError(f"Font family '{font_family_ref}' not found in layout")
-                font_info = font_families[font_family_ref]
+                font_info = fonts.families[font_family_ref]
                 font_family_info = {
                     'primary': font_info.get('primary'),
-                    'fallback': font_info.get('fallback')
+                    'fallback': thaw(font_info.get('fallback'))
                 }
             
-            typography = layout_config.get('typography', {})
+            typography = thaw(layout.typography)
             if not typography:
                 raise ValueError(f"Layout '{layout_style}' has no 'typography' section")
             
             if font_family_ref or font_family_info:
-                if typography:
-                    font_config = {
-                        'primary': font_family_info['primary'],
-                        'fallback': font_family_info['fallback'],
-                        'role_assignments': typography.get('role_assignments', {}),
-                        'scales': typography.get('scales', {}),
-                        'line_spacing': typography.get('line_spacing', {}),
-                        'element_typography': typography.get('element_typography', {})
-                    }
-                else:
-                    font_config = {
-                        'primary': font_family_info['primary'],
-                        'fallback': font_family_info['fallback'],
-                        'element_typography': {'tables': {'content': {'size': 10}, 'header': {'size': 11}}}
-                    }
+                font_config = {
+                    'primary': font_family_info['primary'],
+                    'fallback': font_family_info['fallback'],
+                    'role_assignments': typography.get('role_assignments', {}),
+                    'scales': typography.get('scales', {}),
+                    'line_spacing': typography.get('line_spacing', {}),
+                    'element_typography': typography.get('element_typography', {})
+                }
             
-            colors_config = layout_config.get('colors', {})
-            if 'palette' in layout_config:
-                embedded_palette = layout_config['palette']
-                flattened_palette = {}
-                if 'colors' in embedded_palette: flattened_palette.update(embedded_palette['colors'])
-                for section in ['page', 'code', 'table']:
-                    if section in embedded_palette:
-                        for key, value in embedded_palette[section].items():
-                            flattened_palette[f'{section}_{key}'] = value
-                if 'border_color' in embedded_palette: flattened_palette['border_color'] = embedded_palette['border_color']
-                if 'caption_color' in embedded_palette: flattened_palette['caption_color'] = embedded_palette['caption_color']
-                
+            # Private copies: the tuple below is cached and handed to renderers
+            colors_config = thaw(layout.get('colors', {}))
+            if layout.palette is not None:
+                flattened_palette = thaw(layout.palette.flattened)
                 colors_config['palette'] = flattened_palette
                 colors_config['palettes'] = {layout_style: flattened_palette}
             
@@ -137,13 +270,13 @@ class TableConfigManager:
                 colors_config['palettes'].update(colors_data['color_palettes'])
                 colors_config['color_palettes'] = colors_data['color_palettes']
             
-            table_config = layout_config.get('tables', {})
+            table_config = thaw(layout.tables.config)
             style_config = table_config.get('styling', {})
             if not table_config:
                 raise ValueError(f"Layout '{layout_style}' has no 'tables' configuration")
             
-            code_config = layout_config.get('code', {})
-            text_wrapping_config = layout_config.get('format', {}).get('text_wrapping', {'max_width': 80})
+            code_config = thaw(layout.code.code)
+            text_wrapping_config = thaw(layout.text_wrapping)
             
             result = (font_config, colors_config, style_config, table_config, code_config, font_family, text_wrapping_config)
             self._cache[cache_key] = result
@@ -250,10 +383,210 @@ class FontManager:
         cell.get_text().set_style('normal')
 
 
+# ============================================================================
+# TEXT METRICS
+# ============================================================================
+
+class GlyphAdvanceCache:
+    """
+    Text widths computed from glyph advances instead of renderer text extents.
+    
+    Each font file is loaded once with ft2font; glyph advances and kerning
+    are kept in font units, so one entry per file serves every size (size
+    and weight select the file through font matching, as in matplotlib).
+    Characters missing from a font use the next font of the family's
+    fallback chain. Line widths are cached per font chain.
+    """
+    
+    LINE_CACHE_SIZE = 65536
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._fonts = {}
+        self._chains = {}
+        self._glyphs = {}
+        self._kerning = {}
+        self._lines = {}
+    
+    def clear(self) -> None:
+        """Drop all cached fonts and metrics."""
+        with self._lock:
+            for cache in (self._fonts, self._chains, self._glyphs, self._kerning, self._lines):
+                cache.clear()
+    
+    def text_width(self, text) -> Optional[float]:
+        """Width in points of a matplotlib Text's widest line.
+        
+        Returns:
+            Width in points, or None if the text needs the renderer
+            (math text, usetex or rotated text)
+        """
+        content = text.get_text()
+        if text.get_usetex() or text.get_rotation() % 360 or (text.get_parse_math() and '$' in content):
+            return None
+        
+        prop = text.get_fontproperties()
+        with self._lock:
+            chain = self._font_chain(prop)
+            width_em = max(self._line_width(chain, line) for line in content.split('\n'))
+        return width_em * prop.get_size_in_points()
+    
+    def _font_chain(self, prop) -> Tuple:
+        """Font files matplotlib would use for prop (primary first)."""
+        from matplotlib import font_manager
+        
+        manager = font_manager.fontManager
+        key = (id(manager), len(manager.ttflist), tuple(prop.get_family()), prop.get_style(),
+               prop.get_variant(), prop.get_weight(), prop.get_stretch())
+        chain = self._chains.get(key)
+        if chain is None:
+            find_fonts = getattr(manager, '_find_fonts_by_props', None)
+            paths = find_fonts(prop) if find_fonts else [font_manager.findfont(prop)]
+            chain = tuple(paths)
+            self._chains[key] = chain
+        return chain
+    
+    def _font(self, path):
+        """FT2Font sized so that 26.6 metrics are in font units."""
+        font = self._fonts.get(path)
+        if font is None:
+            from matplotlib import ft2font
+            font = ft2font.FT2Font(path)
+            font.set_size(font.units_per_EM, 72)
+            self._fonts[path] = font
+        return font
+    
+    def _glyph(self, chain: Tuple, char: str) -> Tuple[int, int, float]:
+        """(font position in chain, glyph index, advance in em) for a character."""
+        key = (chain, char)
+        glyph = self._glyphs.get(key)
+        if glyph is None:
+            from matplotlib import ft2font
+            no_hinting = getattr(getattr(ft2font, 'LoadFlags', None), 'NO_HINTING', None)
+            if no_hinting is None:
+                no_hinting = ft2font.LOAD_NO_HINTING
+            
+            position, index = 0, 0
+            for i, path in enumerate(chain):
+                index = self._font(path).get_char_index(ord(char))
+                if index:
+                    position = i
+                    break
+            font = self._font(chain[position])
+            advance = font.load_glyph(index, flags=no_hinting).linearHoriAdvance / 65536.0
+            glyph = (position, index, advance / font.units_per_EM)
+            self._glyphs[key] = glyph
+        return glyph
+    
+    def _kern(self, path, left: int, right: int) -> float:
+        """Kerning between two glyphs of one font, in em."""
+        key = (path, left, right)
+        kern = self._kerning.get(key)
+        if kern is None:
+            from matplotlib import ft2font
+            unfitted = getattr(getattr(ft2font, 'Kerning', None), 'UNFITTED', None)
+            if unfitted is None:
+                unfitted = ft2font.KERNING_UNFITTED
+            font = self._font(path)
+            kern = font.get_kerning(left, right, unfitted) / 64.0 / font.units_per_EM
+            self._kerning[key] = kern
+        return kern
+    
+    def _line_width(self, chain: Tuple, line: str) -> float:
+        """Advance width of one line in em."""
+        key = (chain, line)
+        width = self._lines.get(key)
+        if width is None:
+            width = 0.0
+            previous = None
+            for char in line:
+                position, index, advance = self._glyph(chain, char)
+                if previous is not None and previous[0] == position:
+                    width += self._kern(chain[position], previous[1], index)
+                width += advance
+                previous = (position, index)
+            if len(self._lines) >= self.LINE_CACHE_SIZE:
+                self._lines.clear()
+            self._lines[key] = width
+        return width
+
+
+_glyph_advance_cache = GlyphAdvanceCache()
+
+
+def get_glyph_advance_cache() -> GlyphAdvanceCache:
+    """Return the process-wide glyph advance cache."""
+    return _glyph_advance_cache
+
+
+def set_analytic_column_widths(table, num_columns: int) -> None:
+    """Size every column to its widest cell, like Table.auto_set_column_width.
+    
+    matplotlib measures auto-sized columns with the renderer on every draw
+    (twice per tight savefig). Here widths come from GlyphAdvanceCache once,
+    after fonts, weights and wrapping are final. Columns with text the cache
+    cannot measure keep matplotlib's auto sizing.
+    
+    Args:
+        table: matplotlib Table (cell font properties already applied)
+        num_columns: Number of table columns
+    """
+    from matplotlib.table import Cell
+    
+    metrics = get_glyph_advance_cache()
+    # Table coordinates are axes fractions: convert points with the axes width
+    axes = table.axes
+    axes_width_points = axes.get_position().width * axes.figure.get_figwidth() * 72.0
+    
+    widths = [0.0] * num_columns
+    measurable = [True] * num_columns
+    column_cells = [[] for _ in range(num_columns)]
+    for (row, col), cell in table.get_celld().items():
+        if not 0 <= col < num_columns:
+            continue
+        column_cells[col].append(cell)
+        if measurable[col]:
+            width = metrics.text_width(cell.get_text())
+            if width is None:
+                measurable[col] = False
+            else:
+                widths[col] = max(widths[col], width)
+    
+    auto_columns = []
+    for col, cells in enumerate(column_cells):
+        if not measurable[col]:
+            auto_columns.append(col)
+            continue
+        required = widths[col] / axes_width_points * (1.0 + 2.0 * Cell.PAD)
+        for cell in cells:
+            cell.set_width(required)
+    
+    if auto_columns:
+        table.auto_set_column_width(auto_columns)
+
+
 # ============================================================================
 # COLOR MANAGER
 # ============================================================================
 
+PALETTE_TONES = ('primary', 'secondary', 'tertiary', 'quaternary', 'quinary', 'senary')
+
+PALETTE_LOOKUP_CACHE_SIZE = 64
+
+# (palette name, palette fingerprint) -> (palette colors, text colors), least recently used first
+_PALETTE_LOOKUPS: 'OrderedDict[Tuple[str, str], Tuple[np.ndarray, np.ndarray]]' = OrderedDict()
+_palette_lookups_lock = threading.Lock()
+
+
+def clear_palette_lookups(layout_name: Optional[str] = None) -> None:
+    """Invalidation hook: forget precomputed palette lookups (all layouts share them)."""
+    with _palette_lookups_lock:
+        _PALETTE_LOOKUPS.clear()
+
+
+register_layout_reload_hook(clear_palette_lookups)
+
+
 class ColorManager:
     """Manages color palette and cell coloring operations."""
     
@@ -277,6 +610,19 @@ class ColorManager:
     def apply_table_colors(self, table, df: pd.DataFrame, style_config: Dict, 
                           colors_config: Dict, highlight_columns: Union[str, List[str], None] = None,
                           palette_name: str = None, colored: bool = False) -> None:
+        highlight_colors = self.get_highlight_colors(df, colors_config, highlight_columns, palette_name, colored)
+        cells = table.get_celld()
+        for col_index, column_colors in highlight_colors.items():
+            for row, (color, text_color) in enumerate(column_colors, start=1):
+                cell = cells[row, col_index]
+                cell.set_facecolor(color)
+                cell.get_text().set_color(text_color)
+    
+    def get_highlight_colors(self, df: pd.DataFrame, colors_config: Dict,
+                             highlight_columns: Union[str, List[str], None] = None,
+                             palette_name: str = None,
+                             colored: bool = False) -> Dict[int, List[Tuple[str, str]]]:
+        """(background, text) colors of the body cells of highlighted columns, keyed by column position."""
         # Set default palette if None
         if palette_name is None:
             palette_name = 'blues'
@@ -285,54 +631,87 @@ class ColorManager:
         if highlight_columns:
             if isinstance(highlight_columns, str):
                 highlight_columns = [highlight_columns]
-            valid_columns = [col for col in highlight_columns if col in df.columns]
-            for col_name in valid_columns:
-                self._apply_column_highlighting(table, df, col_name, colors_config, palette_name)
+            column_names = [col for col in highlight_columns if col in df.columns]
         
         # Case 2: colored=True without highlight_columns → color all columns independently
         elif colored:
-            for col_name in df.columns:
-                self._apply_column_highlighting(table, df, col_name, colors_config, palette_name)
-    
-    def _apply_column_highlighting(self, table, df: pd.DataFrame, column_name: str, 
-                                  colors_config: Dict, palette_name: str = None):
-        if column_name not in df.columns: return
-        col_index = df.columns.get_loc(column_name)
-        column_data = df[column_name]
-        colors = self._generate_color_gradient(column_data, colors_config, palette_name)
-        for row_idx, color in enumerate(colors):
-            cell = table[(row_idx + 1, col_index)]
-            cell.set_facecolor(color)
-            cell.get_text().set_color(self._get_contrasting_text_color(color, palette_name, colors_config))
+            column_names = list(df.columns)
+        else:
+            column_names = []
+        
+        if not column_names:
+            return {}
+        
+        # Background and text colors are indexed together by palette position
+        palette_colors, text_colors = self._get_palette_lookup(palette_name, colors_config)
+        highlight_colors = {}
+        for column_name in column_names:
+            col_index = df.columns.get_loc(column_name)
+            indices = self._gradient_indices(df[column_name], len(palette_colors))
+            highlight_colors[col_index] = list(zip(palette_colors[indices].tolist(),
+                                                   text_colors[indices].tolist()))
+        return highlight_colors
     
     def _generate_color_gradient(self, column_data: pd.Series, colors_config: Dict, 
                                 palette_name: str = None) -> List[str]:
-        palette_colors = self._get_palette_colors(palette_name or 'blues', colors_config)
+        palette_colors, _ = self._get_palette_lookup(palette_name or 'blues', colors_config)
+        return palette_colors[self._gradient_indices(column_data, len(palette_colors))].tolist()
+    
+    @staticmethod
+    def _gradient_indices(column_data: pd.Series, num_colors: int) -> np.ndarray:
+        """Palette position of each value.
+        
+        Numeric columns are normalized to [0, 1] and binned into num_colors
+        steps (missing values take the first color); non-numeric columns
+        cycle through the palette by order of first appearance.
+        """
         numeric_data = pd.to_numeric(column_data, errors='coerce')
         if numeric_data.isna().all():
-            return self._generate_categorical_colors(column_data, palette_colors)
+            codes, _ = pd.factorize(column_data, use_na_sentinel=False)
+            return codes % num_colors
         
-        min_val, max_val = numeric_data.min(), numeric_data.max()
-        if min_val == max_val: return [palette_colors[0]] * len(column_data)
+        values = numeric_data.to_numpy(dtype='float64', na_value=np.nan)
+        indices = np.zeros(len(values), dtype=np.intp)
+        min_val, max_val = np.nanmin(values), np.nanmax(values)
+        if min_val == max_val:
+            return indices
         
-        colors = []
-        for value in numeric_data:
-            if pd.isna(value):
-                colors.append(palette_colors[0] if palette_colors else get_palette_color_by_tone('neutrals', 'primary'))
-            else:
-                normalized = (value - min_val) / (max_val - min_val)
-                color_index = int(normalized * (len(palette_colors) - 1))
-                colors.append(palette_colors[color_index])
-        return colors
+        valid = ~np.isnan(values)
+        scaled = (values[valid] - min_val) / (max_val - min_val) * (num_colors - 1)
+        indices[valid] = np.digitize(scaled, np.arange(1, num_colors))
+        return indices
+    
+    def _get_palette_lookup(self, palette_name: str, colors_config: Dict) -> Tuple[np.ndarray, np.ndarray]:
+        """Palette colors and their text colors as arrays, computed once per palette definition.
+        
+        Keyed by the palette's content, so reloaded configs with the same
+        palette share an entry and edited palettes get a new one.
+        """
+        palette = colors_config.get('palettes', {}).get(palette_name)
+        key = (palette_name, json.dumps(palette, sort_keys=True, default=str))
+        with _palette_lookups_lock:
+            cached = _PALETTE_LOOKUPS.get(key)
+            if cached is not None:
+                _PALETTE_LOOKUPS.move_to_end(key)
+                return cached
+        
+        palette_colors = self._get_palette_colors(palette_name, colors_config)
+        text_colors = [self._get_contrasting_text_color(color, palette_name, colors_config)
+                       for color in palette_colors]
+        lookup = (np.array(palette_colors, dtype=object), np.array(text_colors, dtype=object))
+        with _palette_lookups_lock:
+            _PALETTE_LOOKUPS[key] = lookup
+            while len(_PALETTE_LOOKUPS) > PALETTE_LOOKUP_CACHE_SIZE:
+                _PALETTE_LOOKUPS.popitem(last=False)
+        return lookup
     
     def _get_palette_colors(self, palette_name: str, colors_config: Dict) -> List[str]:
         palettes = colors_config.get('palettes', {})
         if palette_name not in palettes:
             raise ValueError(f"Palette '{palette_name}' not found")
         palette = palettes[palette_name]
-        tones = ['primary', 'secondary', 'tertiary', 'quaternary', 'quinary', 'senary']
         colors = []
-        for tone in tones:
+        for tone in PALETTE_TONES:
             if tone in palette:
                 color_rgb = palette[tone]
                 if isinstance(color_rgb, (list, tuple)) and len(color_rgb) >= 3:
@@ -344,33 +723,17 @@ class ColorManager:
             raise ValueError(f"Palette '{palette_name}' has no valid colors")
         return colors
     
-    def _get_text_colors_for_palette(self, palette_name: str, colors_config: Dict) -> Dict[str, str]:
-        """Get text colors for each tone in a palette."""
-        palettes = colors_config.get('palettes', {})
-        if palette_name not in palettes:
-            raise ValueError(f"Palette '{palette_name}' not found")
-        palette = palettes[palette_name]
-        
-        if 'text_colors' not in palette:
-            raise ValueError(f"Palette '{palette_name}' does not have 'text_colors' defined")
-        
-        return palette['text_colors']
-    
-    def _generate_categorical_colors(self, column_data: pd.Series, palette_colors: List[str]) -> List[str]:
-        unique_values = column_data.unique()
-        color_map = {val: palette_colors[i % len(palette_colors)] for i, val in enumerate(unique_values)}
-        return [color_map[val] for val in column_data]
-    
     def _get_contrasting_text_color(self, background_color: str, palette_name: str, colors_config: Dict) -> str:
-        """Get contrasting text color from palette definition."""
-        text_colors = self._get_text_colors_for_palette(palette_name, colors_config)
+        """Get contrasting text color from palette definition.
         
-        # Find which tone this background color belongs to
-        palettes = colors_config.get('palettes', {})
-        palette = palettes[palette_name]
-        tones = ['primary', 'secondary', 'tertiary', 'quaternary', 'quinary', 'senary']
+        Uses the palette's text_colors entry for the tone of background_color;
+        tones without one get black or white by relative luminance.
+        """
+        palette = colors_config.get('palettes', {})[palette_name]
+        text_colors = palette.get('text_colors', {})
         
-        for tone in tones:
+        # Find which tone this background color belongs to
+        for tone in PALETTE_TONES:
             if tone in palette:
                 palette_color = palette[tone]
                 # Convert to hex for comparison
@@ -384,11 +747,19 @@ class ColorManager:
                 
                 if hex_color.upper() == background_color.upper():
                     # Found matching tone, return its text color
-                    if tone not in text_colors:
-                        raise ValueError(f"Text color for tone '{tone}' not found in palette '{palette_name}'")
-                    return text_colors[tone]
+                    if tone in text_colors:
+                        return text_colors[tone]
+                    break
         
-        raise ValueError(f"Background color '{background_color}' not found in palette '{palette_name}'")
+        return '#000000' if self._relative_luminance(background_color) > 0.179 else '#FFFFFF'
+    
+    @staticmethod
+    def _relative_luminance(color: str) -> float:
+        """WCAG relative luminance of a color."""
+        from matplotlib.colors import to_rgb
+        channels = np.array(to_rgb(color))
+        linear = np.where(channels <= 0.04045, channels / 12.92, ((channels + 0.055) / 1.055) ** 2.4)
+        return float(linear @ (0.2126, 0.7152, 0.0722))
 
 
 # ============================================================================
@@ -402,22 +773,22 @@ class CellFormatter:
         self._font_manager = font_manager
         self._color_manager = color_manager
     
-    def _analyze_column_content(self, df: pd.DataFrame) -> Dict[int, Dict[str, Any]]:
+    def _analyze_column_content(self, df: pd.DataFrame,
+                                profile: Optional[TableProfile] = None) -> Dict[int, Dict[str, Any]]:
+        if profile is None:
+            profile = TableProfile.from_dataframe(df)
+        
         column_analysis = {}
-        for col_idx in range(len(df.columns)):
-            header_text = str(df.columns[col_idx])
-            header_length = len(header_text)
-            column_data = df.iloc[:, col_idx].astype(str)
-            data_lengths = [len(str(val)) for val in column_data if str(val) not in ['nan', 'None', '']]
+        for col_idx, stats in enumerate(profile.column_content_stats()):
+            header_length = int(profile.header_lengths[col_idx])
             
-            if data_lengths:
-                avg_length = sum(data_lengths) / len(data_lengths)
-                max_length = max(data_lengths)
+            if stats['count']:
+                avg_length = stats['avg_length']
+                max_length = stats['max_length']
             else:
                 avg_length = max_length = header_length
             
-            numeric_count = sum(1 for val in column_data if str(val).replace('.', '').replace('-', '').isdigit())
-            content_type = 'numeric' if numeric_count > len(column_data) * 0.5 else 'text'
+            content_type = 'numeric' if stats['numeric_count'] > len(df) * 0.5 else 'text'
             
             column_analysis[col_idx] = {
                 'header_length': header_length,
@@ -457,15 +828,26 @@ class CellFormatter:
 
     def format_table_cells(self, table, df: pd.DataFrame, font_list: List[str],
                           font_config: Dict, layout_style: str, code_config: Dict, text_wrapping_config: Dict = None,
-                          font_size: float = None, missing_value_style: str = 'italic') -> None:
+                          font_size: float = None, missing_value_style: str = 'italic',
+                          prepared_cells: Optional[PreparedTableCells] = None,
+                          profile: Optional[TableProfile] = None) -> None:
         if font_size is None:
             font_size = font_config.get('element_typography', {}).get('tables', {}).get('content', {}).get('size', 10)
         
+        # Reuse the renderer's preprocessing instead of per-cell df.iloc lookups
+        if prepared_cells is None:
+            prepared_cells = prepare_table_cells(df)
+        
         num_rows, num_cols = df.shape
         num_rows += 1
-        column_analysis = self._analyze_column_content(df)
+        column_analysis = self._analyze_column_content(df, profile)
         column_widths = self._calculate_column_widths(column_analysis, 80, text_wrapping_config)
         
+        def body_value(row, col):
+            if row - 1 < num_rows - 1 and col < num_cols:
+                return prepared_cells.value(row - 1, col)
+            return ""
+        
         row_heights = {}
         for (row, col), cell in table.get_celld().items():
             if row not in row_heights: row_heights[row] = 1
@@ -474,7 +856,7 @@ class CellFormatter:
                 text_value = df.columns[col] if col < len(df.columns) else ""
                 text_value = self._apply_header_multiline(str(text_value))
             else:
-                text_value = df.iloc[row - 1, col] if row - 1 < len(df) and col < len(df.columns) else ""
+                text_value = body_value(row, col)
             
             cell_width = column_widths.get(col, 40)
             line_count = self._calculate_cell_lines(text_value, is_header, cell_width)
@@ -487,7 +869,7 @@ class CellFormatter:
                 header_max_length = column_widths.get(col, 25)
                 text_value = self._apply_header_multiline(str(text_value), header_max_length)
             else:
-                text_value = df.iloc[row - 1, col] if row - 1 < len(df) and col < len(df.columns) else ""
+                text_value = body_value(row, col)
             
             self._font_manager.configure_cell_font(cell, text_value, is_header, font_list, layout_style, code_config)
             
@@ -571,21 +953,18 @@ class CellFormatter:
         text_str = str(text)
         if not text_str or '^' not in text_str: return text_str
         try:
-            config = FormatConfig()
-            formatter = SuperscriptFormatter(config)
-            return formatter.format_superscripts(text_str, output_format='matplotlib')
+            formatter = get_superscript_formatter('matplotlib')
         except Exception:
             return CellFormatter._fallback_superscript_processing(text_str)
+        return formatter.format(text_str)
+    
+    _FALLBACK_SUPERSCRIPTS = CompiledSuperscriptFormatter({
+        '^0': '⁰', '^1': '¹', '^2': '²', '^3': '³', '^4': '⁴', '^5': '⁵', '^6': '⁶', '^7': '⁷', '^8': '⁸', '^9': '⁹',
+        '^10': '¹⁰', '^11': '¹¹', '^12': '¹²', '^n': 'ⁿ', '^x': 'ˣ', '^y': 'ʸ', '^i': 'ⁱ', '^j': 'ʲ', '^k': 'ᵏ',
+        '^+': '⁺', '^-': '⁻', '^=': '⁼'
+    })
     
     @staticmethod
     def _fallback_superscript_processing(text: str) -> str:
         if not text or '^' not in text: return text
-        superscript_map = {
-            '^0': '⁰', '^1': '¹', '^2': '²', '^3': '³', '^4': '⁴', '^5': '⁵', '^6': '⁶', '^7': '⁷', '^8': '⁸', '^9': '⁹',
-            '^10': '¹⁰', '^11': '¹¹', '^12': '¹²', '^n': 'ⁿ', '^x': 'ˣ', '^y': 'ʸ', '^i': 'ⁱ', '^j': 'ʲ', '^k': 'ᵏ',
-            '^+': '⁺', '^-': '⁻', '^=': '⁼'
-        }
-        result = text
-        for pattern in sorted(superscript_map.keys(), key=len, reverse=True):
-            result = result.replace(pattern, superscript_map[pattern])
-        return result
+        return CellFormatter._FALLBACK_SUPERSCRIPTS.replace(text)
@@ -15,6 +15,7 @@ Architecture Components:
 - CellFormatter: Cell formatting, content detection, and styling
 - ImageRenderer: Table image generation with matplotlib
 - MarkdownGenerator: Markdown content generation
+- NativeTableRenderer: Pipe tables emitted without matplotlib (engine='native')
 - TableOrchestrator: Main coordinator with facade pattern
 
 Performance: Optimized caching, lazy loading, and resource management
@@ -23,6 +24,12 @@ Extensibility: Configuration-driven behavior, zero hardcoded values
 """
 
 import os
+import shutil
+import hashlib
+import threading
+from ePy_docs.core._lazy import ensure_matplotlib
+ensure_matplotlib()  # Backend and font fallback before pyplot is imported
+
 import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
@@ -34,16 +41,26 @@ from abc import ABC, abstractmethod
 
 from ePy_docs.core._data import (
     DataProcessor, TableAnalyzer, TablePreparation, 
-    TableDimensionCalculator, TableContentAnalyzer
+    TableDimensionCalculator, TableContentAnalyzer, TableProfile
 )
 from ePy_docs.core._format import TextProcessor, FormatConfig, TableTextWrapper
 from ePy_docs.core._config import get_absolute_output_directories, get_layout
-from ePy_docs.core._images import convert_rgb_to_matplotlib, get_palette_color_by_tone, setup_matplotlib_fonts
+from ePy_docs.core._paths import get_cache_directory
+from ePy_docs.core._assets import try_reflink
+from ePy_docs.core._figures import get_figure_pool, get_memory_watermark
+from ePy_docs.core._image_output import (
+    IMAGE_EXTENSIONS, RASTER_FORMATS, conditional_image_markdown,
+    get_image_output_policy, save_figure, variant_path
+)
+from ePy_docs.core._images import (
+    convert_rgb_to_matplotlib, get_palette_color_by_tone, setup_matplotlib_fonts
+)
 
 # Import from consolidated table core module
 from ._table_core import (
     configure_matplotlib_for_tables, TableConfigManager,
-    FontManager, ColorManager, CellFormatter
+    FontManager, ColorManager, CellFormatter, prepare_table_cells,
+    set_analytic_column_widths
 )
 
 
@@ -52,6 +69,134 @@ from ._table_core import (
 # ============================================================================
 
 
+class TableImageCache:
+    """
+    SOLID: Single Responsibility - Content-addressed cache of rendered table images.
+    
+    Images are stored under the user cache directory keyed by a SHA-256 of the
+    table data, the resolved layout configuration, the rendering options and
+    the ePy_docs/matplotlib versions. A hit reflinks (or copies) the cached
+    PNG (and its SVG/PDF variants in vector mode) to ``table_N.*`` so
+    matplotlib is skipped entirely. Cache and output files are never
+    hardlinked: editing an output image must not change the cache entry.
+    
+    Disable with ``EPY_DOCS_TABLE_CACHE=0``; relocate with ``EPY_DOCS_CACHE_DIR``.
+    """
+    
+    def __init__(self, enabled: Optional[bool] = None, cache_dir: Optional[str] = None):
+        """Initialize cache, reading defaults from the environment."""
+        self.configure(enabled, cache_dir)
+    
+    def configure(self, enabled: Optional[bool] = None, cache_dir: Optional[str] = None) -> None:
+        """Set cache state and location and reset hit/miss statistics.
+        
+        Args:
+            enabled: Whether to use the cache (None = from EPY_DOCS_TABLE_CACHE, default on)
+            cache_dir: Cache directory (None = user cache directory)
+        """
+        if enabled is None:
+            enabled = os.environ.get('EPY_DOCS_TABLE_CACHE', '1').strip().lower() not in ('0', 'false', 'no', 'off')
+        self.enabled = bool(enabled)
+        self.cache_dir = Path(cache_dir) if cache_dir else get_cache_directory('tables')
+        self.hits = 0
+        self.misses = 0
+    
+    def settings(self) -> Dict[str, Any]:
+        """Return settings needed to reproduce this cache in a worker process."""
+        return {'enabled': self.enabled, 'cache_dir': str(self.cache_dir)}
+    
+    def make_key(self, df: pd.DataFrame, layout_config: Tuple,
+                 render_options: Dict[str, Any]) -> str:
+        """Build the content hash for a table render.
+        
+        Args:
+            df: Table data as it will be rendered
+            layout_config: Resolved layout configuration tuple
+            render_options: Width, layout, document type and coloring options
+            
+        Returns:
+            Hex digest identifying the rendered image
+        """
+        import matplotlib
+        from ePy_docs import __version__
+        
+        digest = hashlib.sha256()
+        digest.update(repr((__version__, matplotlib.__version__)).encode('utf-8'))
+        digest.update(repr(sorted(render_options.items())).encode('utf-8'))
+        digest.update(repr(layout_config).encode('utf-8'))
+        digest.update(repr([str(col) for col in df.columns]).encode('utf-8'))
+        digest.update(repr([str(dtype) for dtype in df.dtypes]).encode('utf-8'))
+        
+        try:
+            row_hashes = pd.util.hash_pandas_object(df, index=False)
+        except TypeError:
+            # Unhashable cell values (lists, dicts) - hash their text instead
+            row_hashes = pd.util.hash_pandas_object(df.astype(str), index=False)
+        digest.update(row_hashes.to_numpy().tobytes())
+        
+        return digest.hexdigest()
+    
+    def fetch(self, key: str, output_path: Union[str, Path],
+              formats: Tuple[str, ...] = RASTER_FORMATS) -> bool:
+        """Materialize a cached image at output_path.
+        
+        Args:
+            key: Cache key from make_key
+            output_path: PNG path; other formats are placed next to it
+            formats: Formats that must all be cached for a hit
+        
+        Returns:
+            True on cache hit, False otherwise
+        """
+        cached = [self.cache_dir / f"{key}.{fmt}" for fmt in formats]
+        if not all(path.is_file() for path in cached):
+            self.misses += 1
+            return False
+        
+        try:
+            for fmt, path in zip(formats, cached):
+                self._clone(path, variant_path(output_path, fmt))
+        except OSError:
+            self.misses += 1
+            return False
+        
+        self.hits += 1
+        return True
+    
+    def store(self, key: str, image_path: Union[str, Path],
+              formats: Tuple[str, ...] = RASTER_FORMATS) -> None:
+        """Add a freshly rendered image and its variants to the cache (best effort)."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            for fmt in formats:
+                self._clone(variant_path(image_path, fmt), self.cache_dir / f"{key}.{fmt}")
+        except OSError:
+            pass  # Cache is an optimization; never fail a render because of it
+    
+    def clear(self) -> None:
+        """Remove all cached images."""
+        if self.cache_dir.exists():
+            for ext in IMAGE_EXTENSIONS:
+                for cached in self.cache_dir.glob(f'*.{ext}'):
+                    try:
+                        cached.unlink()
+                    except OSError:
+                        pass
+    
+    @staticmethod
+    def _clone(source: Path, target: Path) -> None:
+        """Atomically place an independent copy of source at target (reflink where supported)."""
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            if not try_reflink(source, tmp):
+                shutil.copyfile(source, tmp)
+            os.replace(tmp, target)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+
+
 class ImageRenderer:
     """
     SOLID: Single Responsibility - Handles matplotlib table image generation.
@@ -63,9 +208,10 @@ class ImageRenderer:
     - Memory management and cleanup
     """
     
-    def __init__(self, config_manager: TableConfigManager):
+    def __init__(self, config_manager: TableConfigManager, image_cache: Optional[TableImageCache] = None):
         """Initialize with configuration manager dependency."""
         self._config_manager = config_manager
+        self.image_cache = image_cache if image_cache is not None else TableImageCache()
     
     def _process_superscripts_static(self, text: str) -> str:
         """Process superscripts in text - delegate to CellFormatter static method."""
@@ -78,11 +224,19 @@ class ImageRenderer:
                           document_type: str = None,
                           highlight_columns: Optional[Union[str, List[str]]] = None,
                           colored: bool = False,
-                          palette_name: Optional[str] = None) -> str:
-        """Create table image and return the file path."""
-        # Setup matplotlib and get configured font list
-        configured_font_list = self._setup_matplotlib(layout_style)
-        
+                          palette_name: Optional[str] = None,
+                          profile: Optional[TableProfile] = None,
+                          image_formats: Optional[Tuple[str, ...]] = None) -> str:
+        """Create table image and return the file path.
+        
+        ``profile`` is the TableProfile of ``data`` when the caller already
+        computed it (e.g. while splitting); it is reused for sizing and cell
+        formatting instead of profiling the table again.
+        
+        ``image_formats`` lists the formats to write (None = process-wide
+        image output policy). The returned path is always the PNG; vector
+        variants are written next to it.
+        """
         # Convert data to DataFrame if needed
         if isinstance(data, list):
             df = pd.DataFrame(data)
@@ -93,21 +247,56 @@ class ImageRenderer:
         if not document_type:
             raise ValueError("Missing required parameter 'document_type'")
         
+        layout_config = self._config_manager.get_layout_config(layout_style, document_type)
         font_config, colors_config, style_config, table_config, code_config, font_family, text_wrapping_config = \
-            self._config_manager.get_layout_config(layout_style, document_type)
+            layout_config
+        
+        if image_formats is None:
+            image_formats = get_image_output_policy().formats
+        
+        # Reuse a previously rendered identical image when available
+        cache_key = None
+        if self.image_cache.enabled:
+            cache_key = self.image_cache.make_key(df, layout_config, {
+                'width_inches': width_inches, 'layout_style': layout_style,
+                'document_type': document_type, 'highlight_columns': highlight_columns,
+                'colored': colored, 'palette_name': palette_name,
+                'image_formats': tuple(image_formats),
+            })
+            output_path = self.get_image_path(output_dir, table_number, document_type)
+            if self.image_cache.fetch(cache_key, output_path, image_formats):
+                return output_path
+        
+        # Profile cell text once for sizing and formatting
+        if profile is None:
+            profile = TableProfile.from_dataframe(df)
+        elif profile.shape != df.shape:
+            raise ValueError(f"Table profile shape {profile.shape} does not match table shape {df.shape}")
+        
+        # Setup matplotlib and get configured font list
+        configured_font_list = self._setup_matplotlib(layout_style)
         
         # Calculate dimensions
-        width_inches = width_inches or self._calculate_width(df, style_config)
-        height_inches = self._calculate_height(df, style_config)
+        width_inches = width_inches or self._calculate_width(df, style_config, profile)
+        height_inches = self._calculate_height(df, style_config, profile)
         
-        # Create figure
-        fig, ax = plt.subplots(figsize=(width_inches, height_inches))
+        # Create figure (reused from the figure pool)
+        figure_pool = get_figure_pool()
+        fig, ax = figure_pool.acquire((width_inches, height_inches))
         ax.axis('tight')
         ax.axis('off')
         
         try:
             # Create matplotlib table with layout colors
-            table, bold_cells = self._create_matplotlib_table(ax, df, font_config, style_config, colors_config)
+            table, bold_cells, prepared_cells = self._create_matplotlib_table(
+                ax, df, font_config, style_config, colors_config
+            )
+            
+            # Bold markers were stripped from df: update only those cells
+            bold_rows, bold_cols = np.nonzero(prepared_cells.bold)
+            profile = profile.replace_cells(
+                bold_rows, bold_cols, prepared_cells.text[bold_rows, bold_cols]
+            ).replace_headers(df.columns)
             
             # Apply formatting - use the configured font list from matplotlib setup
             cell_formatter = CellFormatter(
@@ -118,7 +307,8 @@ class ImageRenderer:
             # Use the font list that was configured in matplotlib setup
             font_list = configured_font_list if configured_font_list else self._get_font_list(font_family, font_config)
             cell_formatter.format_table_cells(
-                table, df, font_list, font_config, layout_style, code_config, text_wrapping_config
+                table, df, font_list, font_config, layout_style, code_config, text_wrapping_config,
+                prepared_cells=prepared_cells, profile=profile
             )
             
             # CRITICAL: Re-apply bold styling AFTER formatting may have reset it
@@ -126,6 +316,9 @@ class ImageRenderer:
                 if (row, col) in table.get_celld():
                     table[(row, col)].get_text().set_fontweight('bold')
             
+            # Fonts and text are final: size columns once from glyph advances
+            set_analytic_column_widths(table, len(df.columns))
+            
             # CRITICAL: Apply fonts to the entire figure (including title and all text elements)
             from ePy_docs.core._images import apply_fonts_to_figure
             apply_fonts_to_figure(fig, font_list)
@@ -142,17 +335,19 @@ class ImageRenderer:
             # This avoids duplicate titles (one in image, one in caption)
             
             # Save image
-            output_path = self._save_image(fig, output_dir, table_number, title, document_type, colors_config)
+            output_path = self._save_image(fig, output_dir, table_number, title, document_type,
+                                           colors_config, image_formats)
+            
+            if cache_key is not None:
+                self.image_cache.store(cache_key, output_path, image_formats)
             
             return output_path
             
         finally:
-            # Clean up matplotlib resources thoroughly
+            # Return the figure to the pool; collect garbage only past the memory watermark
             try:
-                plt.close(fig)
-                # Force garbage collection to free memory
-                import gc
-                gc.collect()
+                figure_pool.release(fig)
+                get_memory_watermark().check()
             except Exception:
                 pass  # Ignore cleanup errors
     
@@ -163,19 +358,15 @@ class ImageRenderer:
             import matplotlib
             matplotlib.use('Agg', force=True)
             
-            # Configure fonts from layout configuration
+            # Configure fonts from layout configuration (sets font.sans-serif/font.family)
             font_list = setup_matplotlib_fonts(layout_style)
             
             # Explicitly enable font fallback settings
             from matplotlib import rcParams
             
-            # Set the font family list from configuration - NO hardcoded fallbacks
-            if font_list and isinstance(font_list, list):
-                rcParams['font.sans-serif'] = font_list
-            else:
+            # Font list comes from configuration - NO hardcoded fallbacks
+            if not font_list or not isinstance(font_list, list):
                 raise ValueError("No font configuration available from layout")
-                
-            rcParams['font.family'] = 'sans-serif'
             
             # CRITICAL: Enable font fallback to avoid errors
             rcParams['svg.fonttype'] = 'none'  # Use fonts as text, not paths
@@ -186,15 +377,6 @@ class ImageRenderer:
             rcParams['figure.max_open_warning'] = 0  # Disable warnings about too many figures
             rcParams['axes.unicode_minus'] = False   # Prevent Unicode minus issues
             
-            # Ensure matplotlib uses proper font fallback policy
-            import matplotlib.font_manager as fm
-            if hasattr(fm, 'fontManager'):
-                # Refresh font manager to apply changes - but safely
-                try:
-                    fm.fontManager._rebuild()
-                except (AttributeError, OSError, RuntimeError):
-                    pass  # Ignore font manager errors
-            
             return font_list if font_list else ['Arial', 'sans-serif']
             
         except Exception as e:
@@ -202,76 +384,24 @@ class ImageRenderer:
             raise ValueError(f"Font setup failed for layout '{layout_style}': {e}")
     
     def _create_matplotlib_table(self, ax, df: pd.DataFrame, font_config: Dict, style_config: Dict, colors_config: Dict = None):
-        """Create the basic matplotlib table with layout-specific styling."""
-        import re
+        """Create the basic matplotlib table with layout-specific styling.
         
-        # Track bold cells (row_idx, col_idx) -> is_bold
-        bold_cells = {}
+        Returns:
+            Tuple of (table, bold_cells, prepared_cells). ``df`` is updated in
+            place so bold cells and column names no longer carry markers.
+        """
+        # Batched preprocessing: bold markers, cleaned text and superscripts
+        prepared = prepare_table_cells(df)
+        bold_cells = prepared.bold_cells()
         
-        # Pre-process DF to find bold markers and strip them IN-PLACE so Formatter sees clean text
-        for row_idx in range(len(df)):
-            for col_idx in range(len(df.columns)):
-                cell_value = df.iloc[row_idx, col_idx]
-                original_cell = str(cell_value) if cell_value is not None else ""
-                
-                # Check for bold markdown
-                cleaned_cell = original_cell
-                is_bold = False
-                
-                if '**' in original_cell:
-                    cleaned_cell = re.sub(r'\*\*(.*?)\*\*', r'\1', original_cell)
-                    is_bold = True
-                    bold_cells[(row_idx + 1, col_idx)] = True  # +1 for header offset
-                elif '<strong>' in original_cell:
-                     cleaned_cell = original_cell.replace('<strong>', '').replace('</strong>', '')
-                     is_bold = True
-                     bold_cells[(row_idx + 1, col_idx)] = True
-                
-                # Update DF in-place with CLEAN text
-                if is_bold:
-                    df.iloc[row_idx, col_idx] = cleaned_cell
-
-        # Prepare data for table with superscript processing (now using clean DF)
-        processed_headers = []
-        for col_idx, col_name in enumerate(df.columns):
-            header_str = str(col_name)
-            # Check headers for bold too
-            if '**' in header_str:
-                header_str = re.sub(r'\*\*(.*?)\*\*', r'\1', header_str)
-                bold_cells[(0, col_idx)] = True
-            elif '<strong>' in header_str:
-                header_str = header_str.replace('<strong>', '').replace('</strong>', '')
-                bold_cells[(0, col_idx)] = True
-            
-            # Process superscripts
-            processed_headers.append(self._process_superscripts_static(header_str))
-            
-            # Update DF column name (if possible, but changing columns is tricky inside loop)
-            # Actually, we don't need to update df.columns for Formatter if Formatter uses df.columns directly
-            # Formatter reads df.columns. If we don't update it, Formatter sees **Bold**.
-            # We should try to rename columns if possible. But renaming columns in pandas returns new DF.
-            # We can set df.columns = new_cols
-        
-        # Update columns in DF
-        # We need original column names stripped of bold markers
-        clean_col_names = []
-        for col_name in df.columns:
-            s = str(col_name)
-            if '**' in s: s = re.sub(r'\*\*(.*?)\*\*', r'\1', s)
-            if '<strong>' in s: s = s.replace('<strong>', '').replace('</strong>', '')
-            clean_col_names.append(s)
-        df.columns = clean_col_names
-            
-        processed_data = []
-        for row_idx in range(len(df)):
-            processed_row = []
-            for col_idx in range(len(df.columns)):
-                # Read from modified DF (clean text)
-                cell_value = df.iloc[row_idx, col_idx]
-                original_cell = str(cell_value) if cell_value is not None else ""
-                processed_cell = self._process_superscripts_static(original_cell)
-                processed_row.append(processed_cell)
-            processed_data.append(processed_row)
+        # Update DF in-place with CLEAN text so Formatter and colors see it
+        rows, cols = np.nonzero(prepared.bold)
+        for row_idx, col_idx in zip(rows, cols):
+            df.iloc[row_idx, col_idx] = prepared.text[row_idx, col_idx]
+        df.columns = prepared.headers
+        
+        processed_headers = prepared.display_headers
+        processed_data = prepared.display.tolist()
         
         # Configure matplotlib globally for Unicode support
         configure_matplotlib_for_tables()
@@ -332,14 +462,14 @@ class ImageRenderer:
             if (row, col) in bold_cells:
                  cell.get_text().set_fontweight('bold')
         
-        # Intelligent scaling - let matplotlib auto-adjust column widths, focus on height
-        table.auto_set_column_width(list(range(len(df.columns))))  # Auto-size all columns
-        table.scale(1.2, 1.1)  # Moderate scaling with auto column sizing
+        # Intelligent scaling - column widths are set from the final cell text
+        # (set_analytic_column_widths) once formatting is done, focus on height
+        table.scale(1.2, 1.1)  # Moderate scaling
         
         # Apply layout-specific colors
         self._apply_table_layout_colors(table, df, colors_config)
         
-        return table, bold_cells
+        return table, bold_cells, prepared
     
     def _apply_table_layout_colors(self, table, df: pd.DataFrame, colors_config: Dict = None):
         """Apply layout-specific colors to table headers and cells."""
@@ -432,7 +562,8 @@ class ImageRenderer:
                     cell.set_facecolor(background_rgb)
                     cell.get_text().set_color(background_text_rgb)
     
-    def _calculate_width(self, df: pd.DataFrame, style_config: Dict) -> float:
+    def _calculate_width(self, df: pd.DataFrame, style_config: Dict,
+                         profile: Optional[TableProfile] = None) -> float:
         """Calculate optimal table width based on content and configuration.
         
         Delegates to TableContentAnalyzer for consistent logic.
@@ -448,15 +579,16 @@ class ImageRenderer:
             )
         
         base_width = style_config['width_in']
-        return TableContentAnalyzer.calculate_optimal_width(df, base_width, style_config)
+        return TableContentAnalyzer.calculate_optimal_width(df, base_width, style_config, profile)
     
-    def _calculate_height(self, df: pd.DataFrame, style_config: Dict) -> float:
+    def _calculate_height(self, df: pd.DataFrame, style_config: Dict,
+                          profile: Optional[TableProfile] = None) -> float:
         """Calculate optimal table height based on content and wrapping.
         
         Delegates to TableContentAnalyzer for consistent logic.
         """
         base_row_height = style_config.get('row_height_in', 0.3)
-        return TableContentAnalyzer.calculate_optimal_height(df, base_row_height)
+        return TableContentAnalyzer.calculate_optimal_height(df, base_row_height, profile)
     
     def _get_font_list(self, font_family: str, font_config: Dict = None) -> List[str]:
         """Get font list for the specified font family from configuration.
@@ -502,22 +634,27 @@ class ImageRenderer:
         title_size = tables_typo['title']['size']
         fig.suptitle(title, fontsize=title_size, fontweight='bold', y=0.95)
     
-    def _save_image(self, fig, output_dir: str, table_number: int, title: str = None, document_type: str = 'report', colors_config: Dict = None) -> str:
-        """Save the figure and return the file path."""
+    def resolve_output_dir(self, output_dir: Optional[str], document_type: str = 'report') -> str:
+        """Resolve the directory where table images are written."""
         if not output_dir:
             abs_dirs = get_absolute_output_directories(document_type)
             if 'tables' not in abs_dirs:
                 raise ValueError("Missing 'tables' directory in output configuration")
             output_dir = abs_dirs['tables']
-        
-        # Ensure output directory exists
-        Path(output_dir).mkdir(parents=True, exist_ok=True)
-        
+        return str(output_dir)
+    
+    def get_image_path(self, output_dir: Optional[str], table_number: int,
+                       document_type: str = 'report') -> str:
+        """Return the path a table image will be saved to, without rendering it."""
         # Generate filename - simplified to just table_number
         # Title information is preserved in the caption/markdown
         filename = f"table_{table_number}.png"
-        
-        output_path = Path(output_dir) / filename
+        return str(Path(self.resolve_output_dir(output_dir, document_type)) / filename)
+    
+    def _save_image(self, fig, output_dir: str, table_number: int, title: str = None, document_type: str = 'report',
+                    colors_config: Dict = None, image_formats: Tuple[str, ...] = RASTER_FORMATS) -> str:
+        """Save the figure in every requested format and return the PNG path."""
+        output_path = Path(self.get_image_path(output_dir, table_number, document_type))
         
         # Get background color from palette (default to white if not available)
         bg_color = 'white'
@@ -529,17 +666,18 @@ class ImageRenderer:
                     # Convert RGB [0-255] to matplotlib format [0-1]
                     bg_color = [c/255.0 for c in bg_rgb[:3]]
         
-        # Save with high quality
-        fig.savefig(
+        # Save with high quality (existing files are replaced, never written through:
+        # earlier versions hardlinked them to cache entries)
+        return save_figure(
+            fig,
             output_path,
+            image_formats,
             dpi=300,
             bbox_inches='tight',
             pad_inches=0.1,
             facecolor=bg_color,
             edgecolor='none'
         )
-        
-        return str(output_path)
 
 
 class MarkdownGenerator:
@@ -597,7 +735,8 @@ class MarkdownGenerator:
     
     def generate_table_markdown(self, image_paths: Union[str, List[str]], 
                                caption: str = None, table_number: int = 1,
-                               document_columns: int = 1, label: str = None, language: str = 'es') -> str:
+                               document_columns: int = 1, label: str = None, language: str = 'es',
+                               image_formats: Tuple[str, ...] = RASTER_FORMATS) -> str:
         """Generate markdown content for table(s).
         
         Args:
@@ -607,17 +746,22 @@ class MarkdownGenerator:
             document_columns: Total number of columns in the document layout
             label: Custom label for cross-referencing. If None, uses table_number.
             language: Language for translations ('en' or 'es')
+            image_formats: Formats saved for each image; vector variants are
+                          referenced per output format
         """
         
         if isinstance(image_paths, str):
             return self._generate_single_table_markdown(image_paths, caption, table_number, 
-                                                       document_columns, label=label)
+                                                       document_columns, label=label,
+                                                       image_formats=image_formats)
         else:
             return self._generate_split_table_markdown(image_paths, caption, table_number,
-                                                       document_columns, label=label, language=language)
+                                                       document_columns, label=label, language=language,
+                                                       image_formats=image_formats)
     
     def _generate_single_table_markdown(self, image_path: str, caption: str, table_number: int,
-                                       document_columns: int = 1, label: str = None) -> str:
+                                       document_columns: int = 1, label: str = None,
+                                       image_formats: Tuple[str, ...] = RASTER_FORMATS) -> str:
         """Generate markdown for a single table in Quarto format.
         
         Uses Quarto's Figure format but with a 'tbl-' label prefix. This makes
@@ -631,6 +775,7 @@ class MarkdownGenerator:
             document_columns: Total columns in document
             label: Custom label for cross-referencing. If None, uses table_number.
                    May or may not include the 'tbl-' prefix; it will be normalized.
+            image_formats: Formats saved for the image
         """
         # Extract relative path for markdown
         rel_path = self._get_relative_path(image_path)
@@ -647,13 +792,15 @@ class MarkdownGenerator:
         
         # Quarto Figure format with tbl- prefix: ![Caption](path){#tbl-id}
         # This removes unwanted table borders while keeping Table numbering.
-        if caption:
-            return f"\n\n![{caption}]({rel_path}){{#{label_id} width={width_str}}}\n\n"
-        else:
-            return f"\n\n![]({rel_path}){{#{label_id} width={width_str}}}\n\n"
+        alt = caption or ''
+        figure = conditional_image_markdown(
+            lambda path: f"![{alt}]({path}){{#{label_id} width={width_str}}}", rel_path, image_formats
+        )
+        return f"\n\n{figure}\n\n"
     
     def _generate_split_table_markdown(self, image_paths: List[str], caption: str, table_number: int,
-                                      document_columns: int = 1, label: str = None, language: str = 'es') -> str:
+                                      document_columns: int = 1, label: str = None, language: str = 'es',
+                                      image_formats: Tuple[str, ...] = RASTER_FORMATS) -> str:
         """Generate markdown for split tables in Quarto format.
         
         Args:
@@ -664,6 +811,7 @@ class MarkdownGenerator:
             label: Custom label for cross-referencing. If None, uses table_number.
                   For split tables, appends part number (e.g., 'results-1', 'results-2')
             language: Language for 'Part' translation ('en' or 'es')
+            image_formats: Formats saved for each image
         """
         from ePy_docs.core._project import get_translation
         
@@ -688,15 +836,63 @@ class MarkdownGenerator:
             
             # Quarto Figure format with tbl- prefix
             # This removes unwanted table borders while keeping Table numbering.
-            if caption:
-                part_caption = f"{caption} - {part_text} {i+1}/{num_parts}"
-                markdown_parts.append(f"![{part_caption}]({rel_path}){{#{label_id} width={width_str}}}")
-            else:
-                markdown_parts.append(f"![]({rel_path}){{#{label_id} width={width_str}}}")
+            part_caption = f"{caption} - {part_text} {i+1}/{num_parts}" if caption else ''
+            markdown_parts.append(conditional_image_markdown(
+                lambda path: f"![{part_caption}]({path}){{#{label_id} width={width_str}}}",
+                rel_path, image_formats
+            ))
         
         # Add TWO line breaks before first table for proper PDF spacing
         return "\n\n" + "\n\n".join(markdown_parts) + "\n\n"
     
+    def generate_native_table_markdown(self, tables: List[str], caption: str, table_number: int,
+                                       label: str = None, language: str = 'es',
+                                       font_size: Optional[float] = None) -> str:
+        """Generate markdown for native (text) tables in Quarto format.
+        
+        Captions and labels follow the image tables: one 'tbl-' label per
+        part and a 'Part i/n' suffix on split tables. The table font size is
+        applied in PDF output through a raw LaTeX group.
+        
+        Args:
+            tables: Pipe tables (without caption), one per part
+            caption: Table caption
+            table_number: Starting table number
+            label: Custom label for cross-referencing. If None, uses table_number.
+            language: Language for 'Part' translation ('en' or 'es')
+            font_size: Table font size in points (None = document font size)
+        """
+        from ePy_docs.core._project import get_translation
+        
+        num_parts = len(tables)
+        part_text = get_translation('part', language) if num_parts > 1 else None
+        markdown_parts = []
+        
+        for i, table in enumerate(tables):
+            # Normalize label: strip 'tbl-' prefix if already present to avoid double-prefixing
+            if label:
+                clean_label = label[4:] if label.startswith('tbl-') else label
+                label_id = f"tbl-{clean_label}-{i+1}" if num_parts > 1 else f"tbl-{clean_label}"
+            else:
+                label_id = f"tbl-{table_number + i}"
+            
+            # Pipe table caption: ': Caption {#tbl-id}' right after the table
+            if caption and num_parts > 1:
+                caption_line = f": {caption} - {part_text} {i+1}/{num_parts} {{#{label_id}}}"
+            elif caption:
+                caption_line = f": {caption} {{#{label_id}}}"
+            else:
+                caption_line = f": {{#{label_id}}}"
+            
+            block = f"{table}\n\n{caption_line}"
+            if font_size:
+                leading = round(float(font_size) * 1.2, 1)
+                block = (f"```{{=latex}}\n\\begingroup\\fontsize{{{font_size}}}{{{leading}}}\\selectfont\n```\n\n"
+                         f"{block}\n\n```{{=latex}}\n\\endgroup\n```")
+            markdown_parts.append(block)
+        
+        return "\n\n" + "\n\n".join(markdown_parts) + "\n\n"
+    
     def _get_relative_path(self, image_path: str) -> str:
         """Convert absolute path to relative path for markdown, optimized for new structure."""
         path = Path(image_path)
@@ -736,6 +932,271 @@ class MarkdownGenerator:
             return f"tables/{path.name}"
 
 
+# ============================================================================
+# NATIVE TABLES - TEXT OUTPUT WITHOUT MATPLOTLIB
+# ============================================================================
+
+TABLE_ENGINES = ('image', 'native')
+
+
+def validate_table_engine(engine: str) -> str:
+    """Validate a table engine name ('image' or 'native')."""
+    if engine not in TABLE_ENGINES:
+        raise ValueError(f"Unknown table engine '{engine}'. Use one of: {', '.join(TABLE_ENGINES)}")
+    return engine
+
+
+class NativeTableRenderer:
+    """
+    SOLID: Single Responsibility - Text tables emitted from the DataFrame.
+    
+    Builds Quarto pipe tables instead of images: matplotlib is skipped and
+    the table stays selectable and searchable in every output format. The
+    layout styling carries over:
+    
+    - Cell text gets the same bold-marker and superscript preprocessing
+    - HTML: the layout CSS already styles headers and stripes; highlight
+      gradients are block spans with an inline background color
+    - PDF: header, stripe and highlight colors as inline ``\\cellcolor``
+      (colortbl); the table font size is applied by MarkdownGenerator
+    - DOCX: no cell colors (pandoc drops both the raw LaTeX and span styles)
+    - Column widths follow the content-based proportions of the profile
+    """
+    
+    # Line width pandoc compares pipe table rows against (--columns default)
+    LINE_WIDTH = 72
+    
+    def __init__(self, config_manager: TableConfigManager, color_manager: ColorManager):
+        self._config_manager = config_manager
+        self._color_manager = color_manager
+    
+    def get_font_size(self, layout_style: str, document_type: str) -> Optional[float]:
+        """Table content font size of the layout (points)."""
+        font_config = self._config_manager.get_layout_config(layout_style, document_type)[0]
+        return font_config.get('element_typography', {}).get('tables', {}).get('content', {}).get('size')
+    
+    def render(self, df: pd.DataFrame, layout_style: str, document_type: str,
+               highlight_columns: Optional[Union[str, List[str]]] = None,
+               colored: bool = False, palette_name: Optional[str] = None,
+               profile: Optional[TableProfile] = None) -> str:
+        """Build the pipe table for df (caption and label are added by MarkdownGenerator).
+        
+        Args:
+            df: Table data
+            layout_style: Layout whose table colors are used
+            document_type: Document type for configuration lookup
+            highlight_columns: Columns colored with a palette gradient
+            colored: Color every column when highlight_columns is not given
+            palette_name: Palette for highlighted columns
+            profile: Precomputed TableProfile of df (computed if None)
+            
+        Returns:
+            Pipe table markdown
+        """
+        colors_config = self._config_manager.get_layout_config(layout_style, document_type)[1]
+        if profile is None:
+            profile = TableProfile.from_dataframe(df)
+        
+        prepared = prepare_table_cells(df)
+        layout_colors = self._layout_colors(colors_config)
+        highlight_colors = {}
+        if highlight_columns or colored:
+            highlight_colors = self._color_manager.get_highlight_colors(
+                df, colors_config, highlight_columns, palette_name, colored
+            )
+        
+        header_style = layout_colors.get('header')
+        header = [self._format_cell(text, True, header_style) for text in prepared.display_headers]
+        
+        widths = TableContentAnalyzer.calculate_column_widths(df, self.LINE_WIDTH, profile)
+        separator = [':' + '-' * max(3, int(round(width)) - 2) + ':' for width in widths]
+        
+        lines = [self._format_row(header), self._format_row(separator)]
+        num_rows, num_cols = prepared.shape
+        for row_idx in range(num_rows):
+            # Body rows alternate background/stripe like the image renderer (1-based)
+            row_style = layout_colors.get('stripe' if (row_idx + 1) % 2 == 0 else 'background')
+            cells = []
+            for col_idx in range(num_cols):
+                style, highlighted = row_style, col_idx in highlight_colors
+                if highlighted:
+                    style = tuple(self._hex(color) for color in highlight_colors[col_idx][row_idx])
+                cells.append(self._format_cell(prepared.display[row_idx, col_idx],
+                                               prepared.bold[row_idx, col_idx], style, highlighted))
+            lines.append(self._format_row(cells))
+        
+        return '\n'.join(lines)
+    
+    def _layout_colors(self, colors_config: Dict) -> Dict[str, Tuple[str, str]]:
+        """(background, text) hex colors for header, stripe and background rows."""
+        palette = (colors_config or {}).get('palette')
+        if not palette:
+            return {}
+        
+        required_colors = ['table_header', 'table_header_text', 'table_stripe', 'table_background']
+        missing_colors = [c for c in required_colors if c not in palette]
+        if missing_colors:
+            raise ValueError(f"Palette must have {required_colors}. Missing: {missing_colors}")
+        
+        page_text = palette.get('page_text', [0, 0, 0])
+        return {
+            'header': (self._hex(palette['table_header']), self._hex(palette['table_header_text'])),
+            'stripe': (self._hex(palette['table_stripe']),
+                       self._hex(palette.get('table_stripe_text', page_text))),
+            'background': (self._hex(palette['table_background']),
+                           self._hex(palette.get('table_background_text', page_text))),
+        }
+    
+    @staticmethod
+    def _hex(color) -> str:
+        """Hex digits (RRGGBB) of an RGB list (0-255) or '#RRGGBB' string."""
+        if isinstance(color, str):
+            return color.lstrip('#').upper()
+        if isinstance(color, (list, tuple)) and len(color) >= 3:
+            return ''.join(f'{int(c):02X}' for c in color[:3])
+        raise ValueError(f"Unsupported color value: {color!r}")
+    
+    @staticmethod
+    def _format_cell(text: str, bold: bool, style: Optional[Tuple[str, str]],
+                     highlighted: bool = False) -> str:
+        """Escape cell text for a pipe table, adding bold and cell colors.
+        
+        Every style becomes raw LaTeX colortbl commands. Highlighted cells are
+        also wrapped in a span with inline colors, since the HTML layout CSS
+        only covers header and stripe rows.
+        """
+        text = ' '.join(str(text).split())  # Pipe table cells are single-line
+        text = text.replace('|', '\\|')
+        if bold and text:
+            text = f"**{text}**"
+        if style:
+            background, foreground = style
+            if highlighted:
+                text = text.replace('[', '\\[').replace(']', '\\]')
+                text = (f'[{text}]{{style="display:block;background-color:#{background};'
+                        f'color:#{foreground}"}}')
+            text = f"`\\cellcolor[HTML]{{{background}}}\\color[HTML]{{{foreground}}}`{{=latex}}{text}"
+        return text
+    
+    @staticmethod
+    def _format_row(cells: List[str]) -> str:
+        return '| ' + ' | '.join(cells) + ' |'
+
+
+# ============================================================================
+# DEFERRED RENDERING - PROCESS POOL
+# ============================================================================
+
+
+def _render_table_job(layout_config: Tuple, render_args: Dict[str, Any],
+                      cache_settings: Dict[str, Any]) -> str:
+    """Render one table image inside a worker process.
+    
+    The layout configuration resolved in the parent process replaces the
+    worker's cached one on every job, so every worker renders with exactly
+    the same settings as the serial path. Workers are reused across jobs
+    and would otherwise keep a config the parent has since reloaded.
+    """
+    cache_key = f"{render_args['layout_style']}_{render_args['document_type']}"
+    table_orchestrator._config_manager._cache[cache_key] = layout_config
+    image_cache = table_orchestrator._image_renderer.image_cache
+    if image_cache.settings() != cache_settings:
+        image_cache.configure(**cache_settings)
+    return table_orchestrator._image_renderer.create_table_image(**render_args)
+
+
+class TableRenderPool:
+    """
+    SOLID: Single Responsibility - Deferred table image rendering.
+    
+    Table numbers, image paths and markdown are resolved immediately by the
+    orchestrator; only the matplotlib build and ``savefig`` are shipped to a
+    ``ProcessPoolExecutor``. Pending renders are collected with ``join()``
+    before the QMD file is written.
+    """
+    
+    def __init__(self, max_workers: Optional[int] = None):
+        """Initialize pool; worker processes are started on first submit.
+        
+        Args:
+            max_workers: Number of worker processes (None = CPU count)
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be a positive integer, got {max_workers}")
+        self.max_workers = max_workers
+        self._executor = None
+        self._pending = []
+    
+    @property
+    def pending_count(self) -> int:
+        """Number of submitted renders not yet joined."""
+        return len(self._pending)
+    
+    def submit(self, image_renderer: ImageRenderer, layout_config: Tuple,
+               render_args: Dict[str, Any]) -> str:
+        """Queue a table render and return the path the image will have.
+        
+        Args:
+            image_renderer: Renderer used to resolve the final image path
+            layout_config: Resolved layout configuration tuple
+            render_args: Keyword arguments for ImageRenderer.create_table_image
+            
+        Returns:
+            Absolute path of the (future) table image
+        """
+        if self._executor is None:
+            from concurrent.futures import ProcessPoolExecutor
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        
+        render_args = dict(render_args)
+        render_args['output_dir'] = image_renderer.resolve_output_dir(
+            render_args.get('output_dir'), render_args['document_type']
+        )
+        image_path = image_renderer.get_image_path(
+            render_args['output_dir'], render_args['table_number'], render_args['document_type']
+        )
+        
+        future = self._executor.submit(
+            _render_table_job, layout_config, render_args, image_renderer.image_cache.settings()
+        )
+        self._pending.append((future, image_path))
+        return image_path
+    
+    def join(self) -> List[str]:
+        """Wait for all pending renders.
+        
+        Returns:
+            Paths of the rendered images, in submission order
+            
+        Raises:
+            RuntimeError: If any render failed (after all renders finished)
+        """
+        pending, self._pending = self._pending, []
+        rendered = []
+        errors = []
+        
+        for future, image_path in pending:
+            try:
+                rendered.append(future.result())
+            except Exception as e:
+                errors.append(f"{Path(image_path).name}: {e}")
+        
+        if errors:
+            raise RuntimeError(f"Table rendering failed: {'; '.join(errors)}")
+        
+        return rendered
+    
+    def shutdown(self) -> None:
+        """Join pending renders and stop worker processes."""
+        try:
+            if self._pending:
+                self.join()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+
 class TableOrchestrator:
     """
     SOLID: Facade Pattern - Main coordinator for table processing operations.
@@ -755,6 +1216,7 @@ class TableOrchestrator:
         self._cell_formatter = CellFormatter(self._font_manager, self._color_manager)
         self._image_renderer = ImageRenderer(self._config_manager)
         self._markdown_generator = MarkdownGenerator()
+        self._native_renderer = NativeTableRenderer(self._config_manager, self._color_manager)
     
     def create_table_image_and_markdown(self, df: pd.DataFrame, caption: str = None,
                                        layout_style: str = "corporate", output_dir: str = None,
@@ -769,7 +1231,9 @@ class TableOrchestrator:
                                        filter_by: Dict[str, Any] = None,
                                        sort_by: Union[str, List[str], None] = None,
                                        label: str = None,
-                                       language: str = 'es') -> Tuple[str, Union[str, List[str]], int]:
+                                       language: str = 'es',
+                                       render_pool: Optional[TableRenderPool] = None,
+                                       engine: str = 'image') -> Tuple[str, Union[str, List[str], None], int]:
         """
         Main public API for table processing.
         
@@ -788,9 +1252,15 @@ class TableOrchestrator:
             palette_name: Color palette name for highlighting
             label: Custom label for cross-referencing (e.g., 'results'). Will be formatted as 'tbl-{label}'.
                    If None, uses table_number (e.g., 'tbl-1')
+            render_pool: Optional TableRenderPool. When given, images are rendered
+                   in worker processes and the returned paths become valid after
+                   ``render_pool.join()``.
+            engine: 'image' (matplotlib PNG) or 'native' (Quarto pipe table,
+                   split only by max_rows_per_table; no image is produced)
             
         Returns:
-            Tuple of (markdown_content, image_path_or_paths, new_counter)
+            Tuple of (markdown_content, image_path_or_paths, new_counter);
+            image_path_or_paths is None for native tables
         """
         try:
             # Validate required parameter
@@ -818,9 +1288,18 @@ class TableOrchestrator:
                 elif isinstance(max_rows_per_table, list):
                     max_rows_per_table = [int(x) if isinstance(x, float) else x for x in max_rows_per_table]
             
+            if validate_table_engine(engine) == 'native':
+                return self._process_native_table(
+                    processed_df, caption, layout_style, table_number, max_rows_per_table,
+                    document_type, highlight_columns, colored, palette_name,
+                    label=label, language=language
+                )
+            
             # Check if table needs to be split
             should_split = False
             table_chunks = None
+            profile = None
+            chunk_profiles = None
             
             if max_rows_per_table:
                 # Handle list input for max_rows_per_table
@@ -853,11 +1332,14 @@ class TableOrchestrator:
                 from ePy_docs.core._data import TablePreparation
                 base_height = style_config.get('row_height_in', 0.3)
                 
-                potential_chunks = TablePreparation.split_by_height(processed_df, max_height, base_height)
+                # The profile is reused by every chunk's sizing and formatting
+                profile = TableProfile.from_dataframe(processed_df)
+                bounds = TablePreparation.height_split_bounds(profile, max_height, base_height)
                 
-                if len(potential_chunks) > 1:
+                if len(bounds) > 1:
                     should_split = True
-                    table_chunks = potential_chunks
+                    table_chunks = [processed_df.iloc[start:stop] for start, stop in bounds]
+                    chunk_profiles = [profile.slice(start, stop) for start, stop in bounds]
                 else:
                     should_split = False
             
@@ -866,13 +1348,15 @@ class TableOrchestrator:
                     processed_df, caption, layout_style, output_dir, table_number, 
                     width_inches, max_rows_per_table, document_type,
                     document_columns, highlight_columns, colored, palette_name, 
-                    label=label, language=language, table_chunks=table_chunks
+                    label=label, language=language, table_chunks=table_chunks,
+                    render_pool=render_pool, chunk_profiles=chunk_profiles
                 )
             
             return self._process_single_table(
                 processed_df, caption, layout_style, output_dir, table_number, 
                 width_inches, document_type, document_columns,
-                highlight_columns, colored, palette_name, label=label, language=language
+                highlight_columns, colored, palette_name, label=label, language=language,
+                render_pool=render_pool, profile=profile
             )
                 
         except Exception as e:
@@ -883,17 +1367,23 @@ class TableOrchestrator:
                              output_dir: str, table_number: int, width_inches: float,
                              document_type: str,
                              document_columns: int, highlight_columns: Optional[Union[str, List[str]]],
-                             colored: bool, palette_name: Optional[str], label: str = None, language: str = 'es') -> Tuple[str, str, int]:
+                             colored: bool, palette_name: Optional[str], label: str = None, language: str = 'es',
+                             render_pool: Optional[TableRenderPool] = None,
+                             profile: Optional[TableProfile] = None) -> Tuple[str, str, int]:
         """Process a single table."""
+        image_formats = get_image_output_policy().formats
+        
         # Generate table image
-        image_path = self._image_renderer.create_table_image(
-            df, width_inches, caption, layout_style, output_dir, table_number,
-            document_type, highlight_columns, colored, palette_name
+        image_path = self._render_image(
+            render_pool, df, width_inches, caption, layout_style, output_dir, table_number,
+            document_type, highlight_columns, colored, palette_name, profile=profile,
+            image_formats=image_formats
         )
         
         # Generate markdown
         markdown_content = self._markdown_generator.generate_table_markdown(
-            image_path, caption, table_number, document_columns, label=label, language=language
+            image_path, caption, table_number, document_columns, label=label, language=language,
+            image_formats=image_formats
         )
         
         return markdown_content, image_path, table_number
@@ -904,8 +1394,15 @@ class TableOrchestrator:
                             document_type: str,
                             document_columns: int, highlight_columns: Optional[Union[str, List[str]]],
                             colored: bool, palette_name: Optional[str], label: str = None, 
-                            language: str = 'es', table_chunks: List[pd.DataFrame] = None) -> Tuple[str, List[str], int]:
-        """Process a table that needs to be split."""
+                            language: str = 'es', table_chunks: List[pd.DataFrame] = None,
+                            render_pool: Optional[TableRenderPool] = None,
+                            chunk_profiles: Optional[List[TableProfile]] = None) -> Tuple[str, List[str], int]:
+        """Process a table that needs to be split.
+        
+        ``chunk_profiles`` holds the TableProfile of each chunk when the split
+        was computed from a profile; otherwise each chunk is profiled when
+        rendered.
+        """
         
         # Use provided chunks or split using legacy max_rows
         if table_chunks is None:
@@ -914,6 +1411,7 @@ class TableOrchestrator:
             table_chunks = TablePreparation.split_for_rendering(df, max_rows_per_table)
         
         # Generate images for each chunk
+        image_formats = get_image_output_policy().formats
         image_paths = []
         current_table_number = table_number
         
@@ -926,10 +1424,12 @@ class TableOrchestrator:
                 
             part_caption = f"{caption}{part_suffix}" if caption else None
             
-            image_path = self._image_renderer.create_table_image(
-                chunk, width_inches, part_caption, layout_style, output_dir, 
+            image_path = self._render_image(
+                render_pool, chunk, width_inches, part_caption, layout_style, output_dir, 
                 current_table_number,
-                document_type, highlight_columns, colored, palette_name
+                document_type, highlight_columns, colored, palette_name,
+                profile=chunk_profiles[i] if chunk_profiles else None,
+                image_formats=image_formats
             )
             
             image_paths.append(image_path)
@@ -938,10 +1438,61 @@ class TableOrchestrator:
         
         # Generate combined markdown
         markdown_content = self._markdown_generator.generate_table_markdown(
-            image_paths, caption, table_number, document_columns, label=label, language=language
+            image_paths, caption, table_number, document_columns, label=label, language=language,
+            image_formats=image_formats
         )
         
         return markdown_content, image_paths, current_table_number
+    
+    def _process_native_table(self, df: pd.DataFrame, caption: str, layout_style: str,
+                              table_number: int, max_rows_per_table: Union[int, List[int], None],
+                              document_type: str, highlight_columns: Optional[Union[str, List[str]]],
+                              colored: bool, palette_name: Optional[str], label: str = None,
+                              language: str = 'es') -> Tuple[str, None, int]:
+        """Process a table with the native engine (pipe tables, no images).
+        
+        Tables are split only by max_rows_per_table: long text tables break
+        across pages on their own.
+        """
+        if max_rows_per_table and (isinstance(max_rows_per_table, list) or len(df) > max_rows_per_table):
+            table_chunks = TablePreparation.split_for_rendering(df, max_rows_per_table)
+        else:
+            table_chunks = [df]
+        
+        tables = [
+            self._native_renderer.render(chunk, layout_style, document_type,
+                                         highlight_columns, colored, palette_name)
+            for chunk in table_chunks
+        ]
+        markdown_content = self._markdown_generator.generate_native_table_markdown(
+            tables, caption, table_number, label=label, language=language,
+            font_size=self._native_renderer.get_font_size(layout_style, document_type)
+        )
+        
+        return markdown_content, None, table_number + len(tables) - 1
+    
+    def _render_image(self, render_pool: Optional[TableRenderPool], df: pd.DataFrame,
+                      width_inches: float, caption: str, layout_style: str, output_dir: str,
+                      table_number: int, document_type: str,
+                      highlight_columns: Optional[Union[str, List[str]]],
+                      colored: bool, palette_name: Optional[str],
+                      profile: Optional[TableProfile] = None,
+                      image_formats: Tuple[str, ...] = RASTER_FORMATS) -> str:
+        """Render a table image now, or queue it on the render pool."""
+        render_args = {
+            'data': df, 'width_inches': width_inches, 'title': caption,
+            'layout_style': layout_style, 'output_dir': output_dir,
+            'table_number': table_number, 'document_type': document_type,
+            'highlight_columns': highlight_columns, 'colored': colored,
+            'palette_name': palette_name, 'profile': profile,
+            'image_formats': image_formats,
+        }
+        
+        if render_pool is None:
+            return self._image_renderer.create_table_image(**render_args)
+        
+        layout_config = self._config_manager.get_layout_config(layout_style, document_type)
+        return render_pool.submit(self._image_renderer, layout_config, render_args)
 
 
 # ============================================================================
@@ -949,3 +1500,87 @@ class TableOrchestrator:
 # ============================================================================
 
 table_orchestrator = TableOrchestrator()
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def benchmark_table_rendering(renders: int = 1000, rows: int = 20, columns: int = 6,
+                              layout_style: str = 'classic', document_type: str = 'report',
+                              sample_every: int = 50,
+                              output_dir: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Measure table image throughput and resident memory over many renders.
+    
+    Each render uses different random data and bypasses the image cache, so
+    every table goes through matplotlib. Figures come from the process-wide
+    figure pool and garbage is collected by the memory watermark policy.
+    
+    Args:
+        renders: Number of tables to render (>= 1)
+        rows: Rows per table
+        columns: Columns per table
+        layout_style: Layout to render with
+        document_type: Document type
+        sample_every: Renders between RSS samples (>= 1)
+        output_dir: Directory for the images (None = temporary)
+        
+    Returns:
+        Dictionary with 'renders', 'seconds', 'renders_per_second', RSS
+        samples as (render, MiB) pairs in 'rss_mb', 'rss_start_mb',
+        'rss_peak_mb', 'rss_end_mb' and the figure pool / garbage
+        collection counters ('pool', 'gc')
+        
+    Raises:
+        ValueError: If renders or sample_every < 1
+    """
+    import tempfile
+    import time
+    from ePy_docs.core._figures import current_rss
+    
+    if renders < 1:
+        raise ValueError(f"renders must be >= 1, got {renders}")
+    if sample_every < 1:
+        raise ValueError(f"sample_every must be >= 1, got {sample_every}")
+    
+    def _rss_mb() -> Optional[float]:
+        rss = current_rss()
+        return round(rss / (1024 * 1024), 1) if rss is not None else None
+    
+    renderer = ImageRenderer(table_orchestrator._config_manager, TableImageCache(enabled=False))
+    rng = np.random.default_rng(0)
+    column_names = [f"Col {i + 1}" for i in range(columns)]
+    pool_before = get_figure_pool().stats()
+    gc_before = get_memory_watermark().stats()
+    
+    with tempfile.TemporaryDirectory(prefix='epy_docs_bench_') as tmp_dir:
+        target_dir = output_dir or tmp_dir
+        samples = [(0, _rss_mb())]
+        start = time.perf_counter()
+        for i in range(1, renders + 1):
+            df = pd.DataFrame(rng.normal(size=(rows, columns)).round(3), columns=column_names)
+            renderer.create_table_image(
+                df, width_inches=None, layout_style=layout_style, output_dir=target_dir,
+                table_number=i, document_type=document_type
+            )
+            if i % sample_every == 0 or i == renders:
+                samples.append((i, _rss_mb()))
+        seconds = time.perf_counter() - start
+    
+    pool_after = get_figure_pool().stats()
+    gc_after = get_memory_watermark().stats()
+    rss_values = [mb for _, mb in samples if mb is not None]
+    
+    return {
+        'renders': renders,
+        'seconds': seconds,
+        'renders_per_second': renders / seconds if seconds > 0 else float('inf'),
+        'rss_mb': samples,
+        'rss_start_mb': samples[0][1],
+        'rss_peak_mb': max(rss_values) if rss_values else None,
+        'rss_end_mb': samples[-1][1],
+        'pool': {key: pool_after[key] - pool_before.get(key, 0) if key != 'idle' else pool_after[key]
+                 for key in pool_after},
+        'gc': {key: gc_after[key] - gc_before[key] for key in gc_after},
+    }
@@ -105,9 +105,9 @@ def add_text_to_content(content: str) -> str:
     
     # Process mathematical notation using FORMAT module
     try:
-        from ePy_docs.core._format import SuperscriptFormatter, FormatConfig
+        from ePy_docs.core._format import get_superscript_formatter
         
-        formatter = SuperscriptFormatter(FormatConfig())
+        formatter = get_superscript_formatter('html')
         
         # First, process ${variable} patterns
         def process_math_variable(match):
@@ -124,7 +124,7 @@ def add_text_to_content(content: str) -> str:
         formatted_parts = []
         for i, part in enumerate(parts):
             if i % 2 == 0:  # Even indices are regular text
-                formatted_part = formatter.format_superscripts(part, 'html')
+                formatted_part = formatter.format(part)
                 formatted_parts.append(formatted_part)
             else:  # Odd indices are LaTeX equations - preserve them exactly
                 formatted_parts.append(part)
@@ -176,20 +176,20 @@ def process_text_content(text: str) -> str:
     
     # Process mathematical notation
     try:
-        from ePy_docs.core._format import SuperscriptFormatter, FormatConfig
+        from ePy_docs.core._format import get_superscript_formatter
         
-        formatter = SuperscriptFormatter(FormatConfig())
+        formatter = get_superscript_formatter('html')
         
         def process_math_variable(match):
             variable_content = match.group(1)
-            formatted_content = formatter.format_superscripts(variable_content, 'html')
+            formatted_content = formatter.format(variable_content)
             return f"${formatted_content}$"
         
         # Process ${variable} patterns
         result = re.sub(r'\$\{([^}]+)\}', process_math_variable, result)
         
         # Apply general superscript processing
-        result = formatter.format_superscripts(result, 'html')
+        result = formatter.format(result)
     except Exception:
         pass
     
@@ -378,11 +378,21 @@ class DocumentWriterCore:
         self.language = self._resolve_language(language)
         
         # State management
-        self.content_buffer = []
+        from ePy_docs.core._buffer import create_content_buffer
+        self.content_buffer = create_content_buffer()
         self._counters = {'table': 0, 'figure': 0, 'note': 0, 'code': 0}
         self.generated_images = []
         self._is_generated = False
         
+        # Deferred table rendering (None = render synchronously in add_table)
+        self._table_render_pool = None
+        
+        # Default table engine: 'image' (matplotlib PNG) or 'native' (pipe table)
+        self._table_engine = 'image'
+        
+        # Output directory tree is created on the first table/figure/image
+        self._output_tree_ready = False
+        
         # Project information storage (moved from DocumentWriter for SRP compliance)
         self._project_info = {}
         self._authors = []
@@ -495,6 +505,107 @@ class DocumentWriterCore:
         self._team_members = []
         self._consultants = []
     
+    def set_table_workers(self, workers: Optional[int]) -> None:
+        """Configure deferred table rendering.
+        
+        Args:
+            workers: Number of worker processes used to render table images.
+                     None, 0 or 1 renders tables synchronously in add_table.
+        """
+        if workers is not None and (not isinstance(workers, int) or workers < 0):
+            raise ValueError(f"workers must be a non-negative integer or None, got {workers!r}")
+        
+        if self._table_render_pool is not None:
+            self._table_render_pool.shutdown()
+            self._table_render_pool = None
+        
+        if workers and workers > 1:
+            from ePy_docs.core._tables import TableRenderPool
+            self._table_render_pool = TableRenderPool(max_workers=workers)
+    
+    def set_table_engine(self, engine: str) -> None:
+        """Select the default table engine for add_table/add_colored_table.
+        
+        Args:
+            engine: 'image' (matplotlib PNG) or 'native' (Quarto pipe table)
+        """
+        from ePy_docs.core._tables import validate_table_engine
+        self._table_engine = validate_table_engine(engine)
+    
+    def set_table_cache(self, enabled: bool = True, cache_dir: Optional[str] = None) -> None:
+        """Configure the on-disk cache of rendered table images.
+        
+        Args:
+            enabled: Whether identical tables reuse previously rendered images
+            cache_dir: Cache directory (None = user cache directory)
+        """
+        from ePy_docs.core._tables import table_orchestrator
+        table_orchestrator._image_renderer.image_cache.configure(enabled, cache_dir)
+
+    def set_image_output(self, mode: str) -> None:
+        """Select the image formats written for tables and plots (process-wide).
+        
+        Args:
+            mode: 'raster' (PNG only) or 'vector' (PNG plus SVG for HTML and PDF for LaTeX)
+        """
+        from ePy_docs.core._image_output import get_image_output_policy
+        get_image_output_policy().configure(mode)
+
+    def set_render_server(self, enabled: bool = True, work_dir: Optional[str] = None) -> None:
+        """Configure warm PDF rendering (process-wide render service).
+        
+        Args:
+            enabled: Use LocalRenderService (precompiled LaTeX preamble per layout)
+            work_dir: Directory for compiled formats (None = user cache directory)
+        """
+        from ePy_docs.core._quarto import use_render_server
+        use_render_server(enabled, work_dir)
+
+    def set_content_buffer(self, backend: str = 'spill', spill_threshold: Optional[int] = None,
+                           spill_dir: Optional[str] = None) -> None:
+        """Select the content buffer backend, keeping content already added.
+
+        Args:
+            backend: 'memory' (plain list) or 'spill' (moves older content to a
+                temporary file once spill_threshold characters are buffered)
+            spill_threshold: Characters kept in memory before spilling (None = default)
+            spill_dir: Directory for the temporary file (None = system temp dir)
+        """
+        from ePy_docs.core._buffer import create_content_buffer
+        buffer = create_content_buffer(backend, spill_threshold, spill_dir)
+        buffer.extend(self.content_buffer)
+        old_buffer, self.content_buffer = self.content_buffer, buffer
+        if hasattr(old_buffer, 'clear'):
+            old_buffer.clear()
+
+    def _prepare_output_tree(self) -> None:
+        """Create the output, tables and figures directories once per writer."""
+        if not self._output_tree_ready:
+            from ePy_docs.core._paths import ensure_output_tree
+            ensure_output_tree(self.document_type)
+            self._output_tree_ready = True
+
+    def _join_pending_tables(self) -> None:
+        """Wait for table images still being rendered by the worker pool."""
+        if self._table_render_pool is not None:
+            self._table_render_pool.join()
+
+    def close(self) -> None:
+        """Finish pending table renders and stop the table worker processes.
+        
+        Called by generate(); call it (or use the writer as a context manager)
+        when a writer with set_table_workers() is discarded without generating.
+        The pool starts new workers if more tables are added later.
+        """
+        if self._table_render_pool is not None:
+            self._table_render_pool.shutdown()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
     # Properties
     @property
     def table_counter(self) -> int:
@@ -659,7 +770,8 @@ class DocumentWriterCore:
                  hide_columns: Union[str, List[str], None] = None,
                  filter_by: Dict[str, Any] = None,
                  sort_by: Union[str, List[str], None] = None,
-                 label: str = None):
+                 label: str = None,
+                 engine: Optional[str] = None):
         self._check_not_generated()
         self._validate_dataframe(df, "df")
         if title is not None:
@@ -684,23 +796,29 @@ class DocumentWriterCore:
             processed_df = DataFrameUtils.hide_columns(processed_df, hide_columns)
             
         from ePy_docs.core._tables import table_orchestrator
-        
-        markdown, image_path, new_table_counter = table_orchestrator.create_table_image_and_markdown(
-            df=processed_df,
-            caption=title,
-            layout_style=self.layout_style,
-            table_number=self._counters['table'] + 1,
-            document_type=self.document_type,
-            max_rows_per_table=max_rows_per_table,
-            highlight_columns=None,
-            colored=False,
-            palette_name=None,
-            label=label,
-            language=self.language,
-            hide_columns=hide_columns,
-            filter_by=filter_by,
-            sort_by=sort_by
-        )
+        from ePy_docs.core._context import writer_context
+        self._prepare_output_tree()
+        
+        # Caption translations resolve project metadata from this writer
+        with writer_context(self):
+            markdown, image_path, new_table_counter = table_orchestrator.create_table_image_and_markdown(
+                df=processed_df,
+                caption=title,
+                layout_style=self.layout_style,
+                table_number=self._counters['table'] + 1,
+                document_type=self.document_type,
+                max_rows_per_table=max_rows_per_table,
+                highlight_columns=None,
+                colored=False,
+                palette_name=None,
+                label=label,
+                language=self.language,
+                hide_columns=hide_columns,
+                filter_by=filter_by,
+                sort_by=sort_by,
+                render_pool=self._table_render_pool,
+                engine=engine or self._table_engine
+            )
         
         self._counters['table'] = new_table_counter
         self.content_buffer.append(markdown)
@@ -711,7 +829,8 @@ class DocumentWriterCore:
             else:
                 self.generated_images.append(image_path)
         
-        if show_figure:
+        if show_figure and image_path:
+            self._join_pending_tables()
             if isinstance(image_path, list):
                 self._display_images(image_path)
             else:
@@ -724,7 +843,8 @@ class DocumentWriterCore:
                          hide_columns: Union[str, List[str], None] = None,
                          filter_by: Dict[str, Any] = None,
                          sort_by: Union[str, List[str], None] = None,
-                         label: str = None):
+                         label: str = None,
+                         engine: Optional[str] = None):
         self._check_not_generated()
         
         # APLICAR PARÁMETROS DIRECTAMENTE AQUÍ para garantizar que funcionen
@@ -746,23 +866,29 @@ class DocumentWriterCore:
             processed_df = DataFrameUtils.hide_columns(processed_df, hide_columns)
             
         from ePy_docs.core._tables import table_orchestrator
-        
-        markdown, image_path, new_table_counter = table_orchestrator.create_table_image_and_markdown(
-            df=processed_df,
-            caption=title,
-            layout_style=self.layout_style,
-            table_number=self._counters['table'] + 1,
-            document_type=self.document_type,
-            max_rows_per_table=max_rows_per_table,
-            highlight_columns=highlight_columns,
-            colored=True,
-            palette_name=palette_name,
-            label=label,
-            language=self.language,
-            hide_columns=hide_columns,
-            filter_by=filter_by,
-            sort_by=sort_by
-        )
+        from ePy_docs.core._context import writer_context
+        self._prepare_output_tree()
+        
+        # Caption translations resolve project metadata from this writer
+        with writer_context(self):
+            markdown, image_path, new_table_counter = table_orchestrator.create_table_image_and_markdown(
+                df=processed_df,
+                caption=title,
+                layout_style=self.layout_style,
+                table_number=self._counters['table'] + 1,
+                document_type=self.document_type,
+                max_rows_per_table=max_rows_per_table,
+                highlight_columns=highlight_columns,
+                colored=True,
+                palette_name=palette_name,
+                label=label,
+                language=self.language,
+                hide_columns=hide_columns,
+                filter_by=filter_by,
+                sort_by=sort_by,
+                render_pool=self._table_render_pool,
+                engine=engine or self._table_engine
+            )
         
         self._counters['table'] = new_table_counter
         self.content_buffer.append(markdown)
@@ -773,7 +899,8 @@ class DocumentWriterCore:
             else:
                 self.generated_images.append(image_path)
         
-        if show_figure:
+        if show_figure and image_path:
+            self._join_pending_tables()
             if isinstance(image_path, list):
                 self._display_images(image_path)
             else:
@@ -849,6 +976,7 @@ class DocumentWriterCore:
     # Images
     def add_plot(self, fig, title: str = None, caption: str = None, source: str = None, palette_name: Optional[str] = None, show_figure: bool = False, label: str = None):
         from ePy_docs.core._images import add_plot_content
+        self._prepare_output_tree()
         
         markdown, new_figure_counter, generated_image_path = add_plot_content(
             fig=fig, title=title, caption=caption,
@@ -882,6 +1010,7 @@ class DocumentWriterCore:
             self._validate_string(label, "label", allow_empty=False, allow_none=False)
         
         from ePy_docs.core._images import add_image_content
+        self._prepare_output_tree()
         
         # Extract parameters from kwargs to avoid duplicates
         responsive = kwargs.pop('responsive', True)
@@ -1184,7 +1313,7 @@ class DocumentWriterCore:
             language = getattr(self, 'language', 'en') or 'en'
             
             # Get data as DataFrame
-            df = get_project_info_dataframe(info_type, language)
+            df = get_project_info_dataframe(info_type, language, writer=self)
             
             if df is not None and not df.empty:
                 # Get localized title
@@ -1216,17 +1345,23 @@ class DocumentWriterCore:
     def generate(self, markdown: bool = False, html: bool = True, pdf: bool = True,
                 qmd: bool = True, tex: bool = False, docx: bool = False, 
                 output_filename: str = None, bibliography_path: str = None,
-                csl_path: str = None):
+                csl_path: str = None, force: bool = False, render_workers: int = 1):
         """Generate output documents in specified formats."""
         if output_filename is not None:
             self._validate_string(output_filename, "filename", allow_empty=False, allow_none=False)
         
         from ePy_docs.core._quarto import prepare_generation, create_and_render
         from ePy_docs.core._config import get_absolute_output_directories
+        from ePy_docs.core._context import writer_context
         from pathlib import Path
         
-        # Prepare content
-        content, project_title = prepare_generation(self, output_filename)
+        # Table images queued on the render pool must exist before the QMD is
+        # written; no table can be added afterwards, so the workers are stopped
+        self.close()
+        
+        # Project metadata lookups during generation resolve to this writer
+        with writer_context(self):
+            content, project_title = prepare_generation(self, output_filename)
         
         # Setup output directory
         if self.output_dir is None:
@@ -1259,19 +1394,23 @@ class DocumentWriterCore:
         self._cleanup_temporary_images()
         
         # Generate using core module - direct call, no intermediate wrapper
-        result_paths = create_and_render(
-            output_path=output_path,
-            content=content,
-            title=project_title,
-            layout_name=self.layout_style,
-            document_type=self.document_type,
-            output_formats=output_formats,
-            language=self.language,
-            bibliography_path=bibliography_path,
-            csl_path=csl_path,
-            page_header=self._page_header,
-            page_footer=self._page_footer
-        )        # Build result dictionary with requested formats only
+        with writer_context(self):
+            result_paths = create_and_render(
+                output_path=output_path,
+                content=content,
+                title=project_title,
+                layout_name=self.layout_style,
+                document_type=self.document_type,
+                output_formats=output_formats,
+                language=self.language,
+                bibliography_path=bibliography_path,
+                csl_path=csl_path,
+                page_header=self._page_header,
+                page_footer=self._page_footer,
+                force=force,
+                render_workers=render_workers,
+                writer=self
+            )        # Build result dictionary with requested formats only
         result = {'qmd': result_paths.get('qmd')}
         
         if markdown:
@@ -13,13 +13,10 @@ Version: 3.0.0 - Zero hardcoding, fail-fast validation
 from typing import Dict, List, Any, Optional, TYPE_CHECKING
 from pathlib import Path
 
+from ePy_docs.core._lazy import get_pandas, is_na
+
 if TYPE_CHECKING:
     import pandas as pd
-else:
-    try:
-        import pandas as pd
-    except ImportError:
-        pd = None
 
 
 def _get_quarto_config_from_documents() -> Dict[str, Any]:
@@ -419,10 +416,7 @@ class FormatValidator:
     @staticmethod
     def sanitize_text(text: Any) -> str:
         """Convert input to string and sanitize."""
-        if pd and (text is None or pd.isna(text)):
-            return ""
-        
-        if text is None:
+        if text is None or is_na(text):
             return ""
         
         # Handle pandas Series
@@ -440,6 +434,7 @@ class FormatValidator:
     @staticmethod
     def validate_dataframe(df: 'pd.DataFrame') -> None:
         """Validate DataFrame input."""
+        pd = get_pandas()
         if pd is None:
             raise ImportError("pandas is required for DataFrame validation")
         
@@ -82,6 +82,8 @@ def main():
         "csquotes",        # Citas contextuales
         "biblatex",        # Bibliografía
         "biber",           # Motor bibliográfico
+        "colortbl",        # Colores en tablas nativas
+        "mylatexformat",   # Preámbulo precompilado (render server)
     ]
     
     print(f"\n📋 Instalando {len(required_packages)} paquetes LaTeX...\n")
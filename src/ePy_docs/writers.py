@@ -23,10 +23,12 @@ Performance Characteristics:
 - Type safe: Explicit signatures prevent runtime errors
 """
 
-from typing import List, Dict, Any, Union, Optional
-import pandas as pd
+from typing import List, Dict, Any, Union, Optional, TYPE_CHECKING
 from ePy_docs.core._text import DocumentWriterCore
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class DocumentWriter(DocumentWriterCore):
     """
@@ -147,6 +149,123 @@ class DocumentWriter(DocumentWriterCore):
         super().set_client_info(name, company, contact, address)
         return self
 
+    def set_table_workers(self, workers: Optional[int]) -> 'DocumentWriter':
+        """Render table images in parallel worker processes.
+
+        Table numbers and markdown are assigned immediately; images are
+        rendered in the background and collected by generate(), which also
+        stops the worker processes. Output is identical to synchronous
+        rendering. A writer that is discarded without generate() should be
+        closed (close(), or `with DocumentWriter(...) as writer:`).
+
+        Args:
+            workers: Number of worker processes. None, 0 or 1 disables
+                    deferred rendering.
+
+        Returns:
+            Self for method chaining.
+        """
+        super().set_table_workers(workers)
+        return self
+
+    def set_table_engine(self, engine: str) -> 'DocumentWriter':
+        """Choose how tables are emitted by default.
+
+        'image' renders each table to a PNG with matplotlib. 'native' writes a
+        Quarto pipe table instead: no image is rendered, the text stays
+        searchable, and the layout's table colors and font size are applied
+        (CSS and inline styles in HTML, colortbl in PDF). DOCX output gets no
+        cell colors, so colored tables lose their gradient there. Native
+        tables are split only by max_rows_per_table. Override per call with
+        add_table(engine=...).
+
+        Args:
+            engine: 'image' (default) or 'native'.
+
+        Returns:
+            Self for method chaining.
+        """
+        super().set_table_engine(engine)
+        return self
+
+    def set_table_cache(self, enabled: bool = True, cache_dir: str = None) -> 'DocumentWriter':
+        """Enable or disable reuse of previously rendered table images.
+
+        Identical tables (same data, layout, width and coloring options) are
+        served from a content-addressed cache instead of being re-rendered.
+        The cache is shared by all writers in the process.
+
+        Args:
+            enabled: Whether to use the table image cache.
+            cache_dir: Cache directory. Defaults to the user cache directory
+                      (override globally with EPY_DOCS_CACHE_DIR).
+
+        Returns:
+            Self for method chaining.
+        """
+        super().set_table_cache(enabled, cache_dir)
+        return self
+
+    def set_image_output(self, mode: str) -> 'DocumentWriter':
+        """Choose the image formats written for table images and plots.
+
+        'raster' writes 300-DPI PNGs. 'vector' also writes an SVG and a PDF
+        of the same figure; the document then uses the SVG in HTML, the PDF
+        in LaTeX/PDF output and the PNG everywhere else (e.g. DOCX). The
+        setting is shared by all writers in the process (default from
+        EPY_DOCS_IMAGE_OUTPUT).
+
+        Args:
+            mode: 'raster' (default) or 'vector'.
+
+        Returns:
+            Self for method chaining.
+        """
+        super().set_image_output(mode)
+        return self
+
+    def set_render_server(self, enabled: bool = True, work_dir: str = None) -> 'DocumentWriter':
+        """Keep LaTeX preamble work between PDF renders (experimental, off by default).
+
+        Each layout's header packages are precompiled once into a LaTeX format
+        (mylatexformat) that later PDF renders with the same layout start
+        from. Falls back to normal rendering with Quarto's own template, and
+        logs a warning, when the format cannot be built or a warm render
+        fails. The render service is shared by all writers in the process.
+
+        Args:
+            enabled: Whether to use warm rendering.
+            work_dir: Directory for compiled formats. Defaults to the user
+                     cache directory (override globally with EPY_DOCS_CACHE_DIR).
+
+        Returns:
+            Self for method chaining.
+        """
+        super().set_render_server(enabled, work_dir)
+        return self
+
+    def set_content_buffer(self, backend: str = 'spill', spill_threshold: int = None,
+                           spill_dir: str = None) -> 'DocumentWriter':
+        """Choose where document content is buffered before generation.
+
+        Content added so far is moved to the new buffer. With the 'spill'
+        backend, content beyond spill_threshold characters is kept in a
+        temporary file, and generate() streams it into the QMD file.
+
+        Args:
+            backend: 'spill' (default) or 'memory'. The initial backend can also
+                    be set with the EPY_DOCS_BUFFER environment variable.
+            spill_threshold: Characters kept in memory before spilling. Defaults
+                            to EPY_DOCS_SPILL_THRESHOLD or 64 Mi characters.
+            spill_dir: Directory for the temporary file. Defaults to the system
+                      temporary directory.
+
+        Returns:
+            Self for method chaining.
+        """
+        super().set_content_buffer(backend, spill_threshold, spill_dir)
+        return self
+
     def add_content(self, content: str) -> 'DocumentWriter':
         """Add raw content directly to the document buffer.
         
@@ -243,13 +362,14 @@ class DocumentWriter(DocumentWriterCore):
         super().add_list(items, list_type=list_type)
         return self
     
-    def add_table(self, df: pd.DataFrame, title: str = None, 
+    def add_table(self, df: 'pd.DataFrame', title: str = None, 
                   show_figure: bool = False,
                   max_rows_per_table: Union[int, List[int], None] = None,
                   hide_columns: Union[str, List[str], None] = None,
                   filter_by: Dict[str, Any] = None,
                   sort_by: Union[str, List[str], None] = None,
-                  label: str = None) -> 'DocumentWriter':
+                  label: str = None,
+                  engine: str = None) -> 'DocumentWriter':
         """Add table with automatic styling based on layout.
         
         Args:
@@ -261,6 +381,8 @@ class DocumentWriter(DocumentWriterCore):
             filter_by: Dictionary to filter rows before rendering.
             sort_by: Column name(s) to sort by before rendering.
             label: Optional Quarto label for cross-referencing.
+            engine: 'image' or 'native'. Defaults to the writer's engine
+                   (see set_table_engine).
             
         Returns:
             Self for method chaining.
@@ -268,10 +390,10 @@ class DocumentWriter(DocumentWriterCore):
         super().add_table(df, title, show_figure,
                           max_rows_per_table=max_rows_per_table,
                           hide_columns=hide_columns, filter_by=filter_by,
-                          sort_by=sort_by, label=label)
+                          sort_by=sort_by, label=label, engine=engine)
         return self
     
-    def add_colored_table(self, df: pd.DataFrame, title: str = None, 
+    def add_colored_table(self, df: 'pd.DataFrame', title: str = None, 
                           show_figure: bool = False,
                           highlight_columns: Union[str, List[str], None] = None,
                           palette_name: str = None,
@@ -279,7 +401,8 @@ class DocumentWriter(DocumentWriterCore):
                           hide_columns: Union[str, List[str], None] = None,
                           filter_by: Dict[str, Any] = None,
                           sort_by: Union[str, List[str], None] = None,
-                          label: str = None) -> 'DocumentWriter':
+                          label: str = None,
+                          engine: str = None) -> 'DocumentWriter':
         """Add colored table with automatic category detection and column highlighting.
         
         Args:
@@ -293,6 +416,9 @@ class DocumentWriter(DocumentWriterCore):
             filter_by: Dictionary to filter rows before rendering.
             sort_by: Column name(s) to sort by before rendering.
             label: Optional Quarto label for cross-referencing.
+            engine: 'image' or 'native'. Defaults to the writer's engine
+                   (see set_table_engine). With 'native', the gradient is
+                   shown in HTML and PDF output but not in DOCX.
             
         Returns:
             Self for method chaining.
@@ -300,7 +426,7 @@ class DocumentWriter(DocumentWriterCore):
         super().add_colored_table(df, title, show_figure,
                                   highlight_columns=highlight_columns, palette_name=palette_name,
                                   max_rows_per_table=max_rows_per_table, hide_columns=hide_columns,
-                                  filter_by=filter_by, sort_by=sort_by, label=label)
+                                  filter_by=filter_by, sort_by=sort_by, label=label, engine=engine)
         return self
     
     def add_equation(self, latex_code: str, caption: str = None, label: str = None) -> 'DocumentWriter':
@@ -621,21 +747,30 @@ class DocumentWriter(DocumentWriterCore):
     def generate(self, markdown: bool = False, html: bool = True, pdf: bool = True,
                 qmd: bool = True, tex: bool = False, docx: bool = False, 
                 output_filename: str = None, bibliography_path: str = None,
-                csl_path: str = None) -> Dict[str, Any]:
+                csl_path: str = None, force: bool = False,
+                render_workers: int = 1) -> Dict[str, Any]:
         """Generate output documents in specified formats.
         
+        Formats whose inputs are unchanged since the previous run are reused
+        from disk without invoking Quarto (see the ``.build.json`` manifest
+        written next to the QMD).
+        
         Args:
             markdown, html, pdf, qmd, tex, docx: Boolean flags for output formats.
             output_filename: Custom filename (without extension).
             bibliography_path: Path to .bib file.
             csl_path: Path to .csl style file.
+            force: If True, re-render every format even when nothing changed.
+            render_workers: Number of formats rendered at the same time, each in
+                its own Quarto process. 1 renders formats one after another.
             
         Returns:
             Dictionary mapping format names to generated file paths.
         """
         return super().generate(
             markdown=markdown, html=html, pdf=pdf, qmd=qmd, tex=tex, docx=docx,
-            output_filename=output_filename, bibliography_path=bibliography_path, csl_path=csl_path
+            output_filename=output_filename, bibliography_path=bibliography_path, csl_path=csl_path,
+            force=force, render_workers=render_workers
         )
         
 
@@ -0,0 +1,70 @@
+"""Concurrent format renders must not share a working directory.
+
+A stand-in renderer replaces Quarto: it records the directory it runs in,
+checks the document's assets are reachable from there and writes the
+output and a ``.quarto/`` folder the way Quarto would.
+"""
+
+import threading
+
+from ePy_docs.core._quarto import _source_document_dir, render_formats_concurrently
+
+
+def _make_document(tmp_path):
+    document_dir = tmp_path / 'report'
+    (document_dir / 'tables').mkdir(parents=True)
+    (document_dir / 'tables' / 'table_1.png').write_bytes(b'png')
+    (document_dir / 'styles.css').write_text('body {}', encoding='utf-8')
+    (document_dir / 'report.pdf').write_bytes(b'previous build')
+    qmd_path = document_dir / 'report.qmd'
+    qmd_path.write_text('---\ntitle: Report\n---\n\n![](tables/table_1.png)\n', encoding='utf-8')
+    return qmd_path
+
+
+def test_formats_render_from_separate_directories(tmp_path):
+    qmd_path = _make_document(tmp_path)
+    barrier = threading.Barrier(3)
+    seen = {}
+
+    def renderer(path, output_format=None, output_name=None, timeout=None):
+        barrier.wait(timeout=10)  # all three renders are in flight together
+        cwd = path.parent
+        seen[output_format] = (cwd, _source_document_dir(path))
+        assert (cwd / 'tables' / 'table_1.png').read_bytes() == b'png'
+        assert (cwd / 'styles.css').exists()
+        (cwd / '.quarto').mkdir(exist_ok=True)
+        output = path.with_name(output_name or path.with_suffix(f'.{output_format}').name)
+        output.write_text(output_format, encoding='utf-8')
+        return output
+
+    outcomes = render_formats_concurrently(qmd_path, ['html', 'pdf', 'docx'], renderer=renderer)
+
+    document_dir = qmd_path.parent
+    assert outcomes == {fmt: qmd_path.with_suffix(f'.{fmt}') for fmt in ('html', 'pdf', 'docx')}
+    for fmt in ('html', 'pdf', 'docx'):
+        assert qmd_path.with_suffix(f'.{fmt}').read_text(encoding='utf-8') == fmt
+
+    directories = [cwd for cwd, _ in seen.values()]
+    assert len(set(directories)) == 3
+    assert seen['html'][0] == document_dir
+    assert all(source == str(document_dir.resolve()) for _, source in seen.values())
+
+    # Working directories are removed and no symlink replaced the outputs
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['report']
+    assert not qmd_path.with_suffix('.pdf').is_symlink()
+    assert (document_dir / 'tables' / 'table_1.png').read_bytes() == b'png'
+
+
+def test_failed_format_is_reported_and_cleaned_up(tmp_path):
+    qmd_path = _make_document(tmp_path)
+
+    def renderer(path, output_format=None, output_name=None, timeout=None):
+        raise RuntimeError(f'{output_format} failed')
+
+    outcomes = render_formats_concurrently(qmd_path, ['pdf', 'docx'], renderer=renderer)
+
+    assert {fmt: str(outcome) for fmt, outcome in outcomes.items()} == {
+        'pdf': 'pdf failed', 'docx': 'docx failed'
+    }
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['report']
+    assert (qmd_path.with_suffix('.pdf')).read_bytes() == b'previous build'
@@ -0,0 +1,27 @@
+"""Import-time regression guard.
+
+`import ePy_docs` and creating a DocumentWriter must not load matplotlib,
+pandas or numpy (see ePy_docs.core._lazy). Each probe runs in a fresh
+interpreter, so modules imported by other tests do not interfere.
+"""
+
+from ePy_docs.core._lazy import benchmark_import
+
+
+# Loose ceiling: a lazy import takes tens of milliseconds, an eager
+# matplotlib/pandas import takes around a second
+MAX_IMPORT_SECONDS = 1.0
+
+
+def test_import_does_not_load_heavy_modules():
+    result = benchmark_import(runs=1)
+
+    assert result['after_import'] == []
+    assert result['after_writer'] == []
+    assert result['lazy']
+
+
+def test_import_time_within_limit():
+    result = benchmark_import(runs=3)
+
+    assert result['import_min'] < MAX_IMPORT_SECONDS
@@ -0,0 +1,64 @@
+"""End-to-end checks for the warm PDF render service (LocalRenderService).
+
+These need Quarto, the LaTeX engine and mylatexformat; they are skipped
+where any of them is missing. Each engine renders one document cold and one
+warm, and the warm render must use the precompiled format without falling
+back.
+"""
+
+import shutil
+import subprocess
+
+import pytest
+import yaml
+
+from ePy_docs.core._quarto import (
+    FORMAT_PARTIAL_NAME, LocalRenderService, SubprocessRenderService, _FORMAT_ENGINES
+)
+
+
+BODY = "# Warm render\n\nText with a [link](https://example.org) and $x^2$.\n"
+
+
+def _has_mylatexformat() -> bool:
+    if shutil.which('kpsewhich') is None:
+        return False
+    result = subprocess.run(['kpsewhich', 'mylatexformat.ltx'], capture_output=True, text=True)
+    return result.returncode == 0 and bool(result.stdout.strip())
+
+
+def _write_qmd(path, yaml_config):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"---\n{yaml.dump(yaml_config, sort_keys=False)}---\n\n{BODY}", encoding='utf-8')
+    return path
+
+
+@pytest.mark.integration
+@pytest.mark.slow
+@pytest.mark.parametrize('engine', sorted(_FORMAT_ENGINES))
+def test_warm_render_matches_cold_render(tmp_path, engine):
+    if shutil.which('quarto') is None or shutil.which(engine) is None:
+        pytest.skip(f"quarto and {engine} are required")
+    if shutil.which(_FORMAT_ENGINES[engine]) is None or not _has_mylatexformat():
+        pytest.skip("mylatexformat is required to build preamble formats")
+
+    def _config():
+        return {'title': 'Warm render', 'format': {'pdf': {
+            'pdf-engine': engine, 'documentclass': 'article', 'colorlinks': True,
+        }}}
+
+    cold_qmd = _write_qmd(tmp_path / 'cold' / 'doc.qmd', _config())
+    assert SubprocessRenderService().render(cold_qmd, output_format='pdf').is_file()
+
+    service = LocalRenderService(work_dir=tmp_path / 'render')
+    warm_config = _config()
+    service.prepare(warm_config, tmp_path / 'warm', 'classic', 'report')
+    assert FORMAT_PARTIAL_NAME in warm_config['format']['pdf']['template-partials']
+
+    warm_qmd = _write_qmd(tmp_path / 'warm' / 'doc.qmd', warm_config)
+    assert service.render(warm_qmd, output_format='pdf').is_file()
+
+    stats = service.stats()
+    assert stats['formats_built'] == 1
+    assert stats['warm_renders'] == 1
+    assert stats['fallbacks'] == 0